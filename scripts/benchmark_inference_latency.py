@@ -0,0 +1,68 @@
+"""
+Benchmark: single-row inference latency, DataFrame predict() vs. the
+predict_one() fast path, for XGBoostPredictor and MLPPredictor.
+
+Trains both models on synthetic data shaped like the dashboard's feature
+matrix and reports p50/p99/max latency over many single-row calls.
+
+    python scripts/benchmark_inference_latency.py [--features 40] [--calls 5000]
+"""
+import argparse
+import sys
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.mlp_predictor import MLPPredictor
+from src.xgboost_predictor import XGBoostPredictor
+
+def latencies(fn, calls: int) -> np.ndarray:
+    for _ in range(min(100, calls)):  # warm-up
+        fn()
+    timings = np.empty(calls)
+    for i in range(calls):
+        start = time.perf_counter()
+        fn()
+        timings[i] = time.perf_counter() - start
+    return timings * 1e6
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=730, help="Training rows")
+    parser.add_argument("--features", type=int, default=40, help="Feature columns")
+    parser.add_argument("--calls", type=int, default=5000, help="Timed single-row calls per path")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(args.rows, args.features)).astype(np.float32),
+                     columns=[f"f{i}" for i in range(args.features)],
+                     index=pd.date_range("2022-01-01", periods=args.rows))
+    y = pd.Series(X.iloc[:, :5].sum(axis=1).to_numpy() + rng.normal(0, 0.1, args.rows), index=X.index)
+
+    xgb_model = XGBoostPredictor()
+    xgb_model.train(X, y)
+    mlp_model = MLPPredictor(hidden_layer_sizes=(100, 50), dtype=np.float32)
+    mlp_model.train(X, y)
+
+    latest_frame = X.iloc[-1:]
+    latest_row = np.ascontiguousarray(X.to_numpy()[-1])
+
+    header = f"{'Path':<36}{'p50 us':>10}{'p99 us':>10}{'max us':>10}"
+    print(f"Single-row latency over {args.calls} calls ({args.features} features)\n")
+    print(header)
+    print("-" * len(header))
+    for name, fn in [("XGBoost predict(DataFrame)", lambda: xgb_model.predict(latest_frame)),
+                     ("XGBoost predict_one(ndarray)", lambda: xgb_model.predict_one(latest_row)),
+                     ("MLP predict(DataFrame)", lambda: mlp_model.predict(latest_frame)),
+                     ("MLP predict_one(ndarray)", lambda: mlp_model.predict_one(latest_row))]:
+        timings = latencies(fn, args.calls)
+        p50, p99 = np.percentile(timings, [50, 99])
+        print(f"{name:<36}{p50:>10.1f}{p99:>10.1f}{timings.max():>10.1f}")
+
+if __name__ == "__main__":
+    main()
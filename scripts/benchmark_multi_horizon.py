@@ -0,0 +1,91 @@
+"""
+Benchmark: one multi-horizon model vs. one regressor per horizon.
+
+Trains on ~2 years of synthetic daily bars (or a real symbol with --symbol)
+with the dashboard's technical features, and reports training time,
+prediction time and out-of-sample RMSE per horizon.
+
+    python scripts/benchmark_multi_horizon.py [--symbol BTC-USD] [--bars 730]
+"""
+import argparse
+import sys
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.feature_engineering import TechnicalIndicatorTransformer
+from src.multi_horizon import MultiHorizonPredictor, horizon_targets
+from src.xgboost_predictor import XGBoostPredictor
+
+HORIZONS = (1, 7, 30)
+
+def load_bars(symbol, bars: int) -> pd.DataFrame:
+    if symbol:
+        from datetime import datetime, timedelta
+        from src.data_provider import YahooFinanceProvider
+        end = datetime.now()
+        start = end - timedelta(days=bars)
+        return YahooFinanceProvider().fetch_history(symbol, start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d'))
+
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2020-01-01", periods=bars, freq="D")
+    close = 30000 * np.exp(np.cumsum(rng.normal(0.0005, 0.03, bars)))
+    volume = rng.lognormal(10, 0.5, bars)
+    return pd.DataFrame({"Close": close, "Volume": volume}, index=dates)
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+def rmse(pred: pd.Series, truth: pd.Series) -> float:
+    return float(np.sqrt(np.mean((pred.to_numpy() - truth.to_numpy()) ** 2)))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbol", type=str, default=None, help="Fetch a real symbol instead of synthetic bars")
+    parser.add_argument("--bars", type=int, default=730, help="Number of daily bars")
+    args = parser.parse_args()
+
+    bars = load_bars(args.symbol, args.bars)
+    features = TechnicalIndicatorTransformer(dtype=np.float32).transform(bars).dropna()
+    X = features[[c for c in features.columns if c not in ['Open', 'High', 'Low', 'Volume']]]
+    labels = horizon_targets(features['Close'], HORIZONS)
+
+    # Same rows for every model: those labelled for the longest horizon
+    n_valid = len(X) - max(HORIZONS)
+    split = int(n_valid * 0.8)
+    X_train, X_test = X.iloc[:split], X.iloc[split:n_valid]
+    y_train, y_test = labels.iloc[:split], labels.iloc[split:n_valid]
+    print(f"Rows: train={len(X_train)}, test={len(X_test)}, features={X.shape[1]}\n")
+
+    rows = []
+
+    # Baseline: one XGBoostPredictor per horizon
+    models = {h: XGBoostPredictor() for h in HORIZONS}
+    _, train_s = timed(lambda: [models[h].train(X_train, y_train[h]) for h in HORIZONS])
+    preds, predict_s = timed(lambda: pd.DataFrame({h: models[h].predict(X_test) for h in HORIZONS}))
+    rows.append(("per-horizon XGBoost", train_s, predict_s, preds))
+
+    for name, kwargs in [("multi-output XGBoost (multi_output_tree)", {}),
+                         ("multi-target XGBoost (one_output_per_tree)", {"multi_strategy": "one_output_per_tree"}),
+                         ("shared-trunk MLP", {"model": "mlp"})]:
+        predictor = MultiHorizonPredictor(HORIZONS, **kwargs)
+        _, train_s = timed(lambda: predictor.train(X_train, y_train))
+        preds, predict_s = timed(lambda: predictor.predict(X_test))
+        rows.append((name, train_s, predict_s, preds))
+
+    header = f"{'Model':<44}{'train s':>9}{'predict ms':>12}" + "".join(f"{f'RMSE {h}d':>12}" for h in HORIZONS)
+    print(header)
+    print("-" * len(header))
+    for name, train_s, predict_s, preds in rows:
+        errors = "".join(f"{rmse(preds[h], y_test[h]):>12.1f}" for h in HORIZONS)
+        print(f"{name:<44}{train_s:>9.2f}{predict_s * 1000:>12.1f}{errors}")
+
+if __name__ == "__main__":
+    main()
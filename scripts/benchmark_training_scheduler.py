@@ -0,0 +1,83 @@
+"""
+Benchmark: training the dashboard's per-horizon models.
+
+Compares three ways of training the 1d/7d/30d XGBoost models (regressor
+plus direction classifier) on the dashboard's feature matrix:
+  - sequential train()/train_classifier() per horizon,
+  - a process pool with one worker per horizon (each worker unpickles the
+    frame and quantizes it again),
+  - TrainingScheduler (in-process; horizons run concurrently, binning the
+    frame with one shared set of bin edges).
+
+    python scripts/benchmark_training_scheduler.py [--bars 730] [--repeat 3] [--threads N]
+"""
+import argparse
+import sys
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.feature_engineering import TechnicalIndicatorTransformer
+from src.training_scheduler import TrainingJob, TrainingScheduler
+from src.xgboost_predictor import XGBoostPredictor
+
+HORIZONS = (1, 7, 30)
+
+def make_jobs(bars: int):
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2020-01-01", periods=bars, freq="D")
+    close = 30000 * np.exp(np.cumsum(rng.normal(0.0005, 0.03, bars)))
+    features = TechnicalIndicatorTransformer(dtype=np.float32).transform(
+        pd.DataFrame({"Close": close}, index=dates)).dropna()
+    split = int((len(features) - max(HORIZONS)) * 0.8)
+    X = features.iloc[:split]
+    jobs = []
+    for h in HORIZONS:
+        y = features['Close'].shift(-h).iloc[:split]
+        jobs.append(TrainingJob(h, XGBoostPredictor(early_stopping_rounds=10), X, y,
+                                (y > features['Close'].iloc[:split]).astype(int)))
+    return jobs
+
+def train_one(job: TrainingJob):
+    job.predictor.train(job.X, job.y)
+    job.predictor.train_classifier(job.X, job.y_class)
+    return job.key, job.predictor
+
+def sequential(jobs):
+    return dict(train_one(job) for job in jobs)
+
+def process_pool(jobs):
+    with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+        return dict(pool.map(train_one, jobs))
+
+def best_of(fn, bars: int, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        jobs = make_jobs(bars)
+        start = time.perf_counter()
+        fn(jobs)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, default=730, help="Number of daily bars")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant (best is reported)")
+    parser.add_argument("--threads", type=int, default=None, help="Thread budget (default: CPU count)")
+    args = parser.parse_args()
+
+    print(f"{len(HORIZONS)} horizons, {args.bars} bars, thread budget {args.threads or os.cpu_count()}\n")
+    for name, fn in [("sequential train()", sequential),
+                     ("process pool, one worker per horizon", process_pool),
+                     ("TrainingScheduler (in-process threads)",
+                      lambda jobs: TrainingScheduler(max_threads=args.threads).run(jobs))]:
+        print(f"{name:<42}{best_of(fn, args.bars, args.repeat):>8.3f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple, Union
+from scipy import fft as sp_fft
+from .market_analyzer import _blocked_cumsum, _blocked_window_sum, CORR_BLOCK_ROWS
+from .market_memory import MarketMemory
+from .storage import StorageManager
+
+# Windows whose standard deviation is below this fraction of the series scale
+# are treated as flat and never returned as analogs
+_FLAT_RTOL = 1e-10
+
+class AnalogIndex:
+    """
+    Precomputed search state for one price series.
+
+    Holds the (mean-centered) values, their FFT at every transform size used
+    so far, and the rolling mean/std for every window length used so far, so
+    a repeated query only costs one FFT of the query and one inverse FFT.
+    """
+
+    def __init__(self, series: pd.Series):
+        series = series.dropna()
+        self.dates = pd.DatetimeIndex(series.index)
+        self.prices = series.to_numpy(dtype=np.float64)
+        self.values = self.prices - self.prices.mean() if len(self.prices) else self.prices
+        self._spectra: Dict[int, np.ndarray] = {}
+        self._stats: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def window_stats(self, m: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Mean and std of every length-m window, indexed by window start."""
+        if m not in self._stats:
+            block = max(CORR_BLOCK_ROWS, m)
+            n = len(self.values)
+            rows = self.values[None, :]
+            sums = []
+            for values in (rows, rows * rows):
+                csum, totals = _blocked_cumsum(values, block)
+                sums.append(_blocked_window_sum(csum, totals, block, m, np.empty_like(csum))[0, m - 1:n])
+            mean = sums[0] / m
+            std = np.sqrt(np.maximum(sums[1] / m - mean * mean, 0.0))
+            self._stats[m] = (mean, std)
+        return self._stats[m]
+
+    def distance_profile(self, query: np.ndarray) -> np.ndarray:
+        """
+        z-normalized Euclidean distance between `query` and every window of
+        the series (MASS): the sliding dot products come from one FFT
+        convolution, so the cost is O(n log n) for any query length.
+
+        Returns:
+            np.ndarray: Distances indexed by window start; NaN for flat windows.
+        """
+        m, n = len(query), len(self.values)
+        if m < 2 or m > n:
+            raise ValueError(f"Query length must be between 2 and {n}")
+        q_std = query.std()
+        if not q_std > 0:
+            raise ValueError("Query window is flat")
+
+        size = sp_fft.next_fast_len(n + m - 1, real=True)
+        if size not in self._spectra:
+            self._spectra[size] = sp_fft.rfft(self.values, size)
+        q = (query - query.mean()) / q_std
+        # Convolution with the reversed query gives the dot product of every window
+        dots = sp_fft.irfft(self._spectra[size] * sp_fft.rfft(q[::-1], size), size)[m - 1:n]
+
+        mean, std = self.window_stats(m)
+        flat = std <= _FLAT_RTOL * max(np.abs(self.values).max(), 1.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # q is standardized, so sum(q) = 0 and the window mean drops out
+            corr = np.clip(dots / (m * std), -1.0, 1.0)
+        dist = np.sqrt(2.0 * m * (1.0 - corr))
+        dist[flat] = np.nan
+        return dist
+
+class AnalogSearch:
+    """
+    "When did the market last look like this?"
+
+    Slides the latest z-normalized window of a symbol's price history over
+    the full history and returns the closest past analogs, each linked to the
+    MarketMemory events recorded around its date. Indexes are built once per
+    symbol (from the given frames or from StorageManager) and reused.
+    """
+
+    def __init__(self, storage: Optional[StorageManager] = None,
+                 memory: Optional[MarketMemory] = None, column: str = 'Close'):
+        """
+        Args:
+            storage: Source of stored history for symbols not added explicitly.
+            memory: MarketMemory whose events are attached to the analogs.
+            column: Price column searched.
+        """
+        self.storage = storage
+        self.memory = memory
+        self.column = column
+        self._indexes: Dict[str, AnalogIndex] = {}
+
+    def add(self, symbol: str, data: Union[pd.DataFrame, pd.Series, AnalogIndex]) -> AnalogIndex:
+        """Builds (or replaces) the index of `symbol` from its history, or registers a prebuilt one."""
+        if isinstance(data, AnalogIndex):
+            self._indexes[symbol] = data
+            return data
+        series = data[self.column] if isinstance(data, pd.DataFrame) else data
+        self._indexes[symbol] = AnalogIndex(series.sort_index())
+        return self._indexes[symbol]
+
+    def index(self, symbol: str) -> AnalogIndex:
+        """Index of `symbol`, loaded from storage on first use."""
+        if symbol not in self._indexes:
+            data = self.storage.load_data(symbol) if self.storage is not None else None
+            if data is None:
+                raise KeyError(f"No stored history for {symbol}")
+            self.add(symbol, data)
+        return self._indexes[symbol]
+
+    def search(self, symbol: str, window: int = 30, top_k: int = 5,
+               horizon: Optional[int] = None, query: Optional[np.ndarray] = None,
+               event_days: int = 3) -> pd.DataFrame:
+        """
+        Top-k historical analogs of a window.
+
+        Args:
+            symbol: Symbol whose history is searched.
+            window: Window length in bars (ignored when `query` is given).
+            top_k: Number of analogs returned.
+            horizon: If set, adds the return over the `horizon` bars after each analog.
+            query: Pattern to search for; defaults to the latest `window` bars,
+                   in which case windows overlapping it are excluded.
+            event_days: Events within this many days of an analog's end are attached.
+
+        Returns:
+            pd.DataFrame: One row per analog, closest first, with start, end,
+            distance, correlation, optional forward_return and events.
+        """
+        idx = self.index(symbol)
+        if query is None:
+            query = idx.prices[-window:]
+            latest = True
+        else:
+            query = np.asarray(query, dtype=np.float64)
+            latest = False
+        m = len(query)
+        dist = idx.distance_profile(query)
+        if latest:
+            # Trivial matches: windows overlapping the query itself
+            dist[max(0, len(idx) - 2 * m + 1):] = np.nan
+
+        starts = self._top_k(dist, top_k, exclusion=max(1, m // 2))
+        ends = starts + m - 1
+        result = pd.DataFrame({
+            'start': idx.dates[starts],
+            'end': idx.dates[ends],
+            'distance': dist[starts],
+            'correlation': 1.0 - dist[starts] ** 2 / (2.0 * m),
+        })
+        if horizon is not None:
+            ahead = ends + horizon
+            valid = ahead < len(idx)
+            forward = np.full(len(starts), np.nan)
+            forward[valid] = idx.prices[ahead[valid]] / idx.prices[ends[valid]] - 1
+            result['forward_return'] = forward
+        if self.memory is not None:
+            result['events'] = [self.events_near(date, event_days) for date in result['end']]
+        return result
+
+    def events_near(self, date: pd.Timestamp, days: int = 3) -> List[Dict]:
+        """MarketMemory events within `days` of `date`."""
+        if self.memory is None:
+            return []
+        start = (date - pd.Timedelta(days=days)).strftime('%Y-%m-%d')
+        end = (date + pd.Timedelta(days=days)).strftime('%Y-%m-%d')
+        return self.memory.get_events(start, end)
+
+    @staticmethod
+    def _top_k(dist: np.ndarray, top_k: int, exclusion: int) -> np.ndarray:
+        """Greedy top-k minima, skipping starts within `exclusion` of one already chosen."""
+        chosen: List[int] = []
+        for pos in np.argsort(dist, kind='stable'):
+            if len(chosen) == top_k or np.isnan(dist[pos]):
+                break
+            if all(abs(pos - c) >= exclusion for c in chosen):
+                chosen.append(int(pos))
+        return np.array(chosen, dtype=np.int64)
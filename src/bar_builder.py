@@ -0,0 +1,229 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional
+from .base import FeatureTransformer
+
+BAR_TYPES = ('volume', 'dollar', 'tick_imbalance', 'volume_imbalance')
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+class BarBuilder(FeatureTransformer):
+    """
+    Builds information-driven bars (volume, dollar and imbalance bars) from
+    fine-grained OHLCV rows or raw trade prints.
+
+    The output is a standard OHLCV frame indexed by the timestamp of the row
+    that closed each bar, so it can be fed straight into
+    TechnicalIndicatorTransformer.
+    """
+
+    def __init__(self, bar_type: str = 'volume', threshold: float = 1000.0):
+        """
+        Args:
+            bar_type: One of 'volume', 'dollar', 'tick_imbalance', 'volume_imbalance'.
+            threshold: Volume / dollar value per bar, or the absolute signed
+                       imbalance that closes an imbalance bar.
+        """
+        if bar_type not in BAR_TYPES:
+            raise ValueError(f"Unknown bar type '{bar_type}'. Expected one of {BAR_TYPES}")
+        if threshold <= 0:
+            raise ValueError("threshold must be positive")
+
+        self.bar_type = bar_type
+        self.threshold = float(threshold)
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Clears all streaming state (partial bar, carried cumulative sum, tick sign).
+        """
+        self._pending: Optional[Dict[str, np.ndarray]] = None
+        self._cum_offset = 0.0
+        self._last_price = np.nan
+        self._last_sign = 0.0
+
+    def transform(self, input_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Builds bars for a complete history in one shot.
+        The trailing partial bar is dropped; use update()/flush() to keep it.
+        """
+        self.reset()
+        bars = self.update(input_data)
+        self.reset()
+        return bars
+
+    def update(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Streaming mode: consumes the next chunk of rows and returns the bars
+        completed by it. Rows of the still-open bar are carried to the next call.
+        """
+        new_rows = self._extract(chunk)
+
+        if self._pending is not None:
+            rows = {k: np.concatenate([self._pending[k], new_rows[k]]) for k in new_rows}
+        else:
+            rows = new_rows
+
+        n = len(rows['close'])
+        if n == 0:
+            return self._empty_frame(chunk)
+
+        if self.bar_type in ('volume', 'dollar'):
+            ends = self._grid_bar_ends(rows)
+        else:
+            ends = self._imbalance_bar_ends(rows)
+
+        bars = self._aggregate(rows, ends)
+
+        # Carry the rows of the open bar over to the next chunk
+        tail_start = ends[-1] + 1 if len(ends) else 0
+        if self.bar_type in ('volume', 'dollar') and len(ends):
+            closed = self._weights(rows)[:tail_start].sum()
+            self._cum_offset = (self._cum_offset + closed) % self.threshold
+        self._pending = {k: v[tail_start:] for k, v in rows.items()} if tail_start < n else None
+
+        return bars
+
+    def flush(self) -> pd.DataFrame:
+        """
+        Returns the partial bar currently held in the streaming state (if any)
+        as a one-row OHLCV frame and clears it.
+        """
+        if self._pending is None:
+            return self._empty_frame(None)
+        rows = self._pending
+        bars = self._aggregate(rows, np.array([len(rows['close']) - 1]))
+        self._pending = None
+        self._cum_offset = 0.0
+        return bars
+
+    def _extract(self, chunk: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Pulls float arrays out of an OHLCV frame or a trade-print frame
+        (columns 'Price' and 'Volume'/'Size').
+        """
+        if 'Close' in chunk.columns:
+            close = chunk['Close'].to_numpy(dtype=np.float64)
+            open_ = chunk['Open'].to_numpy(dtype=np.float64) if 'Open' in chunk.columns else close
+            high = chunk['High'].to_numpy(dtype=np.float64) if 'High' in chunk.columns else close
+            low = chunk['Low'].to_numpy(dtype=np.float64) if 'Low' in chunk.columns else close
+        elif 'Price' in chunk.columns:
+            close = chunk['Price'].to_numpy(dtype=np.float64)
+            open_ = high = low = close
+        else:
+            raise ValueError("Input must have a 'Close' (OHLCV) or 'Price' (trade prints) column")
+
+        if 'Volume' in chunk.columns:
+            volume = chunk['Volume'].to_numpy(dtype=np.float64)
+        elif 'Size' in chunk.columns:
+            volume = chunk['Size'].to_numpy(dtype=np.float64)
+        elif self.bar_type == 'tick_imbalance':
+            volume = np.zeros(len(close))
+        else:
+            raise ValueError(f"'{self.bar_type}' bars need a 'Volume' or 'Size' column")
+
+        rows = {
+            'time': chunk.index.to_numpy(),
+            'open': open_,
+            'high': high,
+            'low': low,
+            'close': close,
+            'volume': volume,
+        }
+        if self.bar_type in ('tick_imbalance', 'volume_imbalance'):
+            rows['sign'] = self._tick_signs(close)
+        return rows
+
+    def _tick_signs(self, close: np.ndarray) -> np.ndarray:
+        """
+        Tick rule: +1 on an up-tick, -1 on a down-tick, previous sign when unchanged.
+        The last price and sign are carried across chunks.
+        """
+        if len(close) == 0:
+            return np.empty(0)
+        prev = np.concatenate([[self._last_price], close[:-1]])
+        sign = np.nan_to_num(np.sign(close - prev))
+
+        # Forward fill zero ticks with the last non-zero sign
+        idx = np.where(sign != 0, np.arange(len(sign)), -1)
+        np.maximum.accumulate(idx, out=idx)
+        signs = np.where(idx >= 0, sign[idx], self._last_sign)
+
+        self._last_price = close[-1]
+        self._last_sign = signs[-1]
+        return signs
+
+    def _weights(self, rows: Dict[str, np.ndarray]) -> np.ndarray:
+        if self.bar_type == 'dollar':
+            return rows['close'] * rows['volume']
+        if self.bar_type == 'tick_imbalance':
+            return rows['sign']
+        if self.bar_type == 'volume_imbalance':
+            return rows['sign'] * rows['volume']
+        return rows['volume']
+
+    def _grid_bar_ends(self, rows: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Volume / dollar bars: a bar closes on every row where the cumulative sum
+        crosses a multiple of the threshold. Fully vectorized; because the grid
+        is fixed, a single oversized print closes one bar and the next bar
+        closes at the following grid line.
+        """
+        cum = self._cum_offset + np.cumsum(self._weights(rows))
+        bucket = np.floor(cum / self.threshold)
+        prev_bucket = np.concatenate([[np.floor(self._cum_offset / self.threshold)], bucket[:-1]])
+        return np.flatnonzero(bucket > prev_bucket)
+
+    def _imbalance_bar_ends(self, rows: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Imbalance bars: a bar closes when the signed imbalance accumulated since
+        the bar opened reaches the threshold in absolute value. The scan steps
+        from bar to bar; the search inside each bar runs on NumPy blocks.
+        """
+        cum = np.cumsum(self._weights(rows))
+        n = len(cum)
+        ends = []
+        start = 0
+        block = 64
+        while start < n:
+            base = cum[start - 1] if start > 0 else 0.0
+            found = -1
+            stop = start
+            while stop < n:
+                stop = min(n, stop + block)
+                hits = np.abs(cum[start:stop] - base) >= self.threshold
+                if hits.any():
+                    found = start + int(hits.argmax())
+                    break
+                block *= 2
+            if found < 0:
+                break
+            ends.append(found)
+            # Bars are usually similar in length, size the next search accordingly
+            block = max(64, 2 * (found - start + 1))
+            start = found + 1
+        return np.asarray(ends, dtype=np.int64)
+
+    def _aggregate(self, rows: Dict[str, np.ndarray], ends: np.ndarray) -> pd.DataFrame:
+        if len(ends) == 0:
+            return self._empty_frame(None, rows['time'])
+        last = ends[-1] + 1
+        starts = np.concatenate([[0], ends[:-1] + 1])
+
+        bars = pd.DataFrame({
+            'Open': rows['open'][starts],
+            'High': np.maximum.reduceat(rows['high'][:last], starts),
+            'Low': np.minimum.reduceat(rows['low'][:last], starts),
+            'Close': rows['close'][ends],
+            'Volume': np.add.reduceat(rows['volume'][:last], starts),
+        }, index=pd.Index(rows['time'][ends]))
+        return bars
+
+    def _empty_frame(self, chunk: Optional[pd.DataFrame], times: Optional[np.ndarray] = None) -> pd.DataFrame:
+        if chunk is not None:
+            index = chunk.index[:0]
+        elif times is not None:
+            index = pd.Index(times[:0])
+        else:
+            index = pd.DatetimeIndex([])
+        return pd.DataFrame({c: np.empty(0) for c in OHLCV_COLUMNS}, index=index)
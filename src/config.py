@@ -30,6 +30,15 @@ SYMBOL_MAP = {
     "ADA-USD": "ADA/USDT"
 }
 
+def enable_copy_on_write() -> None:
+    """
+    Opts pandas 2.x into Copy-on-Write so selections and transformer outputs
+    share buffers with their inputs until written (always on from pandas 3.0).
+    """
+    import pandas as pd
+    if int(pd.__version__.split('.')[0]) < 3:
+        pd.set_option('mode.copy_on_write', True)
+
 # Default training timeframe
 DEFAULT_TRAINING_DAYS = 730 # 2 Years
 
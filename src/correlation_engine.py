@@ -0,0 +1,168 @@
+import hashlib
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Union
+from scipy.cluster.hierarchy import leaves_list, linkage
+from scipy.spatial.distance import squareform
+from sklearn.covariance import ledoit_wolf_shrinkage
+
+# Overlap variances below this fraction of the sum of squares count as constant
+# (float32 accumulation error, the worst case, is ~1e-7 * sqrt(n))
+_VAR_RTOL = 1e-5
+
+class CorrelationEngine:
+    """
+    Correlation matrices for large universes (1,000+ assets).
+
+    Columns are standardized once and stored in `dtype` (float64 by default,
+    matching DataFrame.corr; float32 halves memory and GEMM time at ~1e-6
+    precision); the matrix is then assembled from column-block GEMMs.
+    Missing values are handled pairwise (like DataFrame.corr) through GEMMs
+    of the presence masks, with optional
+    Ledoit-Wolf shrinkage toward the identity. Results are cached by the
+    content of the data window, and cluster_order() gives a hierarchical
+    clustering order for readable heatmaps.
+    """
+
+    def __init__(self, block_size: int = 512, dtype=np.float64,
+                 shrinkage: Union[None, str, float] = None, cache_size: int = 8):
+        """
+        Args:
+            block_size: Columns per GEMM block.
+            dtype: Storage/GEMM dtype of the standardized data (np.float32 to trade precision for speed).
+            shrinkage: None, 'ledoit_wolf', or a fixed intensity in [0, 1].
+            cache_size: Number of matrices kept in the in-memory cache.
+        """
+        if isinstance(shrinkage, str) and shrinkage != 'ledoit_wolf':
+            raise ValueError(f"Unknown shrinkage '{shrinkage}'")
+        self.block_size = block_size
+        self.dtype = dtype
+        self.shrinkage = shrinkage
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def correlation_matrix(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Pearson correlation matrix of the numeric columns of `df`.
+
+        Returns:
+            pd.DataFrame: Symmetric matrix; NaN where a pair has fewer than two
+            common observations or a column is constant over the overlap.
+            A copy, so callers may modify it without touching the cache.
+        """
+        df = df.select_dtypes(include='number')
+        key = self._key(df)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return self._cache[key].copy()
+
+        self.misses += 1
+        corr = self._compute(df.to_numpy(dtype=np.float64))
+        result = pd.DataFrame(corr, index=df.columns, columns=df.columns)
+
+        self._cache[key] = result
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result.copy()
+
+    def cluster_order(self, corr: pd.DataFrame) -> List[int]:
+        """
+        Positions of the columns in hierarchical-clustering (average linkage)
+        leaf order, using the distance sqrt((1 - corr) / 2).
+        """
+        k = len(corr)
+        if k < 3:
+            return list(range(k))
+        values = np.nan_to_num(corr.to_numpy(dtype=np.float64), nan=0.0)
+        distance = np.sqrt(np.clip((1.0 - values) / 2.0, 0.0, 1.0))
+        np.fill_diagonal(distance, 0.0)
+        distance = (distance + distance.T) / 2.0
+        return leaves_list(linkage(squareform(distance, checks=False), method='average')).tolist()
+
+    def clustered_matrix(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Correlation matrix with rows and columns in cluster order."""
+        corr = self.correlation_matrix(df)
+        order = self.cluster_order(corr)
+        return corr.iloc[order, order]
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def _key(self, df: pd.DataFrame) -> str:
+        digest = hashlib.sha1()
+        digest.update(repr((list(df.columns), self.shrinkage, np.dtype(self.dtype).name)).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def _compute(self, values: np.ndarray) -> np.ndarray:
+        n, k = values.shape
+        present = ~np.isnan(values)
+        pairwise = not present.all()
+
+        # Standardize each column over its own observations, gaps become 0
+        counts = np.maximum(present.sum(axis=0), 1)
+        z = np.where(present, values, 0.0)
+        z -= z.sum(axis=0) / counts
+        z[~present] = 0.0
+        scale = np.sqrt((z * z).sum(axis=0) / counts)
+        z /= np.where(scale > 0, scale, 1.0)
+        z = z.astype(self.dtype)
+        mask = present.astype(self.dtype) if pairwise else None
+        del values, present
+
+        corr = np.empty((k, k), dtype=np.float64)
+        b = self.block_size
+        for i in range(0, k, b):
+            for j in range(i, k, b):
+                block = self._block(z, mask, slice(i, i + b), slice(j, j + b), n)
+                corr[i:i + b, j:j + b] = block
+                corr[j:j + b, i:i + b] = block.T
+
+        defined = np.diag(corr) == np.diag(corr)
+        corr[np.diag_indices(k)] = np.where(defined, 1.0, np.nan)
+
+        intensity = self._shrinkage_intensity(z)
+        if intensity > 0:
+            corr *= 1.0 - intensity
+            corr[np.diag_indices(k)] += intensity
+        return corr
+
+    def _block(self, z: np.ndarray, mask: Optional[np.ndarray], rows: slice, cols: slice, n: int) -> np.ndarray:
+        zi, zj = z[:, rows], z[:, cols]
+        sij = (zi.T @ zj).astype(np.float64)
+        if mask is None:
+            # Complete data: standardized columns, so the cross product is the correlation
+            with np.errstate(invalid='ignore'):
+                norm = np.sqrt(np.einsum('ij,ij->j', zi, zi, dtype=np.float64))[:, None] * \
+                       np.sqrt(np.einsum('ij,ij->j', zj, zj, dtype=np.float64))[None, :]
+                block = sij / norm
+            block[~(norm > 0)] = np.nan
+            return np.clip(block, -1.0, 1.0)
+
+        # Pairwise-complete moments from GEMMs of values, squares and masks
+        mi, mj = mask[:, rows], mask[:, cols]
+        count = (mi.T @ mj).astype(np.float64)
+        si = (zi.T @ mj).astype(np.float64)
+        sj = (mi.T @ zj).astype(np.float64)
+        sii = ((zi * zi).T @ mj).astype(np.float64)
+        sjj = (mi.T @ (zj * zj)).astype(np.float64)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = sij - si * sj / count
+            var_i = sii - si * si / count
+            var_j = sjj - sj * sj / count
+            block = cov / np.sqrt(var_i * var_j)
+        block[(count < 2) | (var_i <= _VAR_RTOL * sii) | (var_j <= _VAR_RTOL * sjj)] = np.nan
+        return np.clip(block, -1.0, 1.0)
+
+    def _shrinkage_intensity(self, z: np.ndarray) -> float:
+        if self.shrinkage is None:
+            return 0.0
+        if self.shrinkage == 'ledoit_wolf':
+            # Estimated on the standardized data with gaps at the column mean
+            return float(ledoit_wolf_shrinkage(z, assume_centered=True, block_size=self.block_size))
+        return float(self.shrinkage)
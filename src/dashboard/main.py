@@ -14,6 +14,7 @@ from src.exchange import ExchangeProvider
 from src.execution import OKXExecutor
 from src.data_merger import DataMerger
 from src.feature_engineering import TechnicalIndicatorTransformer
+from src.feature_store import FeatureStore
 from src.market_analyzer import CorrelationTransformer
 from src.xgboost_predictor import XGBoostPredictor
 from src.mlp_predictor import MLPPredictor
@@ -21,7 +22,14 @@ from src.backtesting import Backtester, PerformanceMetrics
 from src.dashboard.layout import render_sidebar, render_metrics
 from src.dashboard.plots import create_price_chart, create_equity_curve, create_feature_importance_chart
 
-from src.config import MACRO_SYMBOLS, SYMBOL_MAP, DEFAULT_TRAINING_DAYS
+from src.macro_cache import get_macro_cache
+from src.model_registry import ModelRegistry
+from src.training_scheduler import TrainingJob, TrainingScheduler
+from src.precision import DEFAULT_POLICY
+
+from src.config import SYMBOL_MAP, DEFAULT_TRAINING_DAYS, enable_copy_on_write
+
+enable_copy_on_write()
 
 def run_dashboard():
     # Inner import to be absolutely safe against scope issues
@@ -60,7 +68,9 @@ def run_dashboard():
                     provider = YahooFinanceProvider()
                     target_symbol = config['symbol']
                 
-                merger = DataMerger()
+                # Features are stored in float32; indicator math still runs in float64
+                feature_dtype = DEFAULT_POLICY.feature_dtype
+                merger = DataMerger(dtype=feature_dtype)
                 
                 end_date = datetime.now().strftime('%Y-%m-%d')
                 start_date = (datetime.now() - timedelta(days=DEFAULT_TRAINING_DAYS)).strftime('%Y-%m-%d')
@@ -69,30 +79,19 @@ def run_dashboard():
                 df_target = provider.fetch_history(target_symbol, start=start_date, end=end_date)
                 
                 # Fetch Macros (Only for Yahoo mode usually)
-                macro_data = {}
                 if "Yahoo" in config['data_source']:
-                    for name, ticker in MACRO_SYMBOLS.items():
-                        try:
-                            # Use a separate provider for macros if needed, but same one works for Yahoo
-                            # Note: If provider is OKX, using it to fetch Yahoo ticker will fail.
-                            # So even if main source is OKX, macros might need Yahoo provider.
-                            # BUT, mixing synchronous/async or different libraries might be tricky.
-                            # user instruction was to add macros. For now let's assume if OKX is main source, 
-                            # we skip macros OR we need to instantiate a Yahoo provider purely for macros.
-                            # Let's instantiate a dedicated macro provider to be safe.
-                            macro_provider = YahooFinanceProvider()
-                            macro_data[name] = macro_provider.fetch_history(ticker, start=start_date, end=end_date)
-                        except:
-                            pass
-                
-                df_merged = merger.merge(df_target, macro_data)
+                    macro_panel = get_macro_cache("./data").get_panel(start_date, end_date)
+                    df_merged = merger.merge_panel(df_target, macro_panel)
+                else:
+                    df_merged = df_target
                 
                 # 2. Features
-                tech_transformer = TechnicalIndicatorTransformer()
-                df_features = tech_transformer.transform(df_merged)
+                feature_store = FeatureStore("./data/feature_store")
+                tech_transformer = TechnicalIndicatorTransformer(dtype=feature_dtype)
+                df_features = feature_store.get_or_compute(tech_transformer, df_merged)
                 
-                corr_transformer = CorrelationTransformer()
-                df_features = corr_transformer.transform(df_features, target_col='Close', window=config['window_size'])
+                corr_transformer = CorrelationTransformer(dtype=feature_dtype)
+                df_features = feature_store.get_or_compute(corr_transformer, df_features, target_col='Close', window=config['window_size'])
                 df_features.dropna(inplace=True)
                 
                 # 3. Model Loop (Multi-Horizon)
@@ -110,56 +109,74 @@ def run_dashboard():
                 progress_bar = st.progress(0)
                 status_text = st.empty()
                 
-                total_steps = len(horizons)
-                current_step = 0
-                
                 predictor = None # Keep reference for feature importance
+                # Models already trained on the same data/features/params are reused
+                registry = ModelRegistry("./data/models")
+                
+                # One feature frame shared read-only by every horizon; each horizon
+                # only slices it (views under copy-on-write) and builds its targets
+                feature_cols = [c for c in df_features.columns if c not in ['Open', 'High', 'Low', 'Volume']]
+                X_all = df_features[feature_cols]
+                close = df_features['Close']
+                # All horizons train on the same rows (those labelled for the longest
+                # horizon), so one quantized XGBoost matrix serves every model
+                split_idx = int((len(df_features) - max(horizons.values())) * 0.8)
+                train_X = X_all.iloc[:split_idx]
                 
+                # Pass 1: targets per horizon; stored models are loaded, the rest become jobs
+                predictors, jobs = {}, []
                 for h_name, h_days in horizons.items():
-                    status_text.text(f"Training models for {h_name} horizon...")
-                    
-                    # Prepare Target
-                    # Shift -N means we predict price N days in future
-                    df_run = df_features.copy()
-                    df_run['Target_Price'] = df_run['Close'].shift(-h_days)
+                    # Shift -N means we predict price N days in future; the last N rows have no target
+                    target_price = close.shift(-h_days).iloc[:split_idx]
                     # Target Class: 1 if Price(t+N) > Price(t), else 0
-                    df_run['Target_Class'] = (df_run['Target_Price'] > df_run['Close']).astype(int)
-                    
-                    working_df = df_run.dropna().copy()
+                    target_class = (target_price > close.iloc[:split_idx]).astype(int)
                     
-                    # Split
-                    split_idx = int(len(working_df) * 0.8)
-                    train_df = working_df.iloc[:split_idx]
-                    test_df = working_df.iloc[split_idx:]
+                    if config['model_type'] == "MLP":
+                        # MLP doesn't have train_classifier yet in base code, skip proba for MLP
+                        predictor_h = MLPPredictor(hidden_layer_sizes=(100, 50), dtype=feature_dtype)
+                        target_class = None
+                    else:
+                        # Boosting stops once the tail holdout of the training window stops improving
+                        predictor_h = XGBoostPredictor(early_stopping_rounds=10)
+                        # Optimization (Only do it for 1 Day to save time, or if user really wants valid hyperparameters for all)
+                        # if config['enable_optimization'] and h_days == 1: ...
                     
-                    feature_cols = [c for c in working_df.columns if c not in ['Target_Price', 'Target_Class', 'Open', 'High', 'Low', 'Volume']]
+                    predictors[h_name] = predictor_h
+                    if not registry.load(predictor_h, target_symbol, h_days, train_X):
+                        jobs.append(TrainingJob(h_name, predictor_h, train_X, target_price, target_class))
+                
+                # Pass 2: train the missing models in-process within the core budget;
+                # XGBoost horizons run concurrently on one set of quantized bin edges
+                def report(done, total, h_name):
+                    progress_bar.progress(done / total)
+                    status_text.text(f"Trained {h_name} model ({done}/{total})...")
+                
+                if jobs:
+                    status_text.text(f"Training {len(jobs)} models...")
+                    trained = TrainingScheduler().run(jobs, progress=report)
+                    for h_name, predictor_h in trained.items():
+                        predictors[h_name] = predictor_h
+                        registry.save(predictor_h, target_symbol, horizons[h_name], train_X)
+                progress_bar.progress(1.0)
+                
+                # Pass 3: out-of-sample predictions per horizon
+                for h_name, h_days in horizons.items():
+                    predictor_h = predictors[h_name]
+                    n_valid = len(df_features) - h_days
+                    test_X = X_all.iloc[split_idx:n_valid]
+                    test_df = df_features.iloc[split_idx:n_valid]
                     
-                    # Initialize Predictor
+                    preds = predictor_h.predict(test_X)
                     if config['model_type'] == "MLP":
-                        pass # MLP update pending for classifier
-                        # For now fallback to XGB for advanced features or just do regression
-                        predictor_h = MLPPredictor(hidden_layer_sizes=(100, 50))
-                         # MLP doesn't have train_classifier yet in base code, skip proba for MLP
-                        predictor_h.train(train_df[feature_cols], train_df['Target_Price'])
-                        preds = predictor_h.predict(test_df[feature_cols])
                         prob = 0.5 # Placeholder
-                        
                     else:
-                        predictor_h = XGBoostPredictor()
-                        # Optimization (Only do it for 1 Day to save time, or if user really wants valid hyperparameters for all)
-                        # if config['enable_optimization'] and h_days == 1: ...
-                        
-                        predictor_h.train(train_df[feature_cols], train_df['Target_Price'])
-                        predictor_h.train_classifier(train_df[feature_cols], train_df['Target_Class'])
-                        
-                        preds = predictor_h.predict(test_df[feature_cols])
-                        probs = predictor_h.predict_proba(test_df[feature_cols])
+                        probs = predictor_h.predict_proba(test_X)
                         prob = probs.iloc[-1]
                         
                         # Store for explanation (use 1 Day importance usually)
                         if h_days == 1:
                             predictor = predictor_h
-                            latest_features = test_df[feature_cols].iloc[-1]
+                            latest_features = test_X.iloc[-1]
                             last_feature_importance = predictor_h.get_feature_importance()
                             
                     latest_pred = preds.iloc[-1]
@@ -174,9 +191,6 @@ def run_dashboard():
                         "Rise Prob": prob
                     })
                     
-                    current_step += 1
-                    progress_bar.progress(current_step / total_steps)
-                    
                 status_text.text("Analysis Complete.")
                 time.sleep(0.5)
                 status_text.empty()
@@ -1,49 +1,191 @@
+import numpy as np
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
+
+Lag = Union[str, pd.Timedelta]
+
+def _to_ns(index: pd.Index) -> np.ndarray:
+    """Int64 nanosecond timestamps of a DatetimeIndex (UTC for tz-aware indexes)."""
+    return pd.DatetimeIndex(index).as_unit('ns').asi8
+
+def _lag_ns(lag: Optional[Lag]) -> int:
+    return 0 if lag is None else pd.Timedelta(lag).as_unit('ns').value
+
+class AsofPanel:
+    """
+    Macro panel prepared for repeated as-of lookups.
+
+    Holds, for every column, the sorted observation timestamps (int64 ns) and
+    values with missing rows removed. Build it once per panel and pass it to
+    DataMerger.merge_asof for every target so the sort/dropna work is not
+    repeated.
+    """
+
+    def __init__(self, panel: pd.DataFrame):
+        panel = panel.sort_index()
+        index = pd.DatetimeIndex(panel.index)
+        self.tz = index.tz
+        self.columns = list(panel.columns)
+        times = _to_ns(index)
+
+        self.series: Dict[str, tuple] = {}
+        for name in self.columns:
+            values = panel[name].to_numpy(dtype=np.float64)
+            valid = ~np.isnan(values)
+            self.series[name] = (times[valid], values[valid])
 
 class DataMerger:
     """
     Aligns and merges multiple time series DataFrames.
     """
-    
-    def merge(self, 
-              target_data: pd.DataFrame, 
-              macro_data_dict: Dict[str, pd.DataFrame], 
+
+    def __init__(self, dtype=np.float64):
+        """
+        Args:
+            dtype: Storage dtype of the merged macro columns (e.g. np.float32).
+        """
+        self.dtype = dtype
+
+    def merge(self,
+              target_data: pd.DataFrame,
+              macro_data_dict: Dict[str, pd.DataFrame],
               method: str = 'ffill') -> pd.DataFrame:
         """
         Merges macro data into the target asset's DataFrame.
-        
+
         Args:
             target_data: The main asset DataFrame (e.g., BTC). Index must be DatetimeIndex.
             macro_data_dict: Dictionary mapping names (e.g., 'Gold') to DataFrames.
             method: 'ffill' (forward fill) recommended to avoid look-ahead bias.
-            
+                    'asof' uses merge_asof semantics (see merge_asof for lags/tolerance).
+
         Returns:
             pd.DataFrame: Merged DataFrame with macro columns prefixed.
         """
-        merged_df = target_data.copy()
-        
+        panel = self.build_panel(macro_data_dict)
+        if method == 'asof':
+            return self.merge_asof(target_data, panel)
+        return self.merge_panel(target_data, panel, method=method)
+
+    def build_panel(self, macro_data_dict: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatenates the close series of every macro input into one aligned panel.
+
+        The panel index is the union of all macro dates; values are left as-is
+        (no filling), so the panel can be cached and re-used for any target.
+        """
+        series_list = []
         for name, df in macro_data_dict.items():
-            # Ensure we only use 'Close' price for macro indicators usually
-            # If df has 'Close', use it. Otherwise assume it's a Series or single-col DF
-            if isinstance(df, pd.DataFrame) and 'Close' in df.columns:
-                series = df['Close']
-            elif isinstance(df, pd.DataFrame) and len(df.columns) == 1:
-                series = df.iloc[:, 0]
-            elif isinstance(df, pd.Series):
-                series = df
-            else:
-                raise ValueError(f"Cannot extract data from {name}")
-                
-            # Rename series
-            series.name = name
-            
-            # Merge logic: Left join on target index
-            # This ensures we only keep rows where the target asset traded.
-            merged_df = merged_df.join(series, how='left')
-            
-            # Forward fill missing values (e.g., macro data missing on weekends/holidays)
-            if method == 'ffill':
-                merged_df[name] = merged_df[name].ffill()
-                
-        return merged_df
+            series = self._extract_series(name, df)
+            # Duplicate timestamps would break the aligned concat, keep the latest print
+            if series.index.has_duplicates:
+                series = series[~series.index.duplicated(keep='last')]
+            series_list.append(series.rename(name))
+
+        if not series_list:
+            return pd.DataFrame()
+
+        # Single outer alignment for all macros at once
+        return pd.concat(series_list, axis=1, sort=True)
+
+    def merge_panel(self,
+                    target_data: pd.DataFrame,
+                    panel: pd.DataFrame,
+                    method: str = 'ffill') -> pd.DataFrame:
+        """
+        Attaches an aligned macro panel to the target in a single pass.
+
+        The panel is reindexed once onto the target index, forward filled across
+        all columns together and attached with one concat, so the cost stays flat
+        as the number of macro series grows.
+        """
+        if panel.empty:
+            return target_data
+
+        # Left join semantics: only keep rows where the target asset traded
+        aligned = panel.reindex(target_data.index)
+
+        # Forward fill missing values (e.g., macro data missing on weekends/holidays)
+        if method == 'ffill':
+            aligned = aligned.ffill()
+        if (aligned.dtypes != self.dtype).any():
+            aligned = aligned.astype(self.dtype)
+
+        return pd.concat([target_data, aligned], axis=1)
+
+    def prepare_asof(self, macros: Union[pd.DataFrame, Dict[str, pd.DataFrame]]) -> AsofPanel:
+        """
+        Builds a reusable AsofPanel from a macro panel or a dict of macro frames.
+        """
+        if isinstance(macros, dict):
+            macros = self.build_panel(macros)
+        return AsofPanel(macros)
+
+    def merge_asof(self,
+                   target_data: pd.DataFrame,
+                   macros: Union[AsofPanel, pd.DataFrame, Dict[str, pd.DataFrame]],
+                   lags: Optional[Dict[str, Lag]] = None,
+                   tolerance: Optional[Union[Lag, Dict[str, Lag]]] = None,
+                   default_lag: Optional[Lag] = None) -> pd.DataFrame:
+        """
+        As-of join of macro series onto the target (merge_asof, direction='backward').
+
+        Each macro observation stamped at time t only becomes visible at
+        t + lag, so a daily close stamped at midnight can be delayed to the
+        next session (e.g. lags={'Gold': '1D'}) when merging intraday targets.
+        Values older than `tolerance` at a target timestamp become NaN instead
+        of being carried forward indefinitely.
+
+        Args:
+            target_data: Target asset DataFrame with a DatetimeIndex.
+            macros: AsofPanel (preferred for repeated calls), panel DataFrame or dict of frames.
+            lags: Per-series publication lag, e.g. {'TNX': '1D'}.
+            tolerance: Maximum staleness, either one value for all series or a per-series dict.
+            default_lag: Lag for series not listed in `lags` (default: none).
+
+        Returns:
+            pd.DataFrame: Target data with one column per macro series.
+        """
+        if not isinstance(macros, AsofPanel):
+            macros = self.prepare_asof(macros)
+
+        target_index = pd.DatetimeIndex(target_data.index)
+        if (target_index.tz is None) != (macros.tz is None):
+            raise ValueError("Target and macro indexes must both be tz-naive or both tz-aware")
+
+        lags = lags or {}
+        target_ns = _to_ns(target_index)
+        out = np.full((len(target_ns), len(macros.columns)), np.nan)
+
+        for j, name in enumerate(macros.columns):
+            times, values = macros.series[name]
+            if len(times) == 0:
+                continue
+
+            available = times + _lag_ns(lags.get(name, default_lag))
+            pos = np.searchsorted(available, target_ns, side='right') - 1
+            found = pos >= 0
+            pos = np.where(found, pos, 0)
+
+            col = np.where(found, values[pos], np.nan)
+            tol = tolerance.get(name) if isinstance(tolerance, dict) else tolerance
+            if tol is not None:
+                stale = (target_ns - available[pos]) > _lag_ns(tol)
+                col[stale] = np.nan
+            out[:, j] = col
+
+        aligned = pd.DataFrame(out.astype(self.dtype, copy=False), index=target_data.index,
+                               columns=macros.columns, copy=False)
+        return pd.concat([target_data, aligned], axis=1)
+
+    def _extract_series(self, name: str, df) -> pd.Series:
+        # Ensure we only use 'Close' price for macro indicators usually
+        # If df has 'Close', use it. Otherwise assume it's a Series or single-col DF
+        if isinstance(df, pd.DataFrame) and 'Close' in df.columns:
+            return df['Close']
+        elif isinstance(df, pd.DataFrame) and len(df.columns) == 1:
+            return df.iloc[:, 0]
+        elif isinstance(df, pd.Series):
+            return df
+        else:
+            raise ValueError(f"Cannot extract data from {name}")
@@ -1,40 +1,276 @@
+import numpy as np
 import pandas as pd
+from typing import List, Optional, Sequence, Union
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
 from .base import FeatureTransformer
 
+# Columns produced by TechnicalIndicatorTransformer, in output order
+INDICATOR_COLUMNS = ['SMA_20', 'SMA_50', 'EMA_12', 'EMA_26', 'MACD', 'MACD_Signal', 'RSI']
+
+def window_diff(csum: np.ndarray, window: int, out: np.ndarray) -> np.ndarray:
+    """Turns a cumulative sum into trailing window sums (first window-1 rows NaN)."""
+    out[:window - 1] = np.nan
+    if len(csum) >= window:
+        out[window - 1] = csum[window - 1]
+        np.subtract(csum[window:], csum[:-window], out=out[window:])
+    return out
+
+def rolling_sum(x: np.ndarray, window: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Trailing window sum along axis 0 from one cumulative sum.
+    The first window-1 rows are NaN (same as pandas rolling with min_periods=window).
+    """
+    if out is None:
+        out = np.empty(x.shape, dtype=np.float64)
+    return window_diff(np.cumsum(x, axis=0), window, out)
+
+def rolling_mean(x: np.ndarray, window: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Trailing simple moving average along axis 0 (cumsum based).
+    Values are shifted by the first row before summing to keep the cumulative
+    sum small on long histories.
+    """
+    if out is None:
+        out = np.empty(x.shape, dtype=np.float64)
+    base = x[:1]
+    csum = np.subtract(x, base)
+    np.cumsum(csum, axis=0, out=csum)
+    window_diff(csum, window, out)
+    out /= window
+    out += base
+    return out
+
+def ema(x: np.ndarray, span: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Exponential moving average along axis 0, identical to pandas ewm(span, adjust=False).
+    The recursion runs in compiled code (IIR filter) seeded with the first row.
+    """
+    if len(x) == 0:
+        return np.empty(x.shape, dtype=np.float64) if out is None else out
+    alpha = 2.0 / (span + 1.0)
+    zi = (1.0 - alpha) * x[:1]
+    result, _ = lfilter([alpha], [1.0, alpha - 1.0], x, axis=0, zi=zi)
+    if out is None:
+        return result
+    out[...] = result
+    return out
+
+def rsi(x: np.ndarray, window: int = 14, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    RSI from rolling average gains/losses, matching the pandas implementation
+    (the first, undefined change counts as zero). Works in two scratch buffers.
+    """
+    if out is None:
+        out = np.empty(x.shape, dtype=np.float64)
+    delta = np.zeros(x.shape, dtype=np.float64)
+    np.subtract(x[1:], x[:-1], out=delta[1:])
+
+    gains = np.maximum(delta, 0.0)
+    np.cumsum(gains, axis=0, out=gains)
+    window_diff(gains, window, out)
+
+    # Losses reuse the delta buffer, their window sums reuse the gains buffer
+    np.negative(delta, out=delta)
+    np.maximum(delta, 0.0, out=delta)
+    np.cumsum(delta, axis=0, out=delta)
+    window_diff(delta, window, gains)
+
+    # rs = gain / loss; RSI = 100 - 100 / (1 + rs), all in place
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(out, gains, out=out)
+        out += 1.0
+        np.divide(100.0, out, out=out)
+        np.subtract(100.0, out, out=out)
+    return out
+
+def compute_indicator_block(close: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """
+    Computes all INDICATOR_COLUMNS for a Close array into one preallocated block.
+
+    The math runs in float64; the block is stored in `dtype`. It is laid out
+    column-major so every indicator column is contiguous, and float64 kernels
+    write straight into it.
+
+    Returns:
+        np.ndarray: Array of shape (len(close), len(INDICATOR_COLUMNS)).
+    """
+    close = np.asarray(close, dtype=np.float64)
+    block = np.empty((len(INDICATOR_COLUMNS), len(close)), dtype=dtype).T
+
+    direct = block.dtype == np.float64
+    scratch = None if direct else np.empty(close.shape, dtype=np.float64)
+
+    def column(j):
+        return block[:, j] if direct else scratch
+
+    def commit(j):
+        if not direct:
+            block[:, j] = scratch
+
+    rolling_mean(close, 20, out=column(0))
+    commit(0)
+    rolling_mean(close, 50, out=column(1))
+    commit(1)
+
+    ema_12 = ema(close, 12)
+    block[:, 2] = ema_12
+    ema_26 = ema(close, 26)
+    block[:, 3] = ema_26
+
+    # MACD stays in float64 (difference of two large numbers), reusing the EMA buffer
+    macd = np.subtract(ema_12, ema_26, out=ema_12)
+    del ema_26
+    block[:, 4] = macd
+    ema(macd, 9, out=column(5))
+    commit(5)
+    del macd
+
+    rsi(close, 14, out=column(6))
+    commit(6)
+    return block
+
+def attach_columns(frame: pd.DataFrame, block: np.ndarray, columns: List[str]) -> pd.DataFrame:
+    """
+    Returns `frame` with the columns of `block` appended, without copying the
+    existing columns. Columns of the same name already in `frame` are replaced.
+    """
+    new_columns = pd.DataFrame(block, index=frame.index, columns=columns, copy=False)
+    existing = [c for c in columns if c in frame.columns]
+    base = frame.drop(columns=existing) if existing else frame
+    return pd.concat([base, new_columns], axis=1)
+
 class TechnicalIndicatorTransformer(FeatureTransformer):
     """
     Calculates technical indicators such as MA, RSI, MACD.
     """
-    
+
+    def __init__(self, engine: str = 'numpy', dtype=np.float64):
+        """
+        Args:
+            engine: 'numpy' (single-pass kernel, default) or 'pandas' (reference implementation).
+            dtype: Storage dtype of the indicator columns (math always runs in float64).
+        """
+        if engine not in ('numpy', 'pandas'):
+            raise ValueError(f"Unknown engine '{engine}'")
+        self.engine = engine
+        self.dtype = dtype
+
     def transform(self, input_data: pd.DataFrame) -> pd.DataFrame:
         """
         Adds technical indicators to the input dataframe.
         Expects input_data to have 'Close' column.
         """
-        df = input_data.copy()
-        
+        close = input_data['Close'].to_numpy(dtype=np.float64)
+
+        # Gaps need pandas' NaN-aware rolling/ewm semantics
+        if self.engine == 'pandas' or np.isnan(close).any():
+            return self._transform_pandas(input_data)
+
+        block = compute_indicator_block(close, dtype=self.dtype)
+        return attach_columns(input_data, block, INDICATOR_COLUMNS)
+
+    def warmup_bars(self) -> int:
+        """Bars of history that reproduce the latest row (FeatureStore tail recompute)."""
+        from .indicator_registry import DEFAULT_SPECS, spec_lookback
+        return max(spec_lookback(spec) for spec in DEFAULT_SPECS)
+
+    def _transform_pandas(self, input_data: pd.DataFrame) -> pd.DataFrame:
+        close = input_data['Close']
+        columns = {}
+
         # Simple Moving Averages
-        df['SMA_20'] = df['Close'].rolling(window=20).mean()
-        df['SMA_50'] = df['Close'].rolling(window=50).mean()
-        
+        columns['SMA_20'] = close.rolling(window=20).mean()
+        columns['SMA_50'] = close.rolling(window=50).mean()
+
         # Exponential Moving Average
-        df['EMA_12'] = df['Close'].ewm(span=12, adjust=False).mean()
-        df['EMA_26'] = df['Close'].ewm(span=26, adjust=False).mean()
-        
+        columns['EMA_12'] = close.ewm(span=12, adjust=False).mean()
+        columns['EMA_26'] = close.ewm(span=26, adjust=False).mean()
+
         # MACD
-        df['MACD'] = df['EMA_12'] - df['EMA_26']
-        df['MACD_Signal'] = df['MACD'].ewm(span=9, adjust=False).mean()
-        
+        columns['MACD'] = columns['EMA_12'] - columns['EMA_26']
+        columns['MACD_Signal'] = columns['MACD'].ewm(span=9, adjust=False).mean()
+
         # RSI
-        delta = df['Close'].diff()
+        delta = close.diff()
         gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
         loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        
+
         rs = gain / loss
-        df['RSI'] = 100 - (100 / (1 + rs))
-        
+        columns['RSI'] = 100 - (100 / (1 + rs))
+
         # Fill NaNs (or leave them to handle later? For now, we leave them)
-        return df
+        block = np.empty((len(INDICATOR_COLUMNS), len(close)), dtype=self.dtype).T
+        for j, name in enumerate(INDICATOR_COLUMNS):
+            block[:, j] = columns[name].to_numpy(dtype=np.float64)
+        return attach_columns(input_data, block, INDICATOR_COLUMNS)
+
+class LagFeatureTransformer(FeatureTransformer):
+    """
+    Builds k-lag features ('<col>_lag<k>') for selected columns.
+
+    Lags are exposed as a strided view over a single padded copy of the
+    selected columns, so a wide lag set costs one column copy instead of one
+    per lag. transform() materializes the columns only when a DataFrame is
+    needed.
+    """
+
+    def __init__(self, columns: Sequence[str], lags: Union[int, Sequence[int]] = 5, dtype=np.float32):
+        """
+        Args:
+            columns: Columns to lag.
+            lags: Number of lags (1..lags) or an explicit list of lags.
+            dtype: Storage dtype of the lag values (float32 by default to keep wide sets small).
+        """
+        self.columns = list(columns)
+        self.lags = list(range(1, lags + 1)) if isinstance(lags, int) else sorted(set(lags))
+        if not self.lags or self.lags[0] < 1:
+            raise ValueError("lags must be positive")
+        self.dtype = dtype
+
+    @property
+    def max_lag(self) -> int:
+        return self.lags[-1]
+
+    def feature_names(self) -> List[str]:
+        return [f"{col}_lag{lag}" for col in self.columns for lag in self.lags]
+
+    def lag_matrix(self, input_data: pd.DataFrame) -> np.ndarray:
+        """
+        Returns a read-only strided view of shape (n_rows, n_columns, max_lag)
+        where [:, c, k - 1] is column c lagged by k bars (NaN where undefined).
+        """
+        n, max_lag = len(input_data), self.max_lag
+        padded = np.full((n + max_lag, len(self.columns)), np.nan, dtype=self.dtype)
+        padded[max_lag:] = input_data[self.columns].to_numpy(dtype=self.dtype)
+
+        # windows[i, c, j] = value at row i + j - max_lag, i.e. lag max_lag - j
+        windows = sliding_window_view(padded, max_lag + 1, axis=0)
+        return windows[:, :, max_lag - 1::-1]
+
+    def to_contiguous(self, lag_view: np.ndarray) -> np.ndarray:
+        """
+        Materializes the selected lags as a C-contiguous (n_rows, n_features)
+        array in feature_names() order, e.g. for model training.
+        """
+        selected = lag_view[:, :, [lag - 1 for lag in self.lags]]
+        return np.ascontiguousarray(selected.reshape(len(lag_view), -1))
+
+    def transform(self, input_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Appends the lag columns to the input dataframe.
+        """
+        lag_view = self.lag_matrix(input_data)
+        names = self.feature_names()
+
+        # Column-major block: each lag column is written once, contiguously
+        block = np.empty((len(names), len(input_data)), dtype=self.dtype).T
+        pos = 0
+        for c in range(len(self.columns)):
+            for lag in self.lags:
+                block[:, pos] = lag_view[:, c, lag - 1]
+                pos += 1
+        return attach_columns(input_data, block, names)
 
 class MacroFeatureTransformer(FeatureTransformer):
     """
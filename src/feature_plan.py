@@ -0,0 +1,166 @@
+import re
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence, Tuple
+from .indicator_registry import (DEFAULT_EMA_WARMUP_FACTOR, DEFAULT_REGISTRY, IndicatorRegistry,
+                                 Spec, spec_lookback)
+
+_INDICATOR_PATTERNS = [
+    (re.compile(r'^SMA_(\d+)$'), lambda m: ('SMA', {'window': int(m[1])})),
+    (re.compile(r'^EMA_(\d+)$'), lambda m: ('EMA', {'span': int(m[1])})),
+    (re.compile(r'^RSI_(\d+)$'), lambda m: ('RSI', {'window': int(m[1])})),
+    (re.compile(r'^MACD_(\d+)_(\d+)$'), lambda m: ('MACD', {'fast': int(m[1]), 'slow': int(m[2])})),
+    (re.compile(r'^MACD_Signal_(\d+)_(\d+)_(\d+)$'),
+     lambda m: ('MACD_Signal', {'fast': int(m[1]), 'slow': int(m[2]), 'signal': int(m[3])})),
+]
+
+# Unsuffixed names produced by TechnicalIndicatorTransformer
+_DEFAULT_INDICATORS = {
+    'MACD': ('MACD', {'fast': 12, 'slow': 26}),
+    'MACD_Signal': ('MACD_Signal', {'fast': 12, 'slow': 26, 'signal': 9}),
+    'RSI': ('RSI', {'window': 14}),
+}
+
+class FeaturePlan:
+    """
+    Minimal computation needed to produce a trained model's features for the
+    latest bar.
+
+    Walks back from the model's feature names to the indicator specs, rolling
+    correlations and lags they depend on, and to the shortest trailing window
+    of raw bars that reproduces the latest row. Inference cost then scales
+    with the features the model actually uses, not with the full pipeline.
+    """
+
+    def __init__(self, feature_names: Sequence[str], target_col: str = 'Close',
+                 registry: Optional[IndicatorRegistry] = None,
+                 ema_warmup_factor: int = DEFAULT_EMA_WARMUP_FACTOR):
+        """
+        Args:
+            feature_names: Features in model input order (e.g. feature_names_in_).
+            target_col: Column the Corr_* features were computed against.
+            registry: Indicator kernel registry.
+            ema_warmup_factor: Warm-up length for EMA-based features, in spans.
+        """
+        self.feature_names = list(feature_names)
+        self.target_col = target_col
+        self.registry = registry or DEFAULT_REGISTRY
+        self.ema_warmup_factor = ema_warmup_factor
+
+        self.indicator_specs: Dict[str, Spec] = {}
+        self.correlations: Dict[str, Tuple[str, int]] = {}
+        self.lags: Dict[str, Tuple[str, int]] = {}
+        self.raw_columns: List[str] = []
+
+        for name in self.feature_names:
+            self._plan(name)
+        self.required_bars = max([self._lookback(name) for name in self.feature_names] + [1])
+
+    @classmethod
+    def from_predictor(cls, predictor, **kwargs) -> 'FeaturePlan':
+        """
+        Builds the plan from a trained predictor's feature list
+        (XGBoost feature_names_in_, or the MLP input scaler's).
+        """
+        names = getattr(getattr(predictor, 'model', None), 'feature_names_in_', None)
+        if names is None:
+            names = getattr(getattr(predictor, 'scaler_X', None), 'feature_names_in_', None)
+        if names is None:
+            raise ValueError("Predictor does not expose the feature names it was trained on")
+        return cls(list(names), **kwargs)
+
+    def evaluate(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Computes the model features for the last row of `data`.
+
+        Args:
+            data: Raw (merged) bars, at least `required_bars` long for exact warm-up.
+
+        Returns:
+            pd.DataFrame: One row, columns in model order, indexed by the last timestamp.
+        """
+        tail = data.iloc[-self.required_bars:]
+        series = self._indicator_series(tail)
+
+        row = {}
+        for name in self.feature_names:
+            if name in self.correlations:
+                source, window = self.correlations[name]
+                row[name] = self._last_corr(tail[self.target_col].to_numpy(dtype=np.float64),
+                                            self._series(source, tail, series), window)
+            elif name in self.lags:
+                source, lag = self.lags[name]
+                values = self._series(source, tail, series)
+                row[name] = values[-1 - lag] if len(values) > lag else np.nan
+            else:
+                row[name] = self._series(name, tail, series)[-1]
+
+        return pd.DataFrame([row], index=data.index[-1:], columns=self.feature_names)
+
+    def _plan(self, name: str) -> None:
+        if name in self.indicator_specs or name in self.correlations or name in self.lags:
+            return
+        if name.startswith('Corr_'):
+            source, window = name[len('Corr_'):].rsplit('_', 1)
+            self.correlations[name] = (source, int(window))
+            self._plan(source)
+            return
+        if '_lag' in name:
+            source, lag = name.rsplit('_lag', 1)
+            if lag.isdigit():
+                self.lags[name] = (source, int(lag))
+                self._plan(source)
+                return
+        spec = self._match_indicator(name)
+        if spec is not None:
+            self.indicator_specs[name] = (spec[0], dict(spec[1], name=name))
+        elif name not in self.raw_columns:
+            self.raw_columns.append(name)
+
+    def _match_indicator(self, name: str) -> Optional[Spec]:
+        if name in _DEFAULT_INDICATORS:
+            return _DEFAULT_INDICATORS[name]
+        for pattern, build in _INDICATOR_PATTERNS:
+            match = pattern.match(name)
+            if match:
+                return build(match)
+        return None
+
+    def _lookback(self, name: str) -> int:
+        """Bars of raw history needed to produce one (latest) value of `name`."""
+        if name in self.correlations:
+            source, window = self.correlations[name]
+            return window + self._lookback(source) - 1
+        if name in self.lags:
+            source, lag = self.lags[name]
+            return lag + self._lookback(source)
+        if name in self.indicator_specs:
+            return spec_lookback(self.indicator_specs[name], self.ema_warmup_factor)
+        return 1
+
+    def _indicator_series(self, tail: pd.DataFrame) -> Dict[str, np.ndarray]:
+        if not self.indicator_specs:
+            return {}
+        specs = list(self.indicator_specs.values())
+        columns, block = self.registry.compute(tail['Close'].to_numpy(dtype=np.float64), specs)
+        return {name: block[:, j] for j, name in enumerate(columns)}
+
+    def _series(self, name: str, tail: pd.DataFrame, series: Dict[str, np.ndarray]) -> np.ndarray:
+        if name in series:
+            return series[name]
+        if name not in tail.columns:
+            raise KeyError(f"Feature '{name}' is neither derivable nor present in the data")
+        return tail[name].to_numpy(dtype=np.float64)
+
+    @staticmethod
+    def _last_corr(target: np.ndarray, feature: np.ndarray, window: int) -> float:
+        # Same semantics as rolling(window).corr: NaN unless the whole window is valid
+        if len(target) < window:
+            return np.nan
+        x, y = target[-window:], feature[-window:]
+        if np.isnan(x).any() or np.isnan(y).any():
+            return np.nan
+        x = x - x.mean()
+        y = y - y.mean()
+        denom = np.sqrt((x * x).sum() * (y * y).sum())
+        return float((x * y).sum() / denom) if denom > 0 else np.nan
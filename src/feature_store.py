@@ -0,0 +1,260 @@
+import hashlib
+import json
+import os
+import time
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Optional, Tuple
+
+def _hash_bytes(*parts: bytes) -> str:
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part)
+    return digest.hexdigest()
+
+def _plain(value: Any) -> Any:
+    """Reduces a transformer attribute to JSON-stable data, or None if it has no stable form."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, type) and issubclass(value, np.generic):
+        return np.dtype(value).name
+    if isinstance(value, np.dtype):
+        return value.name
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _plain(v) for k, v in value.items()}
+    # Objects such as IndicatorRegistry expose their identity as plain data
+    if callable(getattr(value, 'identity', None)):
+        return _plain(value.identity())
+    return None
+
+class FeatureStore:
+    """
+    Content-addressed Parquet cache of computed feature frames.
+
+    Entries are keyed by the hash of the input rows, the transformer class,
+    its parameters and the last input timestamp. When an input shares a run
+    of identical rows (same timestamp and values) with a cached input, e.g. a
+    sliding window moved forward by a day or a revised partial last bar, the
+    cached rows are reused and only the edges are recomputed: the first
+    warm-up rows of the input (their history differs from the cached one) and
+    everything after the shared run. Transformers must be causal: row t may
+    only depend on rows <= t.
+
+    The warm-up comes from the transformer's warmup_bars(**transform_kwargs),
+    the history needed to reproduce its latest row. Transformers without it
+    are recomputed in full, since a guessed warm-up would silently truncate
+    long-memory features such as slow EMAs.
+    """
+
+    def __init__(self, data_dir: str = "./data/feature_store", max_bytes: int = 512 * 1024 ** 2):
+        """
+        Args:
+            data_dir: Directory for Parquet entries and the index.
+            max_bytes: Total size budget; least recently used entries are evicted beyond it.
+        """
+        self.data_dir = data_dir
+        self.max_bytes = max_bytes
+        os.makedirs(self.data_dir, exist_ok=True)
+        self.index_file = os.path.join(self.data_dir, "index.json")
+        self.entries: Dict[str, Dict[str, Any]] = self._load_index()
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, transformer, input_data: pd.DataFrame,
+                       warmup: Optional[int] = None, **transform_kwargs) -> pd.DataFrame:
+        """
+        Returns transformer.transform(input_data, **transform_kwargs), served from
+        the store when possible.
+
+        Args:
+            transformer: Any object with a transform(df, **kwargs) method.
+            input_data: Input frame (time ordered).
+            warmup: Bars recomputed ahead of new rows on an incremental update
+                    (default: transformer.warmup_bars(**transform_kwargs)).
+            **transform_kwargs: Extra arguments forwarded to transform (part of the key).
+        """
+        family = self._family(transformer, transform_kwargs)
+        row_hashes = pd.util.hash_pandas_object(input_data, index=True).to_numpy()
+        input_hash = _hash_bytes(row_hashes.tobytes())
+        last_ts = str(input_data.index[-1]) if len(input_data) else ""
+        key = _hash_bytes(family.encode(), input_hash.encode(), last_ts.encode())
+
+        if key in self.entries:
+            cached = self._read(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+
+        if warmup is None:
+            warmup = self._warmup(transformer, transform_kwargs)
+        overlap = self._find_overlap(family, row_hashes, warmup) if warmup is not None else None
+        result = self._extend(transformer, overlap, input_data, warmup, transform_kwargs) if overlap else None
+        if result is not None:
+            self.partial_hits += 1
+        else:
+            result = transformer.transform(input_data, **transform_kwargs)
+            self.misses += 1
+
+        self._write(key, family, type(transformer).__name__, input_hash, row_hashes, last_ts, result)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current store size."""
+        return {
+            "hits": self.hits,
+            "partial_hits": self.partial_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": sum(e["bytes"] for e in self.entries.values()),
+        }
+
+    def clear(self) -> None:
+        """Deletes every entry."""
+        for key in list(self.entries):
+            self._remove(key)
+        self._save_index()
+
+    def _family(self, transformer, transform_kwargs: Dict[str, Any]) -> str:
+        params = {k: _plain(v) for k, v in vars(transformer).items() if not k.startswith('_')}
+        params = {k: v for k, v in params.items() if v is not None}
+        description = {
+            "transformer": type(transformer).__name__,
+            "params": params,
+            "kwargs": {k: _plain(v) for k, v in transform_kwargs.items()},
+        }
+        return _hash_bytes(json.dumps(description, sort_keys=True).encode())
+
+    @staticmethod
+    def _warmup(transformer, transform_kwargs: Dict[str, Any]) -> Optional[int]:
+        warmup_bars = getattr(transformer, 'warmup_bars', None)
+        return warmup_bars(**transform_kwargs) if warmup_bars is not None else None
+
+    def _find_overlap(self, family: str, row_hashes: np.ndarray,
+                      warmup: int) -> Optional[Tuple[Dict[str, Any], int, int, int]]:
+        """
+        Run of input rows identical to consecutive rows of a cached entry of the
+        same family, the one with the most reusable rows, as (entry, run start in
+        the input, run start in the entry, run length).
+        """
+        best, best_reusable = None, 0
+        positions = np.arange(len(row_hashes))
+        for entry in list(self.entries.values()):
+            if entry["family"] != family:
+                continue
+            cached = self._read_rows(entry["key"])
+            if cached is None or len(cached) == 0:
+                continue
+            # Position of each input row in the entry (-1 if absent)
+            order = np.argsort(cached, kind='stable')
+            found = np.minimum(np.searchsorted(cached[order], row_hashes), len(cached) - 1)
+            where = np.where(cached[order][found] == row_hashes, order[found], -1)
+            # Runs: matched rows at a constant offset between input and entry
+            offset = where - positions
+            breaks = np.flatnonzero((where[1:] < 0) | (where[:-1] < 0) | (offset[1:] != offset[:-1])) + 1
+            for run in np.split(positions, breaks):
+                if len(run) == 0 or where[run[0]] < 0:
+                    continue
+                start, cached_start, length = int(run[0]), int(where[run[0]]), len(run)
+                reusable = length - self._skip(start, cached_start, warmup)
+                if reusable > best_reusable:
+                    best, best_reusable = (entry, start, cached_start, length), reusable
+        return best
+
+    @staticmethod
+    def _skip(start: int, cached_start: int, warmup: int) -> int:
+        # A shared row is only reusable once it has `warmup` bars of shared history,
+        # unless both inputs start with the shared run (identical history)
+        return 0 if start == 0 and cached_start == 0 else warmup
+
+    def _extend(self, transformer, overlap: Tuple[Dict[str, Any], int, int, int], input_data: pd.DataFrame,
+                warmup: int, transform_kwargs: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """Input features from the shared cached rows plus recomputed edges (None if the entry is gone)."""
+        entry, start, cached_start, length = overlap
+        skip = self._skip(start, cached_start, warmup)
+        head_end, end = start + skip, start + length
+        cached = self._read(entry["key"])
+        if cached is None:
+            return None
+
+        parts = []
+        if head_end > 0:
+            parts.append(transformer.transform(input_data.iloc[:head_end], **transform_kwargs))
+        parts.append(cached.iloc[cached_start + skip:cached_start + length])
+        if end < len(input_data):
+            tail_start = max(0, end - warmup)
+            parts.append(transformer.transform(input_data.iloc[tail_start:], **transform_kwargs).iloc[end - tail_start:])
+        return pd.concat([part[cached.columns] for part in parts])
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.data_dir, f"{key}.parquet")
+
+    def _rows_path(self, key: str) -> str:
+        return os.path.join(self.data_dir, f"{key}.rows.npy")
+
+    def _read_rows(self, key: str) -> Optional[np.ndarray]:
+        path = self._rows_path(key)
+        return np.load(path) if os.path.exists(path) else None
+
+    def _read(self, key: str) -> Optional[pd.DataFrame]:
+        path = self._path(key)
+        if not os.path.exists(path):
+            self.entries.pop(key, None)
+            self._save_index()
+            return None
+        # Access times reach the index with the next write instead of on every hit
+        self.entries[key]["last_access"] = time.time()
+        return pd.read_parquet(path)
+
+    def _write(self, key: str, family: str, name: str, input_hash: str, row_hashes: np.ndarray,
+               last_ts: str, frame: pd.DataFrame) -> None:
+        path = self._path(key)
+        frame.to_parquet(path)
+        # Per-row input hashes locate shared rows for later inputs
+        np.save(self._rows_path(key), row_hashes)
+        self.entries[key] = {
+            "key": key,
+            "family": family,
+            "transformer": name,
+            "input_hash": input_hash,
+            "n_rows": len(frame),
+            "last_timestamp": last_ts,
+            "bytes": os.path.getsize(path) + os.path.getsize(self._rows_path(key)),
+            "last_access": time.time(),
+        }
+        self._evict(keep=key)
+        self._save_index()
+
+    def _evict(self, keep: str) -> None:
+        total = sum(e["bytes"] for e in self.entries.values())
+        for entry in sorted(self.entries.values(), key=lambda e: e["last_access"]):
+            if total <= self.max_bytes:
+                break
+            if entry["key"] == keep:
+                continue
+            total -= entry["bytes"]
+            self._remove(entry["key"])
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        self.entries.pop(key, None)
+        for path in (self._path(key), self._rows_path(key)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.index_file):
+            return {}
+        try:
+            with open(self.index_file, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def _save_index(self) -> None:
+        with open(self.index_file, 'w') as f:
+            json.dump(self.entries, f, indent=4)
@@ -0,0 +1,246 @@
+import itertools
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from .base import FeatureTransformer
+from .feature_engineering import window_diff, attach_columns, ema
+
+# A feature spec: (indicator name, parameters), e.g. ('SMA', {'window': 20}).
+# An optional 'name' parameter overrides the generated column name.
+Spec = Tuple[str, Dict[str, Any]]
+
+# EMA-based indicators are seeded this many spans back; the seed's weight has
+# decayed to ~exp(-2 * factor) by the latest row (about 2e-9 for 10)
+DEFAULT_EMA_WARMUP_FACTOR = 10
+
+# Kernels receive the Close array, the parameter dicts of every spec for their
+# indicator and a per-call dict of shared intermediates; they yield one float64
+# column per parameter dict, in order. A yielded array is only valid until the
+# next one is requested: kernels may refill one buffer for every spec, and
+# IndicatorRegistry.compute copies each column into its block before resuming.
+Kernel = Callable[[np.ndarray, List[Dict[str, Any]], Dict[Any, np.ndarray]], Iterator[np.ndarray]]
+
+# Lookbacks receive a spec's params and the EMA warm-up factor and return the
+# bars of Close history needed to reproduce the latest value.
+Lookback = Callable[[Dict[str, Any], int], int]
+
+class IndicatorRegistry:
+    """
+    Registry of batched indicator kernels.
+
+    All specs for one indicator are computed in a single kernel call, so a
+    whole grid (e.g. SMA for windows 5..200) shares one cumulative sum, and
+    EMAs are computed once per span even when several MACD specs need them.
+    """
+
+    def __init__(self):
+        self._kernels: Dict[str, Kernel] = {}
+        self._name_formats: Dict[str, str] = {}
+        self._lookbacks: Dict[str, Optional[Lookback]] = {}
+
+    def register(self, indicator: str, name_format: str,
+                 lookback: Optional[Lookback] = None) -> Callable[[Kernel], Kernel]:
+        """
+        Decorator registering a batched kernel.
+
+        Args:
+            indicator: Indicator name used in specs (e.g. 'SMA').
+            name_format: Column name template filled from the spec params (e.g. 'SMA_{window}').
+            lookback: Bars of history a spec needs, or None if unknown.
+        """
+        def decorator(kernel: Kernel) -> Kernel:
+            self._kernels[indicator] = kernel
+            self._name_formats[indicator] = name_format
+            self._lookbacks[indicator] = lookback
+            return kernel
+        return decorator
+
+    def indicators(self) -> List[str]:
+        return list(self._kernels)
+
+    def lookback(self, spec: Spec, ema_warmup_factor: int = DEFAULT_EMA_WARMUP_FACTOR) -> Optional[int]:
+        """
+        Bars of Close history needed to reproduce the latest value of a spec,
+        or None if its indicator has no registered lookback.
+        """
+        indicator, params = spec
+        lookback = self._lookbacks.get(indicator)
+        return lookback(params, ema_warmup_factor) if lookback is not None else None
+
+    def identity(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Registered indicators with their name formats, kernels and lookbacks,
+        so caches keyed on a transformer tell custom registries apart.
+        Functions are identified by qualified name, so closures of one factory
+        that differ only in captured values look alike.
+        """
+        return {indicator: {"name_format": self._name_formats[indicator],
+                            "kernel": _qualified_name(kernel),
+                            "lookback": _qualified_name(self._lookbacks[indicator])}
+                for indicator, kernel in self._kernels.items()}
+
+    def column_name(self, spec: Spec) -> str:
+        indicator, params = spec
+        if 'name' in params:
+            return params['name']
+        return self._name_formats[indicator].format(**params)
+
+    def compute(self, close: np.ndarray, specs: List[Spec], dtype=np.float64) -> Tuple[List[str], np.ndarray]:
+        """
+        Evaluates all specs on a Close array.
+
+        Returns:
+            Tuple of (column names, block of shape (len(close), len(specs))).
+        """
+        groups: Dict[str, List[int]] = {}
+        for pos, (indicator, _) in enumerate(specs):
+            if indicator not in self._kernels:
+                raise ValueError(f"Unknown indicator '{indicator}'. Registered: {self.indicators()}")
+            groups.setdefault(indicator, []).append(pos)
+
+        close = np.asarray(close, dtype=np.float64)
+        columns = [self.column_name(spec) for spec in specs]
+        block = np.empty((len(specs), len(close)), dtype=dtype).T
+        if len(close) == 0:
+            return columns, block
+
+        shared: Dict[Any, np.ndarray] = {}
+        for indicator, positions in groups.items():
+            params_list = [specs[pos][1] for pos in positions]
+            for pos, values in zip(positions, self._kernels[indicator](close, params_list, shared)):
+                block[:, pos] = values
+        return columns, block
+
+def grid(indicator: str, **param_ranges: Iterable) -> List[Spec]:
+    """
+    Expands a parameter grid into specs, e.g. grid('SMA', window=range(5, 201)).
+    Scalars are treated as single-value ranges.
+    """
+    keys = list(param_ranges)
+    values = [list(v) if isinstance(v, Iterable) and not isinstance(v, str) else [v]
+              for v in param_ranges.values()]
+    return [(indicator, dict(zip(keys, combo))) for combo in itertools.product(*values)]
+
+def spec_lookback(spec: Spec, ema_warmup_factor: int = DEFAULT_EMA_WARMUP_FACTOR) -> Optional[int]:
+    """
+    Bars of Close history needed to reproduce the latest value of a spec of
+    the default kernels, or None for other indicators.
+    """
+    return DEFAULT_REGISTRY.lookback(spec, ema_warmup_factor)
+
+def _qualified_name(fn: Optional[Callable]) -> Optional[str]:
+    if fn is None:
+        return None
+    return f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', repr(fn))}"
+
+def _shared(shared: Dict[Any, np.ndarray], key: Any, factory: Callable[[], np.ndarray]) -> np.ndarray:
+    if key not in shared:
+        shared[key] = factory()
+    return shared[key]
+
+def _shared_ema(close: np.ndarray, span: int, shared: Dict[Any, np.ndarray]) -> np.ndarray:
+    return _shared(shared, ('EMA', span), lambda: ema(close, span))
+
+def _shared_macd(close: np.ndarray, fast: int, slow: int, shared: Dict[Any, np.ndarray]) -> np.ndarray:
+    return _shared(shared, ('MACD', fast, slow),
+                   lambda: _shared_ema(close, fast, shared) - _shared_ema(close, slow, shared))
+
+DEFAULT_REGISTRY = IndicatorRegistry()
+
+@DEFAULT_REGISTRY.register('SMA', 'SMA_{window}', lambda params, factor: params['window'])
+def _sma_kernel(close, params_list, shared):
+    # One cumulative sum of the shifted series serves every window; `out` is
+    # refilled for each one (see Kernel)
+    base = close[0]
+    csum = _shared(shared, 'shifted_cumsum', lambda: np.cumsum(close - base))
+    out = np.empty(len(close))
+    for params in params_list:
+        window = params['window']
+        window_diff(csum, window, out)
+        out /= window
+        out += base
+        yield out
+
+@DEFAULT_REGISTRY.register('EMA', 'EMA_{span}', lambda params, factor: factor * params['span'])
+def _ema_kernel(close, params_list, shared):
+    for params in params_list:
+        yield _shared_ema(close, params['span'], shared)
+
+@DEFAULT_REGISTRY.register('MACD', 'MACD_{fast}_{slow}', lambda params, factor: factor * params['slow'])
+def _macd_kernel(close, params_list, shared):
+    for params in params_list:
+        yield _shared_macd(close, params['fast'], params['slow'], shared)
+
+@DEFAULT_REGISTRY.register('MACD_Signal', 'MACD_Signal_{fast}_{slow}_{signal}',
+                           lambda params, factor: factor * (params['slow'] + params['signal']))
+def _macd_signal_kernel(close, params_list, shared):
+    for params in params_list:
+        yield ema(_shared_macd(close, params['fast'], params['slow'], shared), params['signal'])
+
+@DEFAULT_REGISTRY.register('RSI', 'RSI_{window}', lambda params, factor: params['window'] + 1)
+def _rsi_kernel(close, params_list, shared):
+    # Gain/loss cumulative sums are shared by every window
+    delta = np.zeros(len(close))
+    np.subtract(close[1:], close[:-1], out=delta[1:])
+    gains = np.cumsum(np.maximum(delta, 0.0))
+    losses = np.cumsum(np.maximum(-delta, 0.0))
+
+    # `out` is refilled for each window (see Kernel)
+    out = np.empty(len(close))
+    loss_sum = np.empty(len(close))
+    for params in params_list:
+        window = params['window']
+        window_diff(gains, window, out)
+        window_diff(losses, window, loss_sum)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(out, loss_sum, out=out)
+            out += 1.0
+            np.divide(100.0, out, out=out)
+            np.subtract(100.0, out, out=out)
+        yield out
+
+# Reproduces the columns of TechnicalIndicatorTransformer
+DEFAULT_SPECS: List[Spec] = [
+    ('SMA', {'window': 20}),
+    ('SMA', {'window': 50}),
+    ('EMA', {'span': 12}),
+    ('EMA', {'span': 26}),
+    ('MACD', {'fast': 12, 'slow': 26, 'name': 'MACD'}),
+    ('MACD_Signal', {'fast': 12, 'slow': 26, 'signal': 9, 'name': 'MACD_Signal'}),
+    ('RSI', {'window': 14, 'name': 'RSI'}),
+]
+
+class IndicatorGridTransformer(FeatureTransformer):
+    """
+    Adds the indicator columns declared by a list of (indicator, params) specs.
+    """
+
+    def __init__(self, specs: Optional[List[Spec]] = None,
+                 registry: Optional[IndicatorRegistry] = None,
+                 dtype=np.float64):
+        """
+        Args:
+            specs: Feature specs; defaults to the TechnicalIndicatorTransformer set.
+            registry: Kernel registry (defaults to DEFAULT_REGISTRY).
+            dtype: Storage dtype of the generated columns.
+        """
+        self.specs = list(specs) if specs is not None else list(DEFAULT_SPECS)
+        self.registry = registry or DEFAULT_REGISTRY
+        self.dtype = dtype
+
+    def transform(self, input_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Computes every spec in one batched pass and appends the columns.
+        Expects input_data to have 'Close' column without gaps.
+        """
+        close = input_data['Close'].to_numpy(dtype=np.float64)
+        columns, block = self.registry.compute(close, self.specs, dtype=self.dtype)
+        return attach_columns(input_data, block, columns)
+
+    def warmup_bars(self) -> Optional[int]:
+        """
+        Bars of history that reproduce the latest row, or None if a spec's
+        lookback is unknown (FeatureStore then recomputes in full).
+        """
+        lookbacks = [self.registry.lookback(spec) for spec in self.specs]
+        return None if None in lookbacks else max(lookbacks + [1])
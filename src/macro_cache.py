@@ -0,0 +1,164 @@
+import json
+import logging
+import os
+import threading
+import time
+import pandas as pd
+from typing import Dict, List, Optional, Tuple, Union
+from .base import DataProvider
+from .data_merger import DataMerger
+from .storage import StorageManager
+
+PANEL_NAME = "macro_panel"
+
+logger = logging.getLogger(__name__)
+
+class MacroPanelCache:
+    """
+    Disk-backed, aligned panel of macro close prices shared by every pipeline run.
+
+    Each macro symbol is downloaded once; later requests are sliced from the
+    cached panel and only the missing date ranges (typically the newest days)
+    are fetched and appended.
+
+    A range that returns no data although it has business days (a market
+    holiday, or a failed download, which the providers report the same way)
+    is not marked covered. It is not requested again for `empty_ttl`, then
+    it is retried.
+    """
+
+    def __init__(self, data_dir: str = "./data",
+                 symbols: Optional[Dict[str, str]] = None,
+                 provider: Optional[DataProvider] = None,
+                 empty_ttl: Union[str, pd.Timedelta] = '6h'):
+        """
+        Args:
+            data_dir: Directory holding the panel parquet file and its coverage index.
+            symbols: Mapping of macro names to tickers (defaults to config.MACRO_SYMBOLS).
+            provider: Data provider used for downloads (defaults to Yahoo Finance).
+            empty_ttl: How long a range that came back empty is not requested again.
+        """
+        if symbols is None:
+            from .config import MACRO_SYMBOLS
+            symbols = MACRO_SYMBOLS
+        if provider is None:
+            from .data_provider import YahooFinanceProvider
+            provider = YahooFinanceProvider()
+
+        self.symbols = dict(symbols)
+        self.provider = provider
+        self.storage = StorageManager(data_dir)
+        self.meta_file = os.path.join(data_dir, f"{PANEL_NAME}.json")
+        self.merger = DataMerger()
+        self.empty_ttl = pd.Timedelta(empty_ttl)
+        self._lock = threading.Lock()
+        # (name, start, end) -> time of the last attempt that returned no data
+        self._empty: Dict[Tuple[str, str, str], float] = {}
+
+        self.panel = self.storage.load_data(PANEL_NAME)
+        if self.panel is None:
+            self.panel = pd.DataFrame()
+        self.coverage = self._load_coverage()
+
+    def get_panel(self, start: str, end: str) -> pd.DataFrame:
+        """
+        Returns the aligned macro panel for [start, end), fetching only the
+        date ranges that are not cached yet.
+
+        Args:
+            start: Start date (YYYY-MM-DD).
+            end: End date (YYYY-MM-DD), exclusive like the data providers.
+        """
+        with self._lock:
+            self._refresh(start, end)
+            if self.panel.empty:
+                return self.panel.copy()
+            index = self.panel.index
+            mask = (index >= pd.Timestamp(start)) & (index < pd.Timestamp(end))
+            columns = [name for name in self.symbols if name in self.panel.columns]
+            return self.panel.loc[mask, columns]
+
+    def _missing_ranges(self, name: str, start: str, end: str) -> List[Tuple[str, str]]:
+        covered = self.coverage.get(name)
+        if covered is None:
+            return [(start, end)]
+        ranges = []
+        if start < covered[0]:
+            ranges.append((start, covered[0]))
+        if end > covered[1]:
+            ranges.append((covered[1], end))
+        return ranges
+
+    def _refresh(self, start: str, end: str) -> None:
+        fetched = {}
+        changed = False
+        for name, ticker in self.symbols.items():
+            for range_start, range_end in self._missing_ranges(name, start, end):
+                attempted = self._empty.get((name, range_start, range_end))
+                if attempted is not None and time.time() - attempted < self.empty_ttl.total_seconds():
+                    continue
+                logger.info("Fetching %s (%s) %s -> %s", name, ticker, range_start, range_end)
+                try:
+                    df = self.provider.fetch_history(ticker, start=range_start, end=range_end)
+                    fetched.setdefault(name, []).append(df)
+                except ValueError as e:
+                    # Providers raise ValueError both for empty ranges and for failed
+                    # downloads, so only a range without business days counts as covered.
+                    # Others (holidays, outages) are remembered and retried after empty_ttl.
+                    if not self._no_trading_days(range_start, range_end):
+                        logger.info("No data for %s (%s) %s -> %s, retrying after %s: %s",
+                                    name, ticker, range_start, range_end, self.empty_ttl, e)
+                        self._empty[(name, range_start, range_end)] = time.time()
+                        continue
+                except Exception as e:
+                    logger.warning("Failed to fetch %s (%s) %s -> %s: %s",
+                                   name, ticker, range_start, range_end, e)
+                    continue
+                self._extend_coverage(name, range_start, range_end)
+                changed = True
+
+        if fetched:
+            new_panel = self.merger.build_panel({name: pd.concat(frames) for name, frames in fetched.items()})
+            # Fresh downloads win over cached values on overlapping dates
+            self.panel = new_panel.combine_first(self.panel) if not self.panel.empty else new_panel
+        if changed:
+            self._save()
+
+    @staticmethod
+    def _no_trading_days(start: str, end: str) -> bool:
+        return len(pd.bdate_range(start, end, inclusive="left")) == 0
+
+    def _extend_coverage(self, name: str, start: str, end: str) -> None:
+        covered = self.coverage.get(name)
+        if covered is None:
+            self.coverage[name] = [start, end]
+        else:
+            self.coverage[name] = [min(covered[0], start), max(covered[1], end)]
+
+    def _load_coverage(self) -> Dict[str, List[str]]:
+        if not os.path.exists(self.meta_file):
+            return {}
+        try:
+            with open(self.meta_file, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def _save(self) -> None:
+        self.storage.save_data(PANEL_NAME, self.panel)
+        with open(self.meta_file, 'w') as f:
+            json.dump(self.coverage, f, indent=4)
+
+# Process-wide instances, one per data directory
+_CACHES: Dict[str, MacroPanelCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+def get_macro_cache(data_dir: str = "./data") -> MacroPanelCache:
+    """
+    Returns the shared MacroPanelCache for a data directory, creating it on first use.
+    """
+    key = os.path.abspath(data_dir)
+    with _CACHES_LOCK:
+        if key not in _CACHES:
+            _CACHES[key] = MacroPanelCache(data_dir)
+        return _CACHES[key]
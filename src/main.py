@@ -4,7 +4,11 @@ from datetime import datetime, timedelta
 from src.data_provider import YahooFinanceProvider
 from src.storage import StorageManager
 from src.feature_engineering import TechnicalIndicatorTransformer
+from src.feature_store import FeatureStore
 from src.model_lab import LinearRegressionPredictor, SimpleEvaluator, TimeSeriesSplitter
+from src.config import enable_copy_on_write
+
+enable_copy_on_write()
 
 def run_pipeline(symbol: str, train: bool = True):
     print(f"Starting pipeline for {symbol}...")
@@ -30,7 +34,8 @@ def run_pipeline(symbol: str, train: bool = True):
     # 2. Feature Layer
     print("Step 2: Feature Engineering...")
     transformer = TechnicalIndicatorTransformer()
-    df_features = transformer.transform(df)
+    feature_store = FeatureStore("./data/feature_store")
+    df_features = feature_store.get_or_compute(transformer, df)
     
     # Drop NaNs created by indicators
     df_features.dropna(inplace=True)
@@ -12,11 +12,17 @@ from src.data_provider import YahooFinanceProvider
 from src.storage import StorageManager
 from src.data_merger import DataMerger
 from src.feature_engineering import TechnicalIndicatorTransformer
+from src.feature_store import FeatureStore
 from src.market_analyzer import CorrelationTransformer, MarketAnalyzer
 from src.model_lab import LinearRegressionPredictor, SimpleEvaluator
 from src.xgboost_predictor import XGBoostPredictor
 from src.mlp_predictor import MLPPredictor
-from src.config import MACRO_SYMBOLS
+from src.macro_cache import get_macro_cache
+from src.model_registry import ModelRegistry
+from src.config import enable_copy_on_write
+from src.precision import DEFAULT_POLICY
+
+enable_copy_on_write()
 
 def run_pipeline(symbol: str, train: bool = True, model_type: str = 'xgb', args=None):
 
@@ -26,7 +32,9 @@ def run_pipeline(symbol: str, train: bool = True, model_type: str = 'xgb', args=
     print("Step 1: Fetching Target & Macro Data...")
     provider = YahooFinanceProvider()
     storage = StorageManager("./data")
-    merger = DataMerger()
+    # Features are stored in float32; indicator math still runs in float64
+    feature_dtype = DEFAULT_POLICY.feature_dtype
+    merger = DataMerger(dtype=feature_dtype)
     
     end_date = datetime.now().strftime('%Y-%m-%d')
     start_date = (datetime.now() - timedelta(days=730)).strftime('%Y-%m-%d')
@@ -34,31 +42,28 @@ def run_pipeline(symbol: str, train: bool = True, model_type: str = 'xgb', args=
     # Fetch Target
     df_target = provider.fetch_history(symbol, start=start_date, end=end_date)
     
-    # Fetch Macros
-    macro_data = {}
-    for name, ticker in MACRO_SYMBOLS.items():
-        try:
-            print(f"  Fetching {name} ({ticker})...")
-            df_macro = provider.fetch_history(ticker, start=start_date, end=end_date)
-            macro_data[name] = df_macro
-        except Exception as e:
-            print(f"  Warning: Failed to fetch {name}: {e}")
+    # Fetch Macros (sliced from the shared, incrementally refreshed panel)
+    macro_panel = get_macro_cache("./data").get_panel(start_date, end_date)
             
     # Merge
     print("  Merging data...")
-    df_merged = merger.merge(df_target, macro_data)
+    df_merged = merger.merge_panel(df_target, macro_panel)
     print(f"  Merged Data Shape: {df_merged.shape}")
     
     # --- 2. Feature Layer (Enhanced) ---
     print("Step 2: Feature Engineering...")
+    # Cached per input hash; only new bars are recomputed on later runs
+    feature_store = FeatureStore("./data/feature_store")
+    
     # Tech Indicators
-    tech_transformer = TechnicalIndicatorTransformer()
-    df_features = tech_transformer.transform(df_merged)
+    tech_transformer = TechnicalIndicatorTransformer(dtype=feature_dtype)
+    df_features = feature_store.get_or_compute(tech_transformer, df_merged)
     
     # Correlation Features
     print("  Calculating Rolling Correlations...")
-    corr_transformer = CorrelationTransformer()
-    df_features = corr_transformer.transform(df_features, target_col='Close', window=30)
+    corr_transformer = CorrelationTransformer(dtype=feature_dtype)
+    df_features = feature_store.get_or_compute(corr_transformer, df_features, target_col='Close', window=30)
+    print(f"  Feature store: {feature_store.stats()}")
     
     # Drop NaNs
     df_features.dropna(inplace=True)
@@ -120,20 +125,26 @@ def run_pipeline(symbol: str, train: bool = True, model_type: str = 'xgb', args=
                  clean_params = {k: v for k, v in best_params.items() if not k.startswith('n_units') and not k.startswith('n_layers')}
                  clean_params['hidden_layer_sizes'] = tuple(sorted_layers)
                  
-                 predictor = MLPPredictor(**clean_params)
+                 predictor = MLPPredictor(dtype=feature_dtype, **clean_params)
             
         else:
             if model_type == 'xgb':
                 predictor = XGBoostPredictor()
                 print("  Selected Model: XGBoost (Default Params)")
             elif model_type == 'mlp':
-                predictor = MLPPredictor(hidden_layer_sizes=(100, 50), max_iter=500)
+                predictor = MLPPredictor(hidden_layer_sizes=(100, 50), max_iter=500, dtype=feature_dtype)
                 print("  Selected Model: MLP (Neural Network - Default Params)")
             else:
                 predictor = LinearRegressionPredictor()
                 print("  Selected Model: Linear Regression")
             
-        predictor.train(X_train, y_train)
+        # Reuse the stored model when nothing it depends on has changed
+        registry = ModelRegistry("./data/models")
+        if registry.load(predictor, symbol, 1, X_train):
+            print("  Loaded trained model from registry (skipping training)")
+        else:
+            predictor.train(X_train, y_train)
+            registry.save(predictor, symbol, 1, X_train)
         
         # Sentiment Analysis (Real-time)
         print("step 4.5: Analyzing Market Sentiment...")
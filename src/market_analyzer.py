@@ -1,68 +1,254 @@
 import pandas as pd
 import numpy as np
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple, Union
 import seaborn as sns
 import matplotlib.pyplot as plt
+from scipy import fft as sp_fft
+from .feature_engineering import attach_columns
+from .correlation_engine import CorrelationEngine
+from .streaming_correlation import RollingCorrelationMatrix, EWMCorrelationMatrix
+
+# Cumulative sums restart every block of this many rows (raised to the window
+# if needed), which bounds the running sums and hence the cancellation error of
+# window differences on long, trending histories
+CORR_BLOCK_ROWS = 64
+
+# Columns are processed in chunks of about this many elements to bound temporaries
+_CORR_CHUNK_ELEMENTS = 1 << 16
+
+# Windows whose variance is below this fraction of their sum of squares are
+# treated as constant (correlation undefined)
+_VAR_RTOL = 1e-12
+
+def _blocked_cumsum(rows: np.ndarray, block: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cumulative sum along the last axis restarting every `block` positions.
+    Returns the padded sums (length a multiple of block) and the block totals.
+    """
+    m, n = rows.shape
+    n_blocks = -(-n // block)
+    csum = np.zeros((m, n_blocks, block), dtype=np.float64)
+    csum.reshape(m, -1)[:, :n] = rows
+    np.cumsum(csum, axis=2, out=csum)
+    return csum.reshape(m, -1), csum[:, :, -1].copy()
+
+def _blocked_window_sum(csum: np.ndarray, totals: np.ndarray, block: int, window: int,
+                        out: np.ndarray) -> np.ndarray:
+    """Trailing window sums along the last axis from a blocked cumulative sum (window <= block)."""
+    m, padded = csum.shape
+    out[:, :window - 1] = 0.0  # incomplete windows; masked by the caller
+    out[:, window - 1] = csum[:, window - 1]
+    np.subtract(csum[:, window:], csum[:, :-window], out=out[:, window:])
+    # The first `window` positions of every later block start in the previous one
+    out.reshape(m, -1, block)[:, 1:, :window] += totals[:, :-1, None]
+    return out
+
+def _centered(values: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Rows centered on their mean with gaps zeroed, plus the gap mask (None without gaps)."""
+    missing = np.isnan(values)
+    if not missing.any():
+        return values - values.mean(axis=1, keepdims=True), None
+    counts = np.maximum((~missing).sum(axis=1, keepdims=True), 1)
+    centered = np.where(missing, 0.0, values)
+    centered -= centered.sum(axis=1, keepdims=True) / counts
+    centered[missing] = 0.0
+    return centered, missing
+
+def rolling_corr(target: np.ndarray, others: Union[np.ndarray, pd.DataFrame], windows,
+                 out: Optional[np.ndarray] = None, block: int = CORR_BLOCK_ROWS) -> np.ndarray:
+    """
+    Trailing rolling Pearson correlation of `target` against every column of
+    `others`, for one or more windows, from blocked cumulative sums of x, y,
+    x^2, y^2 and xy.
+
+    Matches pandas rolling(window).corr: a window with a missing value in
+    either series is NaN, and so is a window where either series is constant.
+    Values are centered on their column means and the target's sums are shared
+    by all columns and windows, so the cost is O(n * k) per window.
+
+    Args:
+        target: Array of shape (n,).
+        others: Array or DataFrame of shape (n, k).
+        windows: Window length or list of window lengths.
+        out: Optional (n, len(windows) * k) array to write into (any float dtype).
+        block: Rows per cumulative-sum block.
+
+    Returns:
+        np.ndarray: Shape (n, len(windows) * k); column w * k + j holds column j
+        at windows[w].
+    """
+    windows = [windows] if np.isscalar(windows) else list(windows)
+    x = np.asarray(target, dtype=np.float64)[None, :]
+    n, k = len(x[0]), others.shape[1]
+    if out is None:
+        out = np.empty((len(windows) * k, n), dtype=np.float64).T
+    out[:min(n, max(windows) - 1)] = np.nan
+    if n == 0 or k == 0:
+        return out
+
+    block = max(block, max(windows))
+    x, x_missing = _centered(x)
+    x_sums = [_blocked_cumsum(x, block), _blocked_cumsum(x * x, block)]
+    x_bad = None if x_missing is None else _blocked_cumsum(x_missing, block)
+    padded = x_sums[0][0].shape[1]
+
+    def window_sum(sums, window, rows):
+        return _blocked_window_sum(sums[0], sums[1], block, window, np.empty((rows, padded)))
+
+    x_window = {}
+    for window in windows:
+        sx, sxx = (window_sum(sums, window, 1) for sums in x_sums)
+        bad = None if x_bad is None else window_sum(x_bad, window, 1) > 0.5
+        x_window[window] = (sx, sxx, bad)
+    del x_sums, x_bad
+
+    chunk = max(1, _CORR_CHUNK_ELEMENTS // padded)
+    for lo in range(0, k, chunk):
+        hi = min(k, lo + chunk)
+        rows = others.iloc[:, lo:hi] if isinstance(others, pd.DataFrame) else others[:, lo:hi]
+        y, y_missing = _centered(np.asarray(rows, dtype=np.float64).T)
+        y_sums = [_blocked_cumsum(y, block), _blocked_cumsum(y * y, block)]
+        y *= x
+        y_sums.append(_blocked_cumsum(y, block))
+        y_bad = None if y_missing is None else _blocked_cumsum(y_missing, block)
+        del y, y_missing
+
+        sy, syy, sxy = (np.empty((hi - lo, padded)) for _ in range(3))
+        for w_index, window in enumerate(windows):
+            sx, sxx, x_bad_window = x_window[window]
+            for sums, buffer in zip(y_sums, (sy, syy, sxy)):
+                _blocked_window_sum(sums[0], sums[1], block, window, buffer)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                # Centered sums of squares/products: S_ab - S_a * S_b / w, in place
+                var_x = sxx - sx * sx / window
+                undefined_x = var_x <= _VAR_RTOL * sxx
+                sxy -= sx * sy / window
+                np.multiply(sy, sy, out=sy)
+                sy /= window
+                np.subtract(syy, sy, out=sy)
+                undefined = sy <= _VAR_RTOL * syy
+                np.sqrt(sy, out=sy)
+                sy *= np.sqrt(var_x)
+                sxy /= sy
+                np.clip(sxy, -1.0, 1.0, out=sxy)
+
+            undefined |= undefined_x
+            if x_bad_window is not None:
+                undefined |= x_bad_window
+            if y_bad is not None:
+                undefined |= _blocked_window_sum(y_bad[0], y_bad[1], block, window, sy) > 0.5
+            sxy[undefined] = np.nan
+
+            corr = sxy[:, :n].T
+            corr[:window - 1] = np.nan
+            col = w_index * k
+            out[:, col + lo:col + hi] = corr
+    return out
 
 class CorrelationTransformer:
     """
     Computes rolling correlations between assets.
     """
-    
-    def transform(self, df: pd.DataFrame, target_col: str, window: int = 30) -> pd.DataFrame:
+
+    def __init__(self, dtype=np.float64):
+        """
+        Args:
+            dtype: Storage dtype of the correlation columns (computed in float64).
+        """
+        self.dtype = dtype
+
+    def transform(self, df: pd.DataFrame, target_col: str, window: Union[int, Sequence[int]] = 30) -> pd.DataFrame:
         """
         Appends rolling correlation columns to the dataframe.
         Args:
             df: DataFrame containing multiple asset prices.
             target_col: The primary asset column name (e.g., 'Close').
-            window: Rolling window size.
+            window: Rolling window size, or a list of sizes (one set of columns per window).
             
         Returns:
             DataFrame with new correlation columns.
         """
-        df_out = df.copy()
-        
         # Assume other columns are potential correlates
         # We need to distinguish feature columns from raw asset columns.
         # In this architecture, we likely merged macro data resulting in columns like 'Gold', 'Oil'.
-        
-        # Iterate over columns that are NOT the target
-        for col in df.columns:
-            if col == target_col:
-                continue
-            
-            # Skip if column is not numeric
-            if not pd.api.types.is_numeric_dtype(df[col]):
-                continue
-                
-            col_name = f"Corr_{col}_{window}"
-            df_out[col_name] = df[target_col].rolling(window=window).corr(df[col])
-            
-        return df_out
+        windows = [window] if np.isscalar(window) else list(window)
+
+        # Iterate over columns that are NOT the target, skipping non-numeric ones
+        sources = [col for col in df.columns
+                   if col != target_col and pd.api.types.is_numeric_dtype(df[col])]
+        names = [f"Corr_{col}_{w}" for w in windows for col in sources]
+
+        # All columns and windows in one pass over a 2-D array, written into one
+        # preallocated block and attached with a single concat
+        block = np.empty((len(names), len(df)), dtype=self.dtype).T
+        if sources:
+            rolling_corr(df[target_col].to_numpy(dtype=np.float64), df[sources], windows, out=block)
+        return attach_columns(df, block, names)
+
+    def warmup_bars(self, target_col: str = 'Close', window: Union[int, Sequence[int]] = 30) -> int:
+        """Bars of history that reproduce the latest row, for the same arguments as transform()."""
+        return int(np.max(window))
 
 class MarketAnalyzer:
     """
     Performs static analysis on market data.
     """
+
+    def __init__(self, correlation_engine: Optional[CorrelationEngine] = None):
+        """
+        Args:
+            correlation_engine: Engine for correlation matrices (blocked GEMMs, cached
+                                by data window); a default one is created if omitted.
+        """
+        self.correlation_engine = correlation_engine or CorrelationEngine()
     
     def calculate_correlation_matrix(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Returns the correlation matrix of the dataframe.
+        Returns the correlation matrix of the dataframe (pairwise-complete, like df.corr()).
         """
-        return df.corr()
+        return self.correlation_engine.correlation_matrix(df)
     
-    def plot_correlation_heatmap(self, df: pd.DataFrame, title: str = "Correlation Matrix"):
+    def plot_correlation_heatmap(self, df: pd.DataFrame, title: str = "Correlation Matrix",
+                                 annot: Optional[bool] = None):
         """
-        Plots a heatmap of correlations.
+        Plots a heatmap of correlations, with assets in hierarchical-clustering
+        order so correlated groups form blocks.
         
         Note: In a headless environment this might default to non-interactive backend.
+
+        Args:
+            annot: Print values in the cells; by default only for up to 20 assets.
         """
-        corr = df.corr()
-        plt.figure(figsize=(10, 8))
-        sns.heatmap(corr, annot=True, cmap='coolwarm', fmt=".2f")
+        corr = self.correlation_engine.clustered_matrix(df)
+        k = len(corr)
+        if annot is None:
+            annot = k <= 20
+
+        # Grow the figure with the universe but keep large ones renderable
+        size = min(24, max(8, 0.2 * k))
+        plt.figure(figsize=(size * 1.25, size))
+        sns.heatmap(corr, annot=annot, cmap='coolwarm', fmt=".2f", vmin=-1, vmax=1,
+                    xticklabels=k <= 80, yticklabels=k <= 80, rasterized=k > 80)
         plt.title(title)
         return plt
         
+    def streaming_correlation(self, columns: Sequence[str], window: Optional[int] = None,
+                              span: Optional[float] = None):
+        """
+        Incremental correlation matrix for live monitoring, updated in O(k^2) per bar.
+
+        Args:
+            columns: Series tracked (matrix labels).
+            window: Rolling window length (RollingCorrelationMatrix), or
+            span: EWM span (EWMCorrelationMatrix).
+        """
+        if (window is None) == (span is None):
+            raise ValueError("Specify exactly one of window or span")
+        if window is not None:
+            return RollingCorrelationMatrix(columns, window)
+        return EWMCorrelationMatrix(columns, span=span)
+
     def analyze_lag_correlation(self, target: pd.Series, feature: pd.Series, max_lag: int = 10) -> pd.Series:
         """
         Analyzes correlation at different lags to find leading indicators.
@@ -85,3 +271,74 @@ class MarketAnalyzer:
             corrs[lag] = corr
             
         return pd.Series(corrs, name="Lag_Correlation")
+
+    def analyze_lead_lag(self, target: pd.Series, features: pd.DataFrame, max_lag: int = 10) -> pd.DataFrame:
+        """
+        Lagged correlations of many candidate features against the target, for
+        every lag 1..max_lag at once.
+
+        Entry [feature, lag] equals target.corr(features[feature].shift(lag)):
+        the Pearson correlation over the pairs where both values are present.
+        The six pair sums (count, x, y, x^2, y^2, xy) are FFT cross-correlations
+        of the standardized series and their presence masks, so the cost is
+        O(k n log n) independent of max_lag.
+
+        Args:
+            target: The target series (e.g., BTC return).
+            features: Candidate leading series, aligned on the target's index.
+            max_lag: Maximum number of periods the features lead by.
+
+        Returns:
+            DataFrame with index=features, columns=lags 1..max_lag.
+        """
+        features = features.reindex(target.index)
+        lags = np.arange(1, max_lag + 1)
+        n = len(target)
+        result = np.full((features.shape[1], max_lag), np.nan)
+        if n == 0 or features.shape[1] == 0 or max_lag < 1:
+            return pd.DataFrame(result, index=features.columns, columns=pd.Index(lags, name="Lag"))
+
+        def standardized(values):
+            # z-scores over the present values keep the FFT sums well conditioned
+            present = ~np.isnan(values)
+            counts = np.maximum(present.sum(axis=-1, keepdims=True), 1)
+            filled = np.where(present, values, 0.0)
+            filled -= filled.sum(axis=-1, keepdims=True) / counts
+            filled[~present] = 0.0
+            scale = np.sqrt((filled * filled).sum(axis=-1, keepdims=True) / counts)
+            filled /= np.where(scale > 0, scale, 1.0)
+            return filled, present.astype(np.float64)
+
+        x, x_mask = standardized(target.to_numpy(dtype=np.float64)[None, :])
+        y, y_mask = standardized(features.to_numpy(dtype=np.float64).T)
+        if y_mask.all():
+            y_mask = y_mask[:1]  # one mask transform serves every feature
+
+        # Zero padding to n + max_lag removes circular wrap-around for the lags used
+        size = sp_fft.next_fast_len(n + max_lag, real=True)
+
+        def spectrum(values):
+            return sp_fft.rfft(values, size, axis=-1)
+
+        X, X2, Mx = spectrum(x), spectrum(x * x), spectrum(x_mask)
+        Y, Y2, My = (np.conj(spectrum(v)) for v in (y, y * y, y_mask))
+
+        def lagged(a, b):
+            # irfft(A * conj(B))[lag] = sum_t a[t] * b[t - lag]
+            return sp_fft.irfft(a * b, size, axis=-1)[:, 1:max_lag + 1]
+
+        count = np.rint(lagged(Mx, My))
+        sx, sxx = lagged(X, My), lagged(X2, My)
+        sy, syy = lagged(Mx, Y), lagged(Mx, Y2)
+        sxy = lagged(X, Y)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = sxy - sx * sy / count
+            var_x = sxx - sx * sx / count
+            var_y = syy - sy * sy / count
+            corr = cov / np.sqrt(var_x * var_y)
+        undefined = (count < 2) | (var_x <= 1e-10 * sxx) | (var_y <= 1e-10 * syy)
+        corr[undefined] = np.nan
+        result[:] = np.clip(corr, -1.0, 1.0)
+
+        return pd.DataFrame(result, index=features.columns, columns=pd.Index(lags, name="Lag"))
@@ -9,6 +9,14 @@ import os
 
 from .base import Predictor
 
+# Hidden-layer activations of MLPRegressor, for the NumPy fast path
+_ACTIVATIONS = {
+    'relu': lambda h: np.maximum(h, 0.0, out=h),
+    'tanh': lambda h: np.tanh(h, out=h),
+    'logistic': lambda h: np.reciprocal(1.0 + np.exp(-h, out=h), out=h),
+    'identity': lambda h: h,
+}
+
 class MLPPredictor(Predictor):
     """
     Predictor implementation using Scikit-learn MLPRegressor (Neural Network).
@@ -16,13 +24,19 @@ class MLPPredictor(Predictor):
     
     def __init__(self, hidden_layer_sizes: Tuple[int, ...] = (100, 50), 
                  activation: str = 'relu', solver: str = 'adam', 
-                 max_iter: int = 500, random_state: int = 42):
-        
+                 max_iter: int = 500, random_state: int = 42, dtype=np.float64):
+        """
+        Args:
+            dtype: Dtype of the scaled feature matrix; np.float32 halves memory
+                   and trains the network in single precision.
+        """
+
         self.hidden_layer_sizes = hidden_layer_sizes
         self.activation = activation
         self.solver = solver
         self.max_iter = max_iter
         self.random_state = random_state
+        self.dtype = dtype
         
         # Neural Networks result require scaling
         self.scaler_X = StandardScaler()
@@ -39,18 +53,20 @@ class MLPPredictor(Predictor):
         )
         
         self.is_fitted = False
+        self._fast_layers = None
         
     def train(self, X: pd.DataFrame, y: pd.Series) -> None:
         """
         Train the MLP model. Autoscales data.
         """
         # Fit scalers
-        X_scaled = self.scaler_X.fit_transform(X)
+        X_scaled = self.scaler_X.fit_transform(self._cast(X))
         y_scaled = self.scaler_y.fit_transform(y.values.reshape(-1, 1))
         
         # Train
         self.model.fit(X_scaled, y_scaled.ravel())
         self.is_fitted = True
+        self._fast_layers = None
         
     def predict(self, X: pd.DataFrame) -> pd.Series:
         """
@@ -59,13 +75,53 @@ class MLPPredictor(Predictor):
         if not self.is_fitted:
             raise RuntimeError("Model is not trained yet.")
             
-        X_scaled = self.scaler_X.transform(X)
+        X_scaled = self.scaler_X.transform(self._cast(X))
         preds_scaled = self.model.predict(X_scaled)
         
         # Inverse transform to get actual price/value
         preds = self.scaler_y.inverse_transform(preds_scaled.reshape(-1, 1))
         
         return pd.Series(preds.flatten(), index=X.index)
+
+    def predict_batch_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        Low-latency predictions for a 2-D array whose columns are in training
+        order. Runs the forward pass in NumPy with both scalers folded into the
+        first and last layer weights, skipping pandas and sklearn validation.
+        """
+        if not self.is_fitted:
+            raise RuntimeError("Model is not trained yet.")
+        if self._fast_layers is None:
+            self._fast_layers = self._fold_layers()
+        activation = _ACTIVATIONS[self.model.activation]
+        h = np.asarray(X, dtype=np.float64)
+        for W, b in self._fast_layers[:-1]:
+            h = activation(h @ W + b)
+        W, b = self._fast_layers[-1]
+        return (h @ W + b)[:, 0]
+
+    def predict_one(self, row: np.ndarray) -> float:
+        """Prediction for a single feature row (1-D array in training column order)."""
+        return float(self.predict_batch_array(np.reshape(row, (1, -1)))[0])
+
+    def _fold_layers(self):
+        """Network weights with the input scaling and output unscaling folded in."""
+        weights = [W.astype(np.float64) for W in self.model.coefs_]
+        biases = [b.astype(np.float64) for b in self.model.intercepts_]
+        # (x - mean) / scale @ W + b == x @ (W / scale) + (b - (mean / scale) @ W)
+        mean, scale = self.scaler_X.mean_, self.scaler_X.scale_
+        biases[0] = biases[0] - (mean / scale) @ weights[0]
+        weights[0] = weights[0] / scale[:, None]
+        # Identity output layer, so the target unscaling is affine as well
+        weights[-1] = weights[-1] * self.scaler_y.scale_
+        biases[-1] = biases[-1] * self.scaler_y.scale_ + self.scaler_y.mean_
+        return list(zip(weights, biases))
+
+    def _cast(self, X: pd.DataFrame) -> pd.DataFrame:
+        # StandardScaler keeps float32 inputs in float32
+        if (X.dtypes == self.dtype).all():
+            return X
+        return X.astype(self.dtype)
         
     def save(self, path: str) -> None:
         """
@@ -91,3 +147,4 @@ class MLPPredictor(Predictor):
         self.scaler_X = data['scaler_X']
         self.scaler_y = data['scaler_y']
         self.is_fitted = data['is_fitted']
+        self._fast_layers = None
@@ -0,0 +1,152 @@
+import json
+import os
+import time
+import pandas as pd
+from typing import Any, Dict, Optional, Union
+from .base import Predictor
+from .feature_store import _hash_bytes, _plain
+
+class ModelRegistry:
+    """
+    On-disk registry of trained predictors, so unchanged analyses reuse a
+    model instead of retraining it.
+
+    A model's identity is the symbol, horizon, predictor class, feature set
+    (column names and dtypes) and hyperparameters (the predictor's plain
+    attributes, as in FeatureStore). Each entry also records the end date of
+    its training data. load() restores the newest entry of the same identity
+    whose training data ends no earlier than `max_age` before the requested
+    end (and never after it). Artifacts are written with Predictor.save and
+    read back with Predictor.load.
+    """
+
+    def __init__(self, data_dir: str = "./data/models", max_age: Union[str, pd.Timedelta] = '1D',
+                 keep: int = 2):
+        """
+        Args:
+            data_dir: Directory for model artifacts and the index.
+            max_age: How far the stored training end may lag the requested one.
+            keep: Entries kept per identity; older ones are deleted on save.
+        """
+        self.data_dir = data_dir
+        self.max_age = pd.Timedelta(max_age)
+        self.keep = keep
+        os.makedirs(self.data_dir, exist_ok=True)
+        self.index_file = os.path.join(self.data_dir, "index.json")
+        self.entries: Dict[str, Dict[str, Any]] = self._load_index()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, predictor: Predictor, symbol: str, horizon: int, features: pd.DataFrame,
+             data_end: Optional[pd.Timestamp] = None) -> bool:
+        """
+        Loads a fresh-enough stored model into `predictor` (constructed with the
+        wanted hyperparameters but untrained).
+
+        Args:
+            predictor: Untrained predictor; its parameters are part of the identity.
+            symbol: Asset symbol.
+            horizon: Forecast horizon in bars.
+            features: Training feature frame (columns, dtypes and last date are used).
+            data_end: End of the training data (default: last index of `features`).
+
+        Returns:
+            bool: True if a model was loaded, False if the caller has to train.
+        """
+        identity = self._identity(predictor, symbol, horizon, features)
+        data_end = pd.Timestamp(data_end if data_end is not None else features.index[-1])
+
+        candidates = [e for e in self.entries.values()
+                      if e["identity"] == identity
+                      and data_end - self.max_age <= pd.Timestamp(e["data_end"]) <= data_end]
+        for entry in sorted(candidates, key=lambda e: e["data_end"], reverse=True):
+            try:
+                predictor.load(self._path(entry["key"]))
+            except (OSError, ValueError):
+                self._remove(entry["key"])
+                continue
+            entry["last_access"] = time.time()
+            self._save_index()
+            self.hits += 1
+            return True
+
+        self.misses += 1
+        return False
+
+    def save(self, predictor: Predictor, symbol: str, horizon: int, features: pd.DataFrame,
+             data_end: Optional[pd.Timestamp] = None) -> str:
+        """
+        Stores a trained predictor. Returns the artifact path prefix.
+        """
+        identity = self._identity(predictor, symbol, horizon, features)
+        data_end = str(pd.Timestamp(data_end if data_end is not None else features.index[-1]))
+        key = _hash_bytes(identity.encode(), data_end.encode())
+
+        predictor.save(self._path(key))
+        self.entries[key] = {
+            "key": key,
+            "identity": identity,
+            "symbol": symbol,
+            "horizon": horizon,
+            "model_type": type(predictor).__name__,
+            "data_end": data_end,
+            "created": time.time(),
+            "last_access": time.time(),
+        }
+        self._prune(identity)
+        self._save_index()
+        return self._path(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and number of stored models."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries)}
+
+    def clear(self) -> None:
+        """Deletes every stored model."""
+        for key in list(self.entries):
+            self._remove(key)
+        self._save_index()
+
+    def _identity(self, predictor: Predictor, symbol: str, horizon: int, features: pd.DataFrame) -> str:
+        # Training state is not a hyperparameter: the identity must match before and after fitting
+        params = {k: _plain(v) for k, v in vars(predictor).items()
+                  if not k.startswith('_') and k != 'is_fitted'}
+        params = {k: v for k, v in params.items() if v is not None}
+        description = {
+            "symbol": symbol,
+            "horizon": horizon,
+            "model_type": type(predictor).__name__,
+            "features": [[str(c), str(t)] for c, t in features.dtypes.items()],
+            "params": params,
+        }
+        return _hash_bytes(json.dumps(description, sort_keys=True).encode())
+
+    def _prune(self, identity: str) -> None:
+        same = sorted((e for e in self.entries.values() if e["identity"] == identity),
+                      key=lambda e: e["data_end"], reverse=True)
+        for entry in same[self.keep:]:
+            self._remove(entry["key"])
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.data_dir, f"{key}.model")
+
+    def _remove(self, key: str) -> None:
+        self.entries.pop(key, None)
+        # Predictors may write several files sharing the path prefix (e.g. .reg/.cls)
+        prefix = f"{key}.model"
+        for name in os.listdir(self.data_dir):
+            if name.startswith(prefix):
+                os.remove(os.path.join(self.data_dir, name))
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.index_file):
+            return {}
+        try:
+            with open(self.index_file, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def _save_index(self) -> None:
+        with open(self.index_file, 'w') as f:
+            json.dump(self.entries, f, indent=4)
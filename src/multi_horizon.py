@@ -0,0 +1,142 @@
+import pandas as pd
+import numpy as np
+import pickle
+import xgboost as xgb
+from sklearn.neural_network import MLPRegressor
+from sklearn.preprocessing import StandardScaler
+from typing import Sequence
+
+from .base import Predictor
+
+def horizon_targets(close: pd.Series, horizons: Sequence[int] = (1, 7, 30),
+                    kind: str = 'price') -> pd.DataFrame:
+    """
+    Label matrix with one column per horizon: the close `h` bars ahead
+    (kind='price') or the return to it (kind='return'). Rows without a
+    future value for a horizon are NaN in that column.
+    """
+    if kind not in ('price', 'return'):
+        raise ValueError(f"Unknown target kind '{kind}'")
+    values = close.to_numpy(dtype=np.float64)
+    n = len(values)
+    labels = np.full((n, len(horizons)), np.nan)
+    for j, h in enumerate(horizons):
+        labels[:max(n - h, 0), j] = values[h:]
+    if kind == 'return':
+        labels = labels / values[:, None] - 1
+    return pd.DataFrame(labels, index=close.index, columns=pd.Index(list(horizons), name='Horizon'))
+
+class MultiHorizonPredictor(Predictor):
+    """
+    One model for all forecast horizons.
+
+    model='xgb' trains a single multi-target XGBoost model (multi_strategy
+    'multi_output_tree' grows trees with vector leaves shared by all horizons;
+    'one_output_per_tree' keeps per-horizon trees in one booster).
+    model='mlp' trains a shared-trunk MLP whose output layer has one unit per
+    horizon. Targets are standardized per horizon so no horizon dominates the
+    shared splits / loss. predict() returns every horizon from one call.
+    """
+
+    def __init__(self, horizons: Sequence[int] = (1, 7, 30), model: str = 'xgb',
+                 feature_dtype=np.float32, **kwargs):
+        """
+        Args:
+            horizons: Forecast horizons in bars (label matrix column order).
+            model: 'xgb' or 'mlp'.
+            feature_dtype: Dtype inputs are cast to.
+            **kwargs: Overrides of the XGBRegressor / MLPRegressor parameters.
+        """
+        if model == 'xgb':
+            self.params = {
+                'objective': 'reg:squarederror',
+                'tree_method': 'hist',
+                'multi_strategy': 'multi_output_tree',
+                'n_estimators': 100,
+                'learning_rate': 0.1,
+                'max_depth': 5
+            }
+        elif model == 'mlp':
+            self.params = {
+                'hidden_layer_sizes': (100, 50),
+                'max_iter': 500,
+                'random_state': 42,
+                'early_stopping': True,
+                'validation_fraction': 0.1
+            }
+        else:
+            raise ValueError(f"Unknown model '{model}'")
+        self.params.update(kwargs)
+        self.horizons = list(horizons)
+        self.model_type = model
+        self.feature_dtype = feature_dtype
+
+        self.model = xgb.XGBRegressor(**self.params) if model == 'xgb' else MLPRegressor(**self.params)
+        self.scaler_X = StandardScaler()
+        self.scaler_y = StandardScaler()
+        self.is_fitted = False
+
+    def train(self, X: pd.DataFrame, y: pd.DataFrame) -> None:
+        """
+        Train on a label matrix (e.g. from horizon_targets). Rows missing any
+        horizon's label are skipped.
+        """
+        labels = y.reindex(columns=self.horizons).to_numpy(dtype=np.float64)
+        complete = ~np.isnan(labels).any(axis=1)
+        features = self._features(X, fit=True)[complete]
+        self.model.fit(features, self.scaler_y.fit_transform(labels[complete]))
+        self.is_fitted = True
+
+    def predict(self, X: pd.DataFrame) -> pd.DataFrame:
+        """
+        Predictions for every horizon.
+
+        Returns:
+            pd.DataFrame: Index of X, one column per horizon.
+        """
+        if not self.is_fitted:
+            raise RuntimeError("Model is not trained yet.")
+        scaled = self.model.predict(self._features(X)).reshape(len(X), -1)
+        return pd.DataFrame(self.scaler_y.inverse_transform(scaled), index=X.index,
+                            columns=pd.Index(self.horizons, name='Horizon'))
+
+    def _features(self, X: pd.DataFrame, fit: bool = False) -> np.ndarray:
+        values = X.to_numpy(dtype=self.feature_dtype)
+        if self.model_type == 'xgb':
+            return values
+        # The network needs scaled inputs; trees do not
+        return self.scaler_X.fit_transform(values) if fit else self.scaler_X.transform(values)
+
+    def save(self, path: str) -> None:
+        """
+        Save model, scalers and the settings needed to rebuild the inputs using pickle.
+        """
+        data = {
+            'model': self.model,
+            'model_type': self.model_type,
+            'feature_dtype': self.feature_dtype,
+            'params': self.params,
+            'scaler_X': self.scaler_X,
+            'scaler_y': self.scaler_y,
+            'horizons': self.horizons,
+            'is_fitted': self.is_fitted
+        }
+        with open(path, 'wb') as f:
+            pickle.dump(data, f)
+
+    def load(self, path: str) -> None:
+        """
+        Load model and scalers. The saved model type and feature dtype replace
+        this instance's, so any MultiHorizonPredictor can load any saved file.
+        """
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+
+        self.model = data['model']
+        self.model_type = data['model_type']
+        self.feature_dtype = data['feature_dtype']
+        self.params = data['params']
+        self.scaler_X = data['scaler_X']
+        self.scaler_y = data['scaler_y']
+        self.horizons = data['horizons']
+        self.is_fitted = data['is_fitted']
@@ -0,0 +1,155 @@
+import math
+import numbers
+import pandas as pd
+from typing import Dict, Union
+from .feature_engineering import INDICATOR_COLUMNS
+
+class _RollingMean:
+    """
+    Fixed-size ring buffer with a running sum (O(1) per update).
+
+    Like pandas rolling(window).mean(), the mean is NaN while a NaN is in the
+    window; NaNs are counted rather than summed so they cannot poison the sum.
+    """
+    __slots__ = ('window', 'buffer', 'missing', 'pos', 'count', 'total', 'nans')
+
+    def __init__(self, window: int):
+        self.window = window
+        self.buffer = [0.0] * window
+        self.missing = [False] * window
+        self.pos = 0
+        self.count = 0
+        self.total = 0.0
+        self.nans = 0
+
+    def update(self, x: float) -> float:
+        if self.count >= self.window:
+            self.total -= self.buffer[self.pos]
+            self.nans -= self.missing[self.pos]
+        else:
+            self.count += 1
+        missing = x != x
+        self.missing[self.pos] = missing
+        self.nans += missing
+        if missing:
+            x = 0.0
+        self.buffer[self.pos] = x
+        self.total += x
+
+        self.pos += 1
+        if self.pos == self.window:
+            self.pos = 0
+            # Re-sum once per cycle so floating point drift cannot build up
+            self.total = math.fsum(self.buffer)
+
+        if self.count < self.window or self.nans:
+            return math.nan
+        return self.total / self.window
+
+class _EMA:
+    """
+    Recursive EMA matching pandas ewm(span, adjust=False): seeded with the
+    first value. A NaN input leaves the value unchanged; as in pandas, the
+    old value then decays once more per skipped bar at the next observation.
+    """
+    __slots__ = ('alpha', 'value', 'weight')
+
+    def __init__(self, span: int):
+        self.alpha = 2.0 / (span + 1.0)
+        self.value = None
+        self.weight = 1.0
+
+    def update(self, x: float) -> float:
+        if self.value is None:
+            if x == x:
+                self.value = x
+            return math.nan if self.value is None else self.value
+        self.weight *= 1.0 - self.alpha
+        if x == x:
+            self.value = (self.weight * self.value + self.alpha * x) / (self.weight + self.alpha)
+            self.weight = 1.0
+        return self.value
+
+class OnlineIndicatorEngine:
+    """
+    Incremental version of TechnicalIndicatorTransformer for live loops.
+
+    Keeps O(1) state per indicator (ring buffers for SMA and RSI averages,
+    recursive EMAs) so each new bar costs a few microseconds instead of a
+    full-history recompute. After n bars, snapshot() equals row n of the
+    batch transform on the same closes, including closes with NaN gaps.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears all indicator state."""
+        self._sma_20 = _RollingMean(20)
+        self._sma_50 = _RollingMean(50)
+        self._ema_12 = _EMA(12)
+        self._ema_26 = _EMA(26)
+        self._signal = _EMA(9)
+        self._gain = _RollingMean(14)
+        self._loss = _RollingMean(14)
+        self._prev_close = None
+        self._state = {name: math.nan for name in INDICATOR_COLUMNS}
+        self.bars_seen = 0
+
+    def update(self, bar: Union[float, Dict[str, float], pd.Series]) -> Dict[str, float]:
+        """
+        Consumes one bar and returns the updated indicator snapshot.
+
+        Args:
+            bar: Close price, or a mapping / Series with a 'Close' entry.
+        """
+        close = float(bar) if isinstance(bar, numbers.Real) else float(bar['Close'])
+
+        # RSI: the batch version treats the first (undefined) change as zero
+        if self._prev_close is None:
+            gain = loss = 0.0
+        else:
+            delta = close - self._prev_close
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+        self._prev_close = close
+
+        avg_gain = self._gain.update(gain)
+        avg_loss = self._loss.update(loss)
+
+        ema_12 = self._ema_12.update(close)
+        ema_26 = self._ema_26.update(close)
+        macd = ema_12 - ema_26
+
+        state = self._state
+        state['SMA_20'] = self._sma_20.update(close)
+        state['SMA_50'] = self._sma_50.update(close)
+        state['EMA_12'] = ema_12
+        state['EMA_26'] = ema_26
+        state['MACD'] = macd
+        state['MACD_Signal'] = self._signal.update(macd)
+        state['RSI'] = self._rsi(avg_gain, avg_loss)
+
+        self.bars_seen += 1
+        return dict(state)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Returns the latest indicator values."""
+        return dict(self._state)
+
+    def warm_up(self, history: pd.DataFrame) -> Dict[str, float]:
+        """
+        Feeds a block of historical bars (needs a 'Close' column) and returns the final snapshot.
+        """
+        for close in history['Close'].to_numpy(dtype=float):
+            self.update(close)
+        return self.snapshot()
+
+    def _rsi(self, avg_gain: float, avg_loss: float) -> float:
+        # Same edge cases as the pandas version: no losses -> 100, flat window -> NaN
+        if math.isnan(avg_gain) or math.isnan(avg_loss):
+            return math.nan
+        if avg_loss == 0.0:
+            return math.nan if avg_gain == 0.0 else 100.0
+        rs = avg_gain / avg_loss
+        return 100.0 - (100.0 / (1.0 + rs))
@@ -15,7 +15,6 @@ class ModelOptimizer:
     def optimize_xgb(self):
         def objective(trial):
             param = {
-                'n_estimators': trial.suggest_int('n_estimators', 50, 500),
                 'learning_rate': trial.suggest_float('learning_rate', 0.01, 0.3),
                 'max_depth': trial.suggest_int('max_depth', 3, 10),
                 'subsample': trial.suggest_float('subsample', 0.5, 1.0),
@@ -26,22 +25,27 @@ class ModelOptimizer:
             # TimeSeries Cross-Validation
             tscv = TimeSeriesSplit(n_splits=3)
             scores = []
+            trees = []
             
             for train_index, test_index in tscv.split(self.X):
                 X_train, X_test = self.X.iloc[train_index], self.X.iloc[test_index]
                 y_train, y_test = self.y.iloc[train_index], self.y.iloc[test_index]
                 
-                model = XGBoostPredictor(**param)
+                # Trees are not searched: boost up to 500 and stop on the training tail
+                model = XGBoostPredictor(n_estimators=500, early_stopping_rounds=20,
+                                         validation_fraction=0.2, **param)
                 model.train(X_train, y_train)
                 preds = model.predict(X_test)
                 mse = mean_squared_error(y_test, preds)
                 scores.append(mse)
+                trees.append(model.best_iteration + 1)
                 
+            trial.set_user_attr('n_estimators', int(np.mean(trees)))
             return np.mean(scores)
 
         study = optuna.create_study(direction='minimize')
         study.optimize(objective, n_trials=self.n_trials)
-        return study.best_params
+        return dict(study.best_params, n_estimators=study.best_trial.user_attrs['n_estimators'])
 
     def optimize_mlp(self):
         def objective(trial):
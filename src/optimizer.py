@@ -9,10 +9,18 @@ from sklearn.model_selection import TimeSeriesSplit
 class Optimizer:
     """
     Hyperparameter optimizer using Optuna.
+
+    The number of trees is not searched: every fit boosts up to `max_trees`
+    with early stopping on the tail of its training fold, and the best trial's
+    average stopping point is returned as n_estimators.
     """
     
-    def __init__(self, n_trials: int = 20):
+    def __init__(self, n_trials: int = 20, max_trees: int = 300, early_stopping_rounds: int = 20,
+                 validation_fraction: float = 0.2):
         self.n_trials = n_trials
+        self.max_trees = max_trees
+        self.early_stopping_rounds = early_stopping_rounds
+        self.validation_fraction = validation_fraction
         
     def optimize_xgboost(self, X: pd.DataFrame, y: pd.Series) -> Dict[str, Any]:
         """
@@ -28,7 +36,8 @@ class Optimizer:
                 'subsample': trial.suggest_float('subsample', 0.5, 1.0),
                 'colsample_bytree': trial.suggest_float('colsample_bytree', 0.5, 1.0),
                 'learning_rate': trial.suggest_float('learning_rate', 0.01, 0.3, log=True),
-                'n_estimators': trial.suggest_int('n_estimators', 50, 300),
+                'n_estimators': self.max_trees,
+                'early_stopping_rounds': self.early_stopping_rounds,
                 'max_depth': trial.suggest_int('max_depth', 3, 9),
                 'min_child_weight': trial.suggest_int('min_child_weight', 1, 10),
             }
@@ -36,23 +45,30 @@ class Optimizer:
             # Time Series Cross Validation
             tscv = TimeSeriesSplit(n_splits=3)
             scores = []
+            trees = []
             
             for train_index, valid_index in tscv.split(X):
                 X_train, X_valid = X.iloc[train_index], X.iloc[valid_index]
                 y_train, y_valid = y.iloc[train_index], y.iloc[valid_index]
                 
+                # Early stopping on the tail of the training fold; the validation fold stays unseen
+                n_fit = len(X_train) - max(1, int(len(X_train) * self.validation_fraction))
                 model = xgb.XGBRegressor(**param)
-                model.fit(X_train, y_train)
-                preds = model.predict(X_valid)
+                model.fit(X_train.iloc[:n_fit], y_train.iloc[:n_fit],
+                          eval_set=[(X_train.iloc[n_fit:], y_train.iloc[n_fit:])], verbose=False)
+                preds = model.predict(X_valid, iteration_range=(0, model.best_iteration + 1))
                 rmse = np.sqrt(mean_squared_error(y_valid, preds))
                 scores.append(rmse)
-                
+                trees.append(model.best_iteration + 1)
+            
+            trial.set_user_attr('n_estimators', int(np.mean(trees)))
             return np.mean(scores)
 
         study = optuna.create_study(direction='minimize')
         study.optimize(objective, n_trials=self.n_trials)
         
+        best_params = dict(study.best_trial.params, n_estimators=study.best_trial.user_attrs['n_estimators'])
         print(f"Best trial: {study.best_trial.value}")
-        print(f"Best params: {study.best_trial.params}")
+        print(f"Best params: {best_params}")
         
-        return study.best_trial.params
+        return best_params
@@ -56,7 +56,7 @@ def render_memory_page():
     # --- Visualization ---
     
     # --- Visualization Tabs ---
-    tab1, tab2 = st.tabs(["📉 Event Timeline", "📊 Pattern Recognition"])
+    tab1, tab2, tab3 = st.tabs(["📉 Event Timeline", "📊 Pattern Recognition", "🔁 Historical Analogs"])
     
     with tab1:
         # Create Chart
@@ -208,5 +208,58 @@ def render_memory_page():
                         det_df = pd.DataFrame(res['details'])
                         st.dataframe(det_df.style.format({"return": "{:+.2%}"}))
 
+    with tab3:
+        st.subheader("🔁 When did the market last look like this?")
+        st.markdown("Finds the past windows whose shape is closest to the latest price window.")
+
+        col_an1, col_an2, col_an3 = st.columns(3)
+        window = col_an1.number_input("Window (bars)", min_value=5, max_value=250, value=30)
+        top_k = col_an2.number_input("Analogs", min_value=1, max_value=20, value=5)
+        horizon = col_an3.number_input("Look-ahead (bars)", min_value=1, max_value=90, value=7)
+
+        if st.button("Find Analogs"):
+            from src.analog_search import AnalogSearch
+            # Events are read fresh; only the price index is cached
+            search = AnalogSearch(memory=mm)
+            with st.spinner(f"Searching {symbol} history..."):
+                try:
+                    search.add(symbol, get_analog_index(symbol, df.index[-1], df))
+                    analogs = search.search(symbol, window=int(window), top_k=int(top_k), horizon=int(horizon))
+                except (KeyError, ValueError) as e:
+                    st.warning(f"Analog search failed: {e}")
+                    analogs = None
+
+            if analogs is not None and not analogs.empty:
+                m1, m2 = st.columns(2)
+                m1.metric("Avg Look-ahead Return", f"{analogs['forward_return'].mean() * 100:+.2f}%")
+                m2.metric("Positive Outcomes", f"{(analogs['forward_return'] > 0).mean() * 100:.0f}%")
+
+                table = analogs.drop(columns=['events']).copy()
+                table['events'] = ["; ".join(e['description'] for e in evts) for evts in analogs['events']]
+                st.dataframe(table.style.format({"distance": "{:.2f}", "correlation": "{:.3f}",
+                                                 "forward_return": "{:+.2%}"}),
+                             use_container_width=True)
+            elif analogs is not None:
+                st.info("No analogs found for this window.")
+
+@st.cache_resource(max_entries=8)
+def get_analog_index(symbol: str, last_timestamp: pd.Timestamp, _recent: pd.DataFrame):
+    """
+    Analog index over ~10 years of `symbol` history ending with the bars just
+    fetched for the page. Keyed on the latest bar, so a new bar rebuilds it.
+    """
+    from src.analog_search import AnalogIndex
+    close = _recent['Close']
+    history_start = last_timestamp - timedelta(days=365 * 10)
+    if close.index[0] > history_start:
+        try:
+            older = YahooFinanceProvider().fetch_history(symbol, start=history_start.strftime('%Y-%m-%d'),
+                                                         end=close.index[0].strftime('%Y-%m-%d'))
+            close = pd.concat([older['Close'], close])
+        except ValueError:
+            pass  # No older history: search the fetched period alone
+    close = close[~close.index.duplicated(keep='last')]
+    return AnalogIndex(close.sort_index())
+
 if __name__ == "__main__":
     render_memory_page()
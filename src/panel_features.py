@@ -0,0 +1,106 @@
+import warnings
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Sequence
+from .feature_engineering import ema, rolling_mean, rsi
+
+class PanelIndicatorTransformer:
+    """
+    Computes technical indicators for a whole universe at once.
+
+    Takes a (dates x symbols) Close panel (and optionally Volume) and runs
+    every indicator kernel on the 2-D array along the date axis, so a
+    500-symbol universe costs about as much as a few single-symbol runs.
+    Also adds per-date cross-sectional ranks and z-scores.
+    """
+
+    def __init__(self, cross_sectional: Sequence[str] = ('Return_1', 'RSI', 'Volume_Ratio_20'),
+                 dtype=np.float64):
+        """
+        Args:
+            cross_sectional: Features that also get '<name>_Rank' and '<name>_ZScore'
+                             panels (scale-free features; ranking price levels is meaningless).
+            dtype: Storage dtype of the output panels.
+        """
+        self.cross_sectional = list(cross_sectional)
+        self.dtype = dtype
+
+    def transform(self, close: pd.DataFrame, volume: Optional[pd.DataFrame] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Args:
+            close: Close prices, index=dates, columns=symbols. Leading NaNs (not yet
+                   listed) are respected; interior gaps are forward filled.
+            volume: Optional volume panel with the same shape.
+
+        Returns:
+            Dict mapping feature name (e.g. 'SMA_20', 'RSI_Rank') to a dates x symbols DataFrame.
+            Each symbol's values match TechnicalIndicatorTransformer on its listed history.
+        """
+        index, columns = close.index, close.columns
+        raw = close.to_numpy(dtype=np.float64)
+        n = len(raw)
+
+        # Rows since each symbol's first valid close; negative before listing
+        listed = ~np.isnan(raw)
+        first = np.where(listed.any(axis=0), listed.argmax(axis=0), n)
+        age = np.arange(n)[:, None] - first[None, :]
+
+        # Interior gaps: carry the last price. Leading gaps: back fill with the
+        # first price, so EMAs are seeded exactly at listing; masked below.
+        prices = close.ffill().bfill().to_numpy(dtype=np.float64)
+
+        def masked(values: np.ndarray, window: int = 1) -> np.ndarray:
+            values[age < window - 1] = np.nan
+            return values
+
+        features: Dict[str, np.ndarray] = {
+            'SMA_20': masked(rolling_mean(prices, 20), 20),
+            'SMA_50': masked(rolling_mean(prices, 50), 50),
+        }
+        ema_12 = ema(prices, 12)
+        ema_26 = ema(prices, 26)
+        macd = ema_12 - ema_26
+        features['EMA_12'] = masked(ema_12)
+        features['EMA_26'] = masked(ema_26)
+        features['MACD_Signal'] = masked(ema(macd, 9))
+        features['MACD'] = masked(macd)
+        features['RSI'] = masked(rsi(prices, 14), 14)
+
+        returns = np.full(prices.shape, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(prices[1:], prices[:-1], out=returns[1:])
+        returns -= 1.0
+        features['Return_1'] = masked(returns, 2)
+
+        if volume is not None:
+            vol = volume.reindex(index=index, columns=columns).fillna(0.0).to_numpy(dtype=np.float64)
+            vol_sma = masked(rolling_mean(vol, 20), 20)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                features['Volume_Ratio_20'] = vol / vol_sma
+            features['Volume_SMA_20'] = vol_sma
+
+        out = {name: self._frame(values, index, columns) for name, values in features.items()}
+
+        for name in self.cross_sectional:
+            if name in features:
+                out[f"{name}_Rank"] = self._frame(self._rank(features[name]), index, columns)
+                out[f"{name}_ZScore"] = self._frame(self._zscore(features[name]), index, columns)
+        return out
+
+    def _frame(self, values: np.ndarray, index: pd.Index, columns: pd.Index) -> pd.DataFrame:
+        return pd.DataFrame(values.astype(self.dtype, copy=False), index=index, columns=columns, copy=False)
+
+    @staticmethod
+    def _zscore(values: np.ndarray) -> np.ndarray:
+        """Per-date z-score across symbols, ignoring NaNs."""
+        # All-NaN dates (nothing listed yet) legitimately give NaN
+        with np.errstate(divide='ignore', invalid='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mean = np.nanmean(values, axis=1, keepdims=True)
+            std = np.nanstd(values, axis=1, keepdims=True)
+            return (values - mean) / std
+
+    @staticmethod
+    def _rank(values: np.ndarray) -> np.ndarray:
+        """Per-date percentile rank across symbols (ties averaged, NaNs kept)."""
+        return pd.DataFrame(values).rank(axis=1, pct=True).to_numpy()
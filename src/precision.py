@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Sequence, Union
+from .base import Predictor
+
+# Storage dtype of feature matrices; the math that produces them stays float64
+FEATURE_DTYPE = np.float32
+COMPUTE_DTYPE = np.float64
+
+# Raw price columns stay exact: targets (future Close) are derived from them
+EXACT_COLUMNS = ('Open', 'High', 'Low', 'Close')
+
+class PrecisionPolicy:
+    """
+    Storage precision of feature frames.
+
+    Indicator, correlation and merge math runs in `compute_dtype`; the
+    resulting feature columns are stored in `feature_dtype` (float32 halves
+    memory and cache traffic, and XGBoost bins in float32 anyway). Columns in
+    `exact_columns` are never narrowed.
+    """
+
+    def __init__(self, feature_dtype=FEATURE_DTYPE, compute_dtype=COMPUTE_DTYPE,
+                 exact_columns: Sequence[str] = EXACT_COLUMNS):
+        """
+        Args:
+            feature_dtype: Storage dtype of feature columns.
+            compute_dtype: Dtype used for the arithmetic that produces them.
+            exact_columns: Columns kept in their original dtype.
+        """
+        self.feature_dtype = feature_dtype
+        self.compute_dtype = compute_dtype
+        self.exact_columns = list(exact_columns)
+
+    def cast_frame(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Narrows the float columns of `frame` (except exact columns) to feature_dtype.
+        Columns already in feature_dtype are not copied.
+        """
+        target = np.dtype(self.feature_dtype)
+        casts = {
+            col: target for col, dtype in frame.dtypes.items()
+            if col not in self.exact_columns and pd.api.types.is_float_dtype(dtype) and dtype != target
+        }
+        return frame.astype(casts) if casts else frame
+
+    def cast_matrix(self, X: Union[pd.DataFrame, np.ndarray]) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Casts a whole model input matrix to feature_dtype (no copy if it already is).
+        """
+        if isinstance(X, pd.DataFrame):
+            return X if (X.dtypes == self.feature_dtype).all() else X.astype(self.feature_dtype)
+        return np.asarray(X, dtype=self.feature_dtype)
+
+    def report(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Memory saved and round-off introduced by applying the policy to `frame`.
+
+        Returns:
+            pd.DataFrame: One row per column plus a 'Total' row with
+            bytes_before, bytes_after, max_abs_error and max_rel_error.
+        """
+        cast = self.cast_frame(frame)
+        rows = {}
+        for col in frame.columns:
+            before = frame[col]
+            after = cast[col]
+            row = {
+                'bytes_before': int(before.memory_usage(index=False, deep=True)),
+                'bytes_after': int(after.memory_usage(index=False, deep=True)),
+                'max_abs_error': 0.0,
+                'max_rel_error': 0.0,
+            }
+            if pd.api.types.is_numeric_dtype(before.dtype) and before.dtype != after.dtype:
+                exact = before.to_numpy(dtype=np.float64)
+                error = np.abs(after.to_numpy(dtype=np.float64) - exact)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    rel = np.where(exact != 0, error / np.abs(exact), 0.0)
+                if np.isfinite(error).any():
+                    row['max_abs_error'] = float(np.nanmax(error))
+                    row['max_rel_error'] = float(np.nanmax(rel))
+            rows[col] = row
+
+        report = pd.DataFrame.from_dict(rows, orient='index',
+                                        columns=['bytes_before', 'bytes_after', 'max_abs_error', 'max_rel_error'])
+        report.loc['Total'] = [report['bytes_before'].sum(), report['bytes_after'].sum(),
+                               report['max_abs_error'].max(), report['max_rel_error'].max()]
+        report[['bytes_before', 'bytes_after']] = report[['bytes_before', 'bytes_after']].astype(np.int64)
+        return report
+
+    def model_report(self, models: Dict[str, Callable[[type], Predictor]], X: pd.DataFrame,
+                     y: pd.Series, train_fraction: float = 0.8) -> pd.DataFrame:
+        """
+        Accuracy delta of training on feature_dtype instead of compute_dtype.
+
+        Each model is trained twice on the first `train_fraction` of the rows
+        (time ordered): on X in compute_dtype, and on X cast by the policy,
+        each time built with the matching dtype. Errors are measured on the
+        remaining rows.
+
+        Args:
+            models: Name -> factory taking a dtype and returning an untrained predictor.
+            X: Feature matrix (as produced in compute_dtype).
+            y: Target.
+
+        Returns:
+            pd.DataFrame: One row per model with rmse/mae for both dtypes, the
+            rmse delta (feature_dtype minus compute_dtype) and the largest
+            difference between the two models' predictions.
+        """
+        split = int(len(X) * train_fraction)
+        y_test = y.iloc[split:].to_numpy(dtype=np.float64)
+        wide, narrow = np.dtype(self.compute_dtype).name, np.dtype(self.feature_dtype).name
+        runs = [(wide, self.compute_dtype, X.astype(self.compute_dtype)),
+                (narrow, self.feature_dtype, self.cast_matrix(X))]
+
+        rows = {}
+        for name, make in models.items():
+            row, predictions = {}, []
+            for label, dtype, features in runs:
+                predictor = make(dtype)
+                predictor.train(features.iloc[:split], y.iloc[:split])
+                predicted = np.asarray(predictor.predict(features.iloc[split:]), dtype=np.float64)
+                row[f'rmse_{label}'] = float(np.sqrt(np.mean((predicted - y_test) ** 2)))
+                row[f'mae_{label}'] = float(np.mean(np.abs(predicted - y_test)))
+                predictions.append(predicted)
+            row['rmse_delta'] = row[f'rmse_{narrow}'] - row[f'rmse_{wide}']
+            row['max_pred_diff'] = float(np.max(np.abs(predictions[1] - predictions[0])))
+            rows[name] = row
+        return pd.DataFrame.from_dict(rows, orient='index')
+
+DEFAULT_POLICY = PrecisionPolicy()
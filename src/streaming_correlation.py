@@ -0,0 +1,228 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Sequence, Union
+
+Bar = Union[Dict[str, float], pd.Series, np.ndarray, Sequence[float]]
+
+class _StreamingCorrelation:
+    """
+    Shared bar handling for the streaming correlation estimators.
+
+    Missing values in a bar carry the column's last value forward; a column
+    stays NaN in the matrix until it has been observed.
+    """
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = list(columns)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears all state."""
+        k = len(self.columns)
+        self._last = np.full(k, np.nan)
+        self._first_seen = np.full(k, -1, dtype=np.int64)
+        self.bars_seen = 0
+
+    def update(self, bar: Bar) -> pd.DataFrame:
+        """
+        Adds one bar (values per column) and returns the current matrix.
+        """
+        self._add(self._values(bar))
+        return self.snapshot()
+
+    def snapshot(self) -> pd.DataFrame:
+        """Returns the current correlation matrix."""
+        return pd.DataFrame(self._corr(), index=self.columns, columns=self.columns)
+
+    def warm_up(self, history: pd.DataFrame) -> pd.DataFrame:
+        """
+        Seeds the state from a history frame (rows oldest first), then returns the matrix.
+        """
+        values = history.reindex(columns=self.columns).to_numpy(dtype=np.float64)
+        for row in values:
+            self._add(self._carry(row))
+        return self.snapshot()
+
+    def _values(self, bar: Bar) -> np.ndarray:
+        if isinstance(bar, (dict, pd.Series)):
+            row = np.array([bar.get(col, np.nan) for col in self.columns], dtype=np.float64)
+        else:
+            row = np.asarray(bar, dtype=np.float64)
+            if row.shape != (len(self.columns),):
+                raise ValueError(f"Expected {len(self.columns)} values per bar, got {row.shape}")
+        return self._carry(row)
+
+    def _carry(self, row: np.ndarray) -> np.ndarray:
+        present = ~np.isnan(row)
+        self._first_seen[present & (self._first_seen < 0)] = self.bars_seen
+        self._last[present] = row[present]
+        self.bars_seen += 1
+        # Columns never observed contribute zeros; they are masked in the result
+        return np.nan_to_num(self._last, nan=0.0)
+
+    def _observed_for(self, bars: int) -> np.ndarray:
+        """Columns observed on at least `bars` of the bars so far."""
+        return (self._first_seen >= 0) & (self.bars_seen - self._first_seen >= bars)
+
+    @staticmethod
+    def _normalize(cov: np.ndarray, valid: np.ndarray, min_var=0.0) -> np.ndarray:
+        # Columns whose variance is not above min_var are treated as constant
+        var = np.diag(cov).copy()
+        valid = valid & (var > min_var)
+        scale = np.sqrt(np.where(valid, var, 1.0))
+        corr = cov / scale[:, None] / scale[None, :]
+        np.clip(corr, -1.0, 1.0, out=corr)
+        corr[~valid, :] = np.nan
+        corr[:, ~valid] = np.nan
+        np.fill_diagonal(corr, np.where(valid, 1.0, np.nan))
+        return corr
+
+class RollingCorrelationMatrix(_StreamingCorrelation):
+    """
+    Rolling-window correlation matrix updated in O(k^2) per bar.
+
+    Keeps the last `window` bars in a ring buffer together with their sums
+    and cross-products: a new bar adds its outer product and the expiring one
+    is subtracted. Values are stored relative to a reference point, and the
+    sums are rebuilt from the buffer (re-centered on the window mean) every
+    `recompute_every` bars so floating point drift cannot accumulate. A
+    column that has been flat for a whole window is re-centered on its value
+    at once, so its sums are exactly zero rather than a rounding residue.
+    After n bars, snapshot() equals DataFrame.rolling(window).corr() at row n.
+    """
+
+    def __init__(self, columns: Sequence[str], window: int, recompute_every: Optional[int] = None):
+        """
+        Args:
+            columns: Series names (matrix labels).
+            window: Rolling window length in bars.
+            recompute_every: Bars between exact rebuilds of the sums (default: window).
+        """
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.window = window
+        self.recompute_every = recompute_every or window
+        super().__init__(columns)
+
+    def reset(self) -> None:
+        super().reset()
+        k = len(self.columns)
+        self._buffer = np.zeros((self.window, k))
+        self._center = None
+        self._sum = np.zeros(k)
+        self._cross = np.zeros((k, k))
+        self._since_rebuild = 0
+        self._prev = np.full(k, np.nan)
+        self._run = np.zeros(k, dtype=np.int64)
+
+    def _add(self, row: np.ndarray) -> None:
+        if self._center is None:
+            self._center = row.copy()
+        pos = (self.bars_seen - 1) % self.window
+        x = row - self._center
+
+        if self.bars_seen > self.window:
+            old = self._buffer[pos]
+            self._sum -= old
+            self._cross -= np.outer(old, old)
+        self._buffer[pos] = x
+        self._sum += x
+        self._cross += np.outer(x, x)
+
+        # Bars in a row each column has kept the same value
+        self._run = np.where(row == self._prev, self._run + 1, 1)
+        self._prev = row.copy()
+        flat = self._run == self.window
+        if flat.any():
+            self._recenter(flat)
+
+        self._since_rebuild += 1
+        if self._since_rebuild >= self.recompute_every:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        filled = self._buffer[:min(self.bars_seen, self.window)]
+        shift = filled.mean(axis=0)
+        self._buffer[:len(filled)] -= shift
+        self._center = self._center + shift
+        filled = self._buffer[:len(filled)]
+        self._sum = filled.sum(axis=0)
+        self._cross = filled.T @ filled
+        self._since_rebuild = 0
+
+    def _recenter(self, columns: np.ndarray) -> None:
+        # Every buffered value of these columns is the same: move their center onto
+        # it, which makes their deviations, sums and cross-products exactly zero
+        self._center[columns] += self._buffer[0, columns]
+        self._buffer[:, columns] = 0.0
+        self._sum[columns] = 0.0
+        self._cross[columns, :] = 0.0
+        self._cross[:, columns] = 0.0
+
+    def _corr(self) -> np.ndarray:
+        n = min(self.bars_seen, self.window)
+        k = len(self.columns)
+        if n < self.window:
+            return np.full((k, k), np.nan)
+        mean = self._sum / n
+        second = np.diag(self._cross) / n
+        cov = self._cross / n - np.outer(mean, mean)
+        # cross/n - mean^2 cancels; below the rounding error accumulated since the
+        # last rebuild (relative to the second moment) the variance is noise
+        min_var = (self._since_rebuild + self.window) * np.finfo(np.float64).eps * second
+        return self._normalize(cov, self._observed_for(self.window), min_var)
+
+class EWMCorrelationMatrix(_StreamingCorrelation):
+    """
+    Exponentially weighted correlation matrix updated in O(k^2) per bar.
+
+    Uses the recursive (West) update of the weighted mean and covariance, so
+    snapshot() equals DataFrame.ewm(..., adjust=False).corr() on the same bars.
+    """
+
+    def __init__(self, columns: Sequence[str], span: Optional[float] = None,
+                 halflife: Optional[float] = None, alpha: Optional[float] = None,
+                 min_periods: int = 2):
+        """
+        Args:
+            columns: Series names (matrix labels).
+            span / halflife / alpha: Decay, exactly one of them (pandas conventions).
+            min_periods: Bars a column needs before its correlations are reported.
+        """
+        given = [p is not None for p in (span, halflife, alpha)]
+        if sum(given) != 1:
+            raise ValueError("Specify exactly one of span, halflife or alpha")
+        if span is not None:
+            alpha = 2.0 / (span + 1.0)
+        elif halflife is not None:
+            alpha = 1.0 - np.exp(np.log(0.5) / halflife)
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.min_periods = min_periods
+        super().__init__(columns)
+
+    def reset(self) -> None:
+        super().reset()
+        k = len(self.columns)
+        self._mean = None
+        self._cov = np.zeros((k, k))
+
+    def _add(self, row: np.ndarray) -> None:
+        if self._mean is None:
+            self._mean = row.copy()
+            return
+        # A column seen for the first time starts its own history
+        new = self._first_seen == self.bars_seen - 1
+        if new.any():
+            self._mean[new] = row[new]
+            self._cov[new, :] = 0.0
+            self._cov[:, new] = 0.0
+        delta = row - self._mean
+        self._mean += self.alpha * delta
+        # cov <- (1 - a) * (cov + a * delta delta^T)
+        self._cov += self.alpha * np.outer(delta, delta)
+        self._cov *= 1.0 - self.alpha
+
+    def _corr(self) -> np.ndarray:
+        return self._normalize(self._cov.copy(), self._observed_for(self.min_periods))
@@ -0,0 +1,131 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import pandas as pd
+import xgboost as xgb
+from threadpoolctl import threadpool_limits
+
+from .base import Predictor
+
+# progress(done, total, key) is called in the calling thread as jobs finish
+ProgressCallback = Callable[[int, int, Hashable], None]
+
+class TrainingJob:
+    """
+    One independent training task: an untrained predictor and its data.
+
+    If `y_class` is given the predictor's direction classifier is trained too.
+    Predictors with quantize/train_shared (XGBoostPredictor) train both heads
+    from one quantized matrix.
+    """
+
+    def __init__(self, key: Hashable, predictor: Predictor, X: pd.DataFrame, y: pd.Series,
+                 y_class: Optional[pd.Series] = None):
+        self.key = key
+        self.predictor = predictor
+        self.X = X
+        self.y = y
+        self.y_class = y_class
+
+def _train(job: TrainingJob, threads: int, data: Optional[Any] = None,
+           ref: Optional[Any] = None) -> Predictor:
+    """
+    Runs one job with XGBoost limited to `threads` threads. Predictors with
+    train_shared train on `data`, or on a copy quantized with the bins of `ref`.
+    """
+    predictor = job.predictor
+    with xgb.config_context(nthread=threads):
+        if hasattr(predictor, 'train_shared'):
+            if data is None:
+                data = predictor.quantize(job.X, ref=ref)
+            predictor.train_shared(data, job.y, job.y_class)
+        else:
+            predictor.train(job.X, job.y)
+            if job.y_class is not None:
+                predictor.train_classifier(job.X, job.y_class)
+    return predictor
+
+class TrainingScheduler:
+    """
+    Trains independent jobs (e.g. horizon x model type) on a thread pool.
+
+    Jobs run in-process: XGBoost and the BLAS kernels release the GIL, so
+    threads train concurrently without re-importing libraries or copying the
+    data into worker processes. Each distinct frame is quantized once up
+    front. Run in sequence, jobs on that frame share the matrix; run
+    concurrently, the first job uses it and the others bin the frame into
+    their own copy with the same bin edges (a job swaps its labels into the
+    matrix it trains on), skipping the sketching pass. A global thread
+    budget is split between the number of concurrent jobs and the threads
+    each may use (XGBoost nthread, BLAS/OpenMP pools), so workers x threads
+    never exceeds the budget and cores are not oversubscribed.
+    """
+
+    def __init__(self, max_threads: Optional[int] = None, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_threads: Total thread budget (default: CPU count).
+            max_workers: Upper bound on concurrent jobs (default: one per job within the budget).
+        """
+        self.max_threads = max(1, max_threads or os.cpu_count() or 1)
+        self.max_workers = max_workers
+
+    def plan(self, n_jobs: int) -> Dict[str, int]:
+        """Worker threads and threads per job for `n_jobs` jobs."""
+        workers = min(max(n_jobs, 1), self.max_threads, self.max_workers or self.max_threads)
+        return {"workers": workers, "threads": max(1, self.max_threads // workers)}
+
+    def run(self, jobs: List[TrainingJob], progress: Optional[ProgressCallback] = None) -> Dict[Hashable, Predictor]:
+        """
+        Trains every job and returns the trained predictors by job key.
+
+        Args:
+            jobs: Jobs to run; keys must be unique.
+            progress: Called with (done, total, key) in the calling thread after each job completes.
+        """
+        plan = self.plan(len(jobs))
+        shared = self._quantize(jobs)
+        results: Dict[Hashable, Predictor] = {}
+
+        # BLAS/OpenMP limits are process-wide, so they are set once for all jobs
+        with threadpool_limits(limits=plan["threads"]):
+            if plan["workers"] == 1:
+                for job in jobs:
+                    results[job.key] = _train(job, plan["threads"], shared.get(self._matrix_key(job)))
+                    if progress:
+                        progress(len(results), len(jobs), job.key)
+                return results
+
+            owners = set()
+            with ThreadPoolExecutor(max_workers=plan["workers"]) as pool:
+                futures = {}
+                for job in jobs:
+                    matrix_key = self._matrix_key(job)
+                    data = ref = shared.get(matrix_key)
+                    if matrix_key in owners:
+                        data = None  # Concurrent job on the same frame: own copy, same bins
+                    owners.add(matrix_key)
+                    futures[pool.submit(_train, job, plan["threads"], data, ref)] = job.key
+                for future in as_completed(futures):
+                    key = futures[future]
+                    results[key] = future.result()
+                    if progress:
+                        progress(len(results), len(jobs), key)
+        return results
+
+    @staticmethod
+    def _matrix_key(job: TrainingJob) -> Hashable:
+        if hasattr(job.predictor, 'train_shared'):
+            return job.predictor.quantize_key(job.X)
+        return None
+
+    def _quantize(self, jobs: List[TrainingJob]) -> Dict[Hashable, Any]:
+        """Quantizes each distinct (frame, settings) once, with the whole thread budget."""
+        shared: Dict[Hashable, Any] = {}
+        with xgb.config_context(nthread=self.max_threads):
+            for job in jobs:
+                key = self._matrix_key(job)
+                if key is not None and key not in shared:
+                    shared[key] = job.predictor.quantize(job.X)
+        return shared
@@ -2,18 +2,87 @@ import pandas as pd
 import numpy as np
 import pickle
 import xgboost as xgb
-from typing import Dict, Any
+from sklearn.exceptions import NotFittedError
+from typing import Dict, Any, Hashable, Optional, Tuple
 from .base import Predictor
 
+class RetrainPolicy:
+    """
+    Decides when incremental updates must give way to a full retrain.
+
+    A retrain is due after `max_updates` incremental updates, once the trees
+    added incrementally exceed `max_added_fraction` of the fully trained ones,
+    or when the model's RMSE on the new bars exceeds `max_error_ratio` times
+    the standard deviation of its training targets (the data has moved away
+    from what the trees were fitted on).
+    """
+
+    def __init__(self, max_updates: int = 30, max_added_fraction: float = 0.5,
+                 max_error_ratio: float = 0.5):
+        self.max_updates = max_updates
+        self.max_added_fraction = max_added_fraction
+        self.max_error_ratio = max_error_ratio
+
+    def reason(self, updates: int, base_rounds: int, added_rounds: int,
+               new_rmse: float, target_std: Optional[float]) -> Optional[str]:
+        """Why a full retrain is needed, or None if an incremental update is fine."""
+        if updates >= self.max_updates:
+            return f"{updates} incremental updates since the last full training"
+        if added_rounds > self.max_added_fraction * max(base_rounds, 1):
+            return f"{added_rounds} incremental trees on top of {base_rounds}"
+        if target_std and new_rmse > self.max_error_ratio * target_std:
+            return f"error on new bars {new_rmse:.4g} vs target std {target_std:.4g}"
+        return None
+
+# Direction classifier settings (shared by the sklearn and native training paths)
+CLASSIFIER_PARAMS = {
+    'objective': 'binary:logistic',
+    'n_estimators': 100,
+    'learning_rate': 0.1,
+    'max_depth': 5,
+    'eval_metric': 'logloss'
+}
+
+def _native_params(params: Dict[str, Any]):
+    """Splits sklearn-style parameters into xgb.train params and the number of rounds."""
+    params = dict(params)
+    rounds = params.pop('n_estimators', 100)
+    renames = {'n_jobs': 'nthread', 'random_state': 'seed'}
+    return {renames.get(k, k): v for k, v in params.items() if v is not None}, rounds
+
+class QuantizedFeatures:
+    """
+    Training rows quantized once by XGBoostPredictor.quantize, plus the tail
+    holdout (quantized with the same bins) when early stopping is enabled.
+    """
+
+    def __init__(self, train: xgb.QuantileDMatrix, valid: Optional[xgb.QuantileDMatrix], n_train: int):
+        self.train = train
+        self.valid = valid
+        self.n_train = n_train
+
 class XGBoostPredictor(Predictor):
     """
     Predictor implementation using XGBoost.
     """
     
-    def __init__(self, **kwargs):
+    def __init__(self, feature_dtype=np.float32, early_stopping_rounds: Optional[int] = None,
+                 validation_fraction: float = 0.1, **kwargs):
         """
         Initialize with XGBoost parameters.
+
+        Args:
+            feature_dtype: Dtype inputs are cast to before fitting/predicting. XGBoost
+                           works in float32 internally, so float32 avoids an extra copy.
+            early_stopping_rounds: If set, the last `validation_fraction` of the
+                           training rows (time ordered) is held out and boosting stops
+                           once its score has not improved for this many rounds;
+                           predictions then use the trees up to the best iteration.
+            validation_fraction: Share of the training window used as holdout.
         """
+        self.feature_dtype = feature_dtype
+        self.early_stopping_rounds = early_stopping_rounds
+        self.validation_fraction = validation_fraction
         self.params = {
             'objective': 'reg:squarederror',
             'n_estimators': 100,
@@ -27,12 +96,170 @@ class XGBoostPredictor(Predictor):
             self.params.update(kwargs)
             
         self.model = xgb.XGBRegressor(**self.params)
+        self.retrain_policy = RetrainPolicy()
+        self._reset_update_state()
         
     def train(self, X: pd.DataFrame, y: pd.Series) -> None:
         """
         Train the XGBoost Regressor.
         """
-        self.model.fit(X, y)
+        # Fresh regressor: update() may have replaced it with an incremental one
+        self.model = xgb.XGBRegressor(**self.params)
+        self._fit(self.model, self._cast(X), y)
+        self._reset_update_state(target_std=float(np.std(y)))
+
+    def _n_fit(self, n: int) -> int:
+        """Rows used for fitting; the remaining tail is the early-stopping holdout."""
+        if not self.early_stopping_rounds or n < 2:
+            return n
+        return n - min(n - 1, max(1, int(round(n * self.validation_fraction))))
+
+    def _fit(self, estimator, X: pd.DataFrame, y: pd.Series) -> None:
+        n_fit = self._n_fit(len(X))
+        if n_fit == len(X):
+            estimator.fit(X, y)
+            return
+        estimator.set_params(early_stopping_rounds=self.early_stopping_rounds)
+        estimator.fit(X.iloc[:n_fit], y.iloc[:n_fit],
+                      eval_set=[(X.iloc[n_fit:], y.iloc[n_fit:])], verbose=False)
+
+    @staticmethod
+    def _iteration_range(estimator) -> Tuple[int, int]:
+        # Early-stopped models only use their trees up to the best holdout score
+        best = estimator.get_booster().attr('best_iteration')
+        return (0, int(best) + 1) if best is not None else (0, 0)
+
+    @property
+    def best_iteration(self) -> Optional[int]:
+        """Best holdout iteration of the regressor, or None without early stopping."""
+        try:
+            best = self.model.get_booster().attr('best_iteration')
+        except NotFittedError:
+            return None
+        return int(best) if best is not None else None
+
+    def quantize(self, X: pd.DataFrame, ref: Optional[QuantizedFeatures] = None) -> QuantizedFeatures:
+        """
+        Quantizes a feature matrix once for train_shared. The same matrix can
+        train the regressor, the classifier and every horizon's labels.
+
+        Args:
+            ref: Matrix from quantize() on the same X whose bin edges are reused,
+                 so only the binning pass runs. Gives a copy with its own labels
+                 for training concurrently with `ref`.
+        """
+        X = self._cast(X)
+        n_fit = self._n_fit(len(X))
+        train = xgb.QuantileDMatrix(X.iloc[:n_fit], max_bin=self.params.get('max_bin', 256),
+                                    ref=ref.train if ref is not None else None)
+        valid = xgb.QuantileDMatrix(X.iloc[n_fit:], ref=train) if n_fit < len(X) else None
+        return QuantizedFeatures(train, valid, n_fit)
+
+    def quantize_key(self, X: pd.DataFrame) -> Hashable:
+        """
+        Identifies what quantize(X) builds: predictors returning equal keys
+        for the same frame can share one QuantizedFeatures.
+        """
+        return (id(X), np.dtype(self.feature_dtype).str, self.params.get('max_bin', 256),
+                self._n_fit(len(X)))
+
+    def train_shared(self, data: QuantizedFeatures, y: pd.Series,
+                     y_class: Optional[pd.Series] = None) -> None:
+        """
+        Trains the regressor (and the direction classifier if `y_class` is given)
+        on a matrix from quantize(), swapping only the label, via xgb.train.
+        Results match train()/train_classifier() on the same rows.
+        """
+        self.model = xgb.XGBRegressor(**self.params)
+        self.model.load_model(self._train_native(self.params, data, y))
+        self._reset_update_state(target_std=float(np.std(y)))
+
+        if y_class is not None:
+            self.classifier = xgb.XGBClassifier(**CLASSIFIER_PARAMS)
+            self.classifier.load_model(self._train_native(CLASSIFIER_PARAMS, data, y_class))
+
+    def _train_native(self, sk_params: Dict[str, Any], data: QuantizedFeatures, y) -> bytearray:
+        params, rounds = _native_params(sk_params)
+        labels = np.asarray(y, dtype=np.float32)
+        data.train.set_label(labels[:data.n_train])
+        evals = []
+        if data.valid is not None and self.early_stopping_rounds:
+            data.valid.set_label(labels[data.n_train:])
+            evals = [(data.valid, 'valid')]
+        booster = xgb.train(params, data.train, num_boost_round=rounds, evals=evals,
+                            early_stopping_rounds=self.early_stopping_rounds if evals else None,
+                            verbose_eval=False)
+        return bytearray(booster.save_raw())
+
+    def update(self, X_new: pd.DataFrame, y_new: pd.Series, rounds: int = 10, mode: str = 'boost',
+               X_full: Optional[pd.DataFrame] = None, y_full: Optional[pd.Series] = None) -> str:
+        """
+        Incrementally refreshes the regressor with new bars instead of retraining.
+
+        Modes:
+            'boost': continue boosting from the current booster with `rounds`
+                     extra trees fitted on the new bars (xgb_model=...).
+            'refresh': keep the tree structure and re-fit the leaf values on
+                       X_new, which should then be a recent window.
+
+        Before updating, `retrain_policy` is consulted; if it asks for a full
+        retrain and X_full/y_full are given, the model is retrained on them.
+
+        Returns:
+            str: 'boosted', 'refreshed', 'retrained', or 'retrain_due' when a
+            retrain is needed but no full data was passed (the update is applied).
+        """
+        if mode not in ('boost', 'refresh'):
+            raise ValueError(f"Unknown update mode '{mode}'")
+        X_new = self._cast(X_new)
+        booster = self.model.get_booster()
+        best = self.best_iteration
+
+        predicted = self.model.predict(X_new, iteration_range=self._iteration_range(self.model))
+        new_rmse = float(np.sqrt(np.mean((predicted - np.asarray(y_new)) ** 2)))
+        reason = self.retrain_policy.reason(self._updates, self._base_rounds, self._added_rounds,
+                                            new_rmse, self._target_std)
+        if reason is not None and X_full is not None and y_full is not None:
+            self.train(X_full, y_full)
+            return 'retrained'
+
+        if mode == 'boost':
+            if best is not None:
+                # Continue from the best iteration, dropping the trees past it
+                booster = booster[:best + 1]
+                booster.set_attr(best_iteration=None, best_score=None)
+            model = xgb.XGBRegressor(**dict(self.params, n_estimators=rounds))
+            model.fit(X_new, y_new, xgb_model=booster)
+            self._added_rounds += rounds
+        else:
+            # The refresh updater needs a plain DMatrix, so go through the native API
+            params = dict(self.model.get_xgb_params(), process_type='update',
+                          updater='refresh', refresh_leaf=True)
+            refreshed = xgb.train(params, xgb.DMatrix(X_new, y_new),
+                                  num_boost_round=booster.num_boosted_rounds(), xgb_model=booster)
+            model = xgb.XGBRegressor(**self.params)
+            model.load_model(bytearray(refreshed.save_raw()))
+        self.model = model
+        self._updates += 1
+
+        if reason is not None:
+            return 'retrain_due'
+        return 'boosted' if mode == 'boost' else 'refreshed'
+
+    def _reset_update_state(self, target_std: Optional[float] = None) -> None:
+        # Trees past the best iteration are never used (and dropped by update), so they
+        # don't count towards the base the added-tree fraction is measured against
+        best = self.best_iteration
+        if best is not None:
+            self._base_rounds = best + 1
+        else:
+            try:
+                self._base_rounds = self.model.get_booster().num_boosted_rounds()
+            except NotFittedError:
+                self._base_rounds = 0
+        self._added_rounds = 0
+        self._updates = 0
+        self._target_std = target_std
 
     def train_classifier(self, X: pd.DataFrame, y: pd.Series) -> None:
         """
@@ -40,16 +267,10 @@ class XGBoostPredictor(Predictor):
         """
         # Ensure we have a classifier model instance
         if not hasattr(self, 'classifier'):
-            self.classifier = xgb.XGBClassifier(
-                n_estimators=100, 
-                learning_rate=0.1, 
-                max_depth=5, 
-                eval_metric='logloss',
-                use_label_encoder=False
-            )
+            self.classifier = xgb.XGBClassifier(**CLASSIFIER_PARAMS)
         
         # y should be binary (1 for Rise, 0 for Fall)
-        self.classifier.fit(X, y)
+        self._fit(self.classifier, self._cast(X), y)
 
     def predict_proba(self, X: pd.DataFrame) -> pd.Series:
         """
@@ -59,15 +280,34 @@ class XGBoostPredictor(Predictor):
             raise ValueError("Classifier not trained yet!")
             
         # predict_proba returns [prob_0, prob_1]
-        probs = self.classifier.predict_proba(X)[:, 1]
+        probs = self.classifier.predict_proba(self._cast(X),
+                                              iteration_range=self._iteration_range(self.classifier))[:, 1]
         return pd.Series(probs, index=X.index)
 
     def predict(self, X: pd.DataFrame) -> pd.Series:
         """
         Make regression predictions.
         """
-        predictions = self.model.predict(X)
+        predictions = self.model.predict(self._cast(X), iteration_range=self._iteration_range(self.model))
         return pd.Series(predictions, index=X.index)
+
+    def predict_batch_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        Low-latency regression predictions for a 2-D array whose columns are in
+        training order. Skips pandas and DMatrix construction (inplace_predict).
+        """
+        X = np.ascontiguousarray(X, dtype=self.feature_dtype)
+        return self.model.get_booster().inplace_predict(X, iteration_range=self._iteration_range(self.model))
+
+    def predict_one(self, row: np.ndarray) -> float:
+        """Prediction for a single feature row (1-D array in training column order)."""
+        return float(self.predict_batch_array(np.reshape(row, (1, -1)))[0])
+
+    def _cast(self, X: pd.DataFrame) -> pd.DataFrame:
+        # No copy when the features already arrive in the right dtype
+        if (X.dtypes == self.feature_dtype).all():
+            return X
+        return X.astype(self.feature_dtype)
         
     def save(self, path: str) -> None:
         """
@@ -83,6 +323,8 @@ class XGBoostPredictor(Predictor):
         """
         self.model = xgb.XGBRegressor()
         self.model.load_model(path + ".reg")
+        # Training target spread is not stored; the error check applies after the next train()
+        self._reset_update_state()
         
         # Try loading classifier
         cls_path = path + ".cls"
@@ -122,5 +364,6 @@ class XGBoostPredictor(Predictor):
         self.params = final_params
         # Re-initialize model with new params
         self.model = xgb.XGBRegressor(**self.params)
+        self._reset_update_state()
         
         return self.params
@@ -0,0 +1,75 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.analog_search import AnalogSearch
+from src.market_memory import MarketMemory
+
+@pytest.fixture
+def history():
+    rng = np.random.default_rng(3)
+    dates = pd.date_range("2018-01-01", periods=1500, freq="D")
+    close = 20000 + np.cumsum(rng.normal(0, 100, len(dates)))
+    return pd.DataFrame({"Close": close}, index=dates)
+
+def _brute_force(values, query):
+    m = len(query)
+    q = (query - query.mean()) / query.std()
+    dist = []
+    for i in range(len(values) - m + 1):
+        w = values[i:i + m]
+        dist.append(np.linalg.norm((w - w.mean()) / w.std() - q))
+    return np.array(dist)
+
+def test_distance_profile_matches_brute_force(history):
+    search = AnalogSearch()
+    index = search.add("BTC-USD", history)
+    query = history["Close"].to_numpy()[-40:]
+
+    expected = _brute_force(history["Close"].to_numpy(), query)
+    np.testing.assert_allclose(index.distance_profile(query), expected, atol=1e-6)
+
+def test_search_finds_planted_analog(history):
+    history = history.copy()
+    # Plant a scaled, shifted copy of the latest window in the past
+    pattern = history["Close"].to_numpy()[-30:]
+    history.iloc[500:530, 0] = pattern * 0.5 + 3000
+
+    search = AnalogSearch()
+    search.add("BTC-USD", history)
+    result = search.search("BTC-USD", window=30, top_k=3, horizon=5)
+
+    assert result["start"].iloc[0] == history.index[500]
+    assert result["distance"].iloc[0] == pytest.approx(0.0, abs=1e-5)
+    assert result["correlation"].iloc[0] == pytest.approx(1.0)
+    assert result["distance"].is_monotonic_increasing
+    # No trivial match overlapping the query, and analogs do not overlap each other
+    assert (result["end"] < history.index[-30]).all()
+    assert np.diff(np.sort(result["start"].to_numpy())).min() >= pd.Timedelta(days=15)
+    assert "forward_return" in result
+
+def test_search_links_memory_events(tmp_path, history):
+    history = history.copy()
+    history.iloc[500:530, 0] = history["Close"].to_numpy()[-30:]
+    memory = MarketMemory(data_dir=str(tmp_path))
+    memory.add_event(history.index[530].strftime("%Y-%m-%d"), "Fed surprise", "Fed", -0.5, "Bearish")
+
+    search = AnalogSearch(memory=memory)
+    search.add("BTC-USD", history)
+    result = search.search("BTC-USD", window=30, top_k=1)
+
+    assert [e["description"] for e in result["events"].iloc[0]] == ["Fed surprise"]
+
+    # A prebuilt index is reused as is, with events read from the current memory
+    memory.add_event(history.index[529].strftime("%Y-%m-%d"), "ETF inflows", "Flows", 0.4, "Bullish")
+    fresh = AnalogSearch(memory=MarketMemory(data_dir=str(tmp_path)))
+    assert fresh.add("BTC-USD", search.index("BTC-USD")) is search.index("BTC-USD")
+    result = fresh.search("BTC-USD", window=30, top_k=1)
+    assert {e["description"] for e in result["events"].iloc[0]} == {"Fed surprise", "ETF inflows"}
+
+def test_missing_symbol_and_flat_query(history):
+    search = AnalogSearch()
+    with pytest.raises(KeyError):
+        search.search("ETH-USD")
+    search.add("BTC-USD", history)
+    with pytest.raises(ValueError):
+        search.search("BTC-USD", query=np.ones(20))
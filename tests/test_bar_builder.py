@@ -0,0 +1,67 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.bar_builder import BarBuilder
+from src.feature_engineering import TechnicalIndicatorTransformer
+
+@pytest.fixture
+def minute_data():
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2024-01-01", periods=5000, freq="min")
+    close = 100 + np.cumsum(rng.normal(0, 0.1, 5000))
+    df = pd.DataFrame({
+        "Open": close + rng.normal(0, 0.02, 5000),
+        "High": close + 0.1,
+        "Low": close - 0.1,
+        "Close": close,
+        "Volume": rng.integers(1, 100, 5000).astype(float)
+    }, index=dates)
+    return df
+
+def test_volume_bars_conserve_volume(minute_data):
+    builder = BarBuilder("volume", threshold=2500)
+    bars = builder.transform(minute_data)
+
+    assert list(bars.columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert bars.index.is_monotonic_increasing
+    # Every bar closes on a threshold crossing, so the count matches the grid
+    total = minute_data["Volume"].sum()
+    assert len(bars) == int(total // 2500)
+    assert bars["Volume"].sum() <= total
+    assert (bars["High"] >= bars["Low"]).all()
+
+def test_streaming_matches_one_shot(minute_data):
+    for bar_type, threshold in [("dollar", 250000), ("tick_imbalance", 15), ("volume_imbalance", 800)]:
+        one_shot = BarBuilder(bar_type, threshold).transform(minute_data)
+
+        streaming = BarBuilder(bar_type, threshold)
+        chunks = [streaming.update(minute_data.iloc[i:i + 333]) for i in range(0, len(minute_data), 333)]
+        streamed = pd.concat(chunks)
+
+        pd.testing.assert_frame_equal(one_shot, streamed, check_freq=False)
+
+def test_trade_prints_and_flush():
+    idx = pd.date_range("2024-01-01", periods=6, freq="s")
+    prints = pd.DataFrame({"Price": [10, 11, 12, 11, 13, 14], "Size": [1, 1, 1, 1, 1, 1]}, index=idx)
+
+    builder = BarBuilder("volume", threshold=4)
+    bars = builder.update(prints)
+    assert len(bars) == 1
+    assert bars["Open"].iloc[0] == 10
+    assert bars["High"].iloc[0] == 12
+    assert bars["Close"].iloc[0] == 11
+
+    partial = builder.flush()
+    assert len(partial) == 1
+    assert partial["Volume"].iloc[0] == 2
+    assert partial["Close"].iloc[0] == 14
+
+def test_bars_feed_indicator_transformer(minute_data):
+    bars = BarBuilder("volume", threshold=1000).transform(minute_data)
+    features = TechnicalIndicatorTransformer().transform(bars)
+    assert "RSI" in features.columns
+    assert not pd.isna(features["SMA_50"].iloc[-1])
+
+def test_invalid_bar_type():
+    with pytest.raises(ValueError):
+        BarBuilder("range")
@@ -0,0 +1,71 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.correlation_engine import CorrelationEngine
+
+@pytest.fixture
+def universe():
+    rng = np.random.default_rng(7)
+    n, k = 600, 60
+    # Three sectors driven by separate factors
+    factors = rng.normal(size=(n, 3))
+    loadings = np.zeros((3, k))
+    for sector in range(3):
+        loadings[sector, sector::3] = 1.0
+    df = pd.DataFrame(factors @ loadings + 0.5 * rng.normal(size=(n, k)),
+                      columns=[f"A{i}" for i in range(k)])
+    df.iloc[:50, 4] = np.nan
+    df.iloc[300:400, 11] = np.nan
+    return df
+
+def test_blocked_pairwise_matches_pandas(universe):
+    corr = CorrelationEngine(block_size=16).correlation_matrix(universe)
+    pd.testing.assert_frame_equal(corr, universe.corr(), atol=1e-10)
+
+    # float32 is opt-in and trades precision for speed
+    fast = CorrelationEngine(block_size=16, dtype=np.float32).correlation_matrix(universe)
+    pd.testing.assert_frame_equal(fast, universe.corr(), atol=1e-5)
+
+def test_constant_column_is_nan(universe):
+    universe["Flat"] = 1.0
+    corr = CorrelationEngine().correlation_matrix(universe)
+
+    assert corr["Flat"].isna().all()
+    assert corr.loc["A0", "A0"] == 1.0
+
+def test_shrinkage_pulls_toward_identity(universe):
+    complete = universe.dropna()
+    raw = CorrelationEngine().correlation_matrix(complete)
+    shrunk = CorrelationEngine(shrinkage='ledoit_wolf').correlation_matrix(complete)
+    fixed = CorrelationEngine(shrinkage=0.5).correlation_matrix(complete)
+
+    np.testing.assert_allclose(np.diag(shrunk), 1.0)
+    off = ~np.eye(len(raw), dtype=bool)
+    assert (np.abs(shrunk.to_numpy()[off]) <= np.abs(raw.to_numpy()[off]) + 1e-12).all()
+    np.testing.assert_allclose(fixed.to_numpy()[off], 0.5 * raw.to_numpy()[off])
+
+    with pytest.raises(ValueError):
+        CorrelationEngine(shrinkage='oas')
+
+def test_cache_is_keyed_by_window(universe):
+    engine = CorrelationEngine(cache_size=2)
+    first = engine.correlation_matrix(universe.iloc[:400])
+    again = engine.correlation_matrix(universe.iloc[:400])
+    engine.correlation_matrix(universe.iloc[100:500])
+
+    pd.testing.assert_frame_equal(again, first)
+    assert (engine.hits, engine.misses) == (1, 2)
+
+    # Callers get copies: modifying one does not corrupt the cache
+    again.iloc[0, 1] = 42.0
+    assert engine.correlation_matrix(universe.iloc[:400]).iloc[0, 1] == first.iloc[0, 1]
+
+def test_cluster_order_groups_sectors(universe):
+    engine = CorrelationEngine()
+    clustered = engine.clustered_matrix(universe)
+
+    sectors = [int(name[1:]) % 3 for name in clustered.columns]
+    # Each sector forms one contiguous run in cluster order
+    runs = sum(1 for a, b in zip(sectors, sectors[1:]) if a != b) + 1
+    assert runs == 3
+    assert sorted(clustered.columns) == sorted(universe.columns)
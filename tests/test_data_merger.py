@@ -45,3 +45,69 @@ def test_data_merger_ffill():
     # T+1 should be filled with T+0 value (10)
     assert merged.loc["2023-01-02", "M"] == 10.0
     assert merged.loc["2023-01-03", "M"] == 30.0
+
+def test_data_merger_many_macros_matches_sequential_join():
+    rng = np.random.default_rng(1)
+    idx = pd.date_range("2023-01-01", periods=60)
+    target = pd.DataFrame({"Close": rng.normal(100, 1, 60)}, index=idx)
+
+    macros = {}
+    for i in range(120):
+        # Each macro trades on its own sparse calendar
+        dates = idx[rng.random(60) > 0.3]
+        macros[f"M{i}"] = pd.DataFrame({"Close": rng.normal(50, 1, len(dates))}, index=dates)
+
+    merged = DataMerger().merge(target, macros)
+
+    expected = target.copy()
+    for name, df in macros.items():
+        expected = expected.join(df["Close"].rename(name), how="left")
+        expected[name] = expected[name].ffill()
+
+    assert list(merged.columns) == ["Close"] + list(macros.keys())
+    pd.testing.assert_frame_equal(merged, expected)
+
+def test_build_panel_is_unfilled_union():
+    a = pd.DataFrame({"Close": [1.0, 2.0]}, index=pd.to_datetime(["2023-01-01", "2023-01-03"]))
+    b = pd.Series([5.0], index=pd.to_datetime(["2023-01-02"]))
+
+    panel = DataMerger().build_panel({"A": a, "B": b})
+    assert list(panel.columns) == ["A", "B"]
+    assert len(panel) == 3
+    assert pd.isna(panel.loc["2023-01-02", "A"])
+
+def test_merge_asof_lag_and_tolerance():
+    # Minute bars on Jan 2 and Jan 6 against daily macro closes
+    minutes = pd.date_range("2023-01-02 09:30", periods=3, freq="min").append(
+        pd.date_range("2023-01-06 09:30", periods=2, freq="min"))
+    target = pd.DataFrame({"Close": np.arange(5.0)}, index=minutes)
+    macro = pd.DataFrame({"Close": [10.0, 20.0]}, index=pd.to_datetime(["2023-01-01", "2023-01-02"]))
+
+    merger = DataMerger()
+    panel = merger.prepare_asof({"M": macro})
+
+    # No lag: the Jan 2 close (stamped midnight) would be visible intraday Jan 2
+    no_lag = merger.merge_asof(target, panel)
+    assert no_lag["M"].iloc[0] == 20.0
+
+    # One day publication lag: Jan 2 intraday sees the Jan 1 close only
+    lagged = merger.merge_asof(target, panel, lags={"M": "1D"})
+    assert lagged["M"].iloc[0] == 10.0
+    assert lagged["M"].iloc[-1] == 20.0
+
+    # Staleness: by Jan 6 the Jan 2 close (available Jan 3) is older than 2 days
+    bounded = merger.merge_asof(target, panel, lags={"M": "1D"}, tolerance="2D")
+    assert bounded["M"].iloc[0] == 10.0
+    assert bounded["M"].iloc[-2:].isna().all()
+
+def test_merge_asof_matches_pandas():
+    rng = np.random.default_rng(2)
+    target_idx = pd.date_range("2023-01-01", periods=500, freq="h")
+    target = pd.DataFrame({"Close": rng.normal(size=500)}, index=target_idx)
+    macro_idx = pd.bdate_range("2022-12-20", "2023-01-25")
+    macro = pd.DataFrame({"Close": rng.normal(size=len(macro_idx))}, index=macro_idx)
+
+    merged = DataMerger().merge(target, {"M": macro}, method="asof")
+    expected = pd.merge_asof(target, macro["Close"].rename("M"),
+                             left_index=True, right_index=True, direction="backward")
+    np.testing.assert_allclose(merged["M"].to_numpy(), expected["M"].to_numpy())
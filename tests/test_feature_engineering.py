@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
-from src.feature_engineering import TechnicalIndicatorTransformer
+from src.feature_engineering import TechnicalIndicatorTransformer, LagFeatureTransformer
 
 @pytest.fixture
 def sample_data():
@@ -42,3 +42,59 @@ def test_rsi_calculation(sample_data):
     # RSI should be between 0 and 100
     rsi = transformed["RSI"].dropna()
     assert ((rsi >= 0) & (rsi <= 100)).all()
+
+def test_numpy_engine_matches_pandas():
+    rng = np.random.default_rng(4)
+    dates = pd.date_range("2023-01-01", periods=1000)
+    df = pd.DataFrame({"Close": 100 + np.cumsum(rng.normal(0, 1, 1000)),
+                       "Volume": rng.random(1000)}, index=dates)
+
+    fast = TechnicalIndicatorTransformer(engine="numpy").transform(df)
+    reference = TechnicalIndicatorTransformer(engine="pandas").transform(df)
+
+    assert list(fast.columns) == list(reference.columns)
+    pd.testing.assert_frame_equal(fast, reference, rtol=1e-9, atol=1e-9)
+
+def test_numpy_engine_does_not_copy_input(sample_data):
+    transformed = TechnicalIndicatorTransformer().transform(sample_data)
+    assert np.shares_memory(transformed["Close"].to_numpy(), sample_data["Close"].to_numpy())
+    # Input is left untouched
+    assert list(sample_data.columns) == ["Close"]
+
+def test_float32_block(sample_data):
+    transformed = TechnicalIndicatorTransformer(dtype=np.float32).transform(sample_data)
+    assert transformed["SMA_20"].dtype == np.float32
+    assert transformed["Close"].dtype == np.float64
+
+def test_nan_close_falls_back_to_pandas(sample_data):
+    data = sample_data.copy()
+    data.iloc[30, 0] = np.nan
+    fast = TechnicalIndicatorTransformer().transform(data)
+    reference = TechnicalIndicatorTransformer(engine="pandas").transform(data)
+    pd.testing.assert_frame_equal(fast, reference)
+
+def test_lag_features_match_shift(sample_data):
+    data = sample_data.assign(Volume=np.arange(100, dtype=float))
+    transformer = LagFeatureTransformer(["Close", "Volume"], lags=[1, 3, 5], dtype=np.float64)
+    lagged = transformer.transform(data)
+
+    assert transformer.feature_names() == ["Close_lag1", "Close_lag3", "Close_lag5",
+                                           "Volume_lag1", "Volume_lag3", "Volume_lag5"]
+    for lag in (1, 3, 5):
+        pd.testing.assert_series_equal(lagged[f"Volume_lag{lag}"], data["Volume"].shift(lag),
+                                       check_names=False)
+    assert lagged["Close_lag5"].dtype == np.float64
+
+def test_lag_matrix_is_strided_view(sample_data):
+    transformer = LagFeatureTransformer(["Close"], lags=20)
+    view = transformer.lag_matrix(sample_data)
+
+    assert view.shape == (100, 1, 20)
+    assert view.dtype == np.float32
+    # Neighbouring lags overlap in memory: no per-lag copies were made
+    assert np.shares_memory(view[:, 0, 0], view[:, 0, 1])
+
+    dense = transformer.to_contiguous(view)
+    assert dense.flags["C_CONTIGUOUS"]
+    assert dense.shape == (100, 20)
+    np.testing.assert_allclose(dense[50], sample_data["Close"].iloc[49:29:-1].to_numpy(dtype=np.float32))
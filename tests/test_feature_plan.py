@@ -0,0 +1,59 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.feature_engineering import TechnicalIndicatorTransformer
+from src.market_analyzer import CorrelationTransformer
+from src.xgboost_predictor import XGBoostPredictor
+from src.feature_plan import FeaturePlan
+
+@pytest.fixture
+def merged_data():
+    rng = np.random.default_rng(7)
+    dates = pd.date_range("2021-01-01", periods=700)
+    return pd.DataFrame({
+        "Close": 100 + np.cumsum(rng.normal(0, 1, 700)),
+        "Gold": 50 + np.cumsum(rng.normal(0, 1, 700)),
+        "VIX": 20 + rng.normal(0, 2, 700),
+    }, index=dates)
+
+def full_features(data):
+    df = TechnicalIndicatorTransformer().transform(data)
+    return CorrelationTransformer().transform(df, target_col="Close", window=30)
+
+def test_plan_reproduces_latest_row(merged_data):
+    features = full_features(merged_data)
+    used = ["Close", "SMA_20", "RSI", "MACD_Signal", "Corr_Gold_30", "Corr_SMA_50_30", "VIX"]
+
+    plan = FeaturePlan(used)
+    assert plan.raw_columns == ["Close", "Gold", "VIX"]
+    assert plan.required_bars == 350  # MACD_Signal: 10 * (26 + 9)
+
+    row = plan.evaluate(merged_data)
+    assert list(row.columns) == used
+    assert row.index[0] == merged_data.index[-1]
+    np.testing.assert_allclose(row.iloc[0].to_numpy(), features[used].iloc[-1].to_numpy(), rtol=1e-6)
+
+def test_short_plan_uses_short_window(merged_data):
+    plan = FeaturePlan(["SMA_20", "Corr_VIX_30", "Close_lag3"])
+    assert plan.required_bars == 30
+
+    features = full_features(merged_data)
+    row = plan.evaluate(merged_data)
+    assert row["SMA_20"].iloc[0] == pytest.approx(features["SMA_20"].iloc[-1])
+    assert row["Corr_VIX_30"].iloc[0] == pytest.approx(features["Corr_VIX_30"].iloc[-1])
+    assert row["Close_lag3"].iloc[0] == merged_data["Close"].iloc[-4]
+
+def test_plan_from_predictor(merged_data):
+    features = full_features(merged_data).dropna()
+    cols = ["Close", "EMA_12", "Corr_Gold_30"]
+    predictor = XGBoostPredictor(n_estimators=20)
+    predictor.train(features[cols], features["Close"].shift(-1).ffill())
+
+    plan = FeaturePlan.from_predictor(predictor)
+    row = plan.evaluate(merged_data)
+    expected = predictor.predict(features[cols].iloc[-1:])
+    assert predictor.predict(row).iloc[0] == pytest.approx(expected.iloc[0], rel=1e-5)
+
+def test_unknown_feature_raises(merged_data):
+    with pytest.raises(KeyError):
+        FeaturePlan(["Oil"]).evaluate(merged_data)
@@ -0,0 +1,169 @@
+import os
+import pytest
+import pandas as pd
+import numpy as np
+from src.feature_engineering import TechnicalIndicatorTransformer
+from src.indicator_registry import IndicatorGridTransformer, IndicatorRegistry
+from src.market_analyzer import CorrelationTransformer
+from src.feature_store import FeatureStore
+
+@pytest.fixture
+def market_data():
+    rng = np.random.default_rng(6)
+    dates = pd.date_range("2022-01-01", periods=900)
+    return pd.DataFrame({
+        "Close": 100 + np.cumsum(rng.normal(0, 1, 900)),
+        "Gold": 50 + np.cumsum(rng.normal(0, 1, 900)),
+    }, index=dates)
+
+def test_hit_after_miss(tmp_path, market_data):
+    store = FeatureStore(str(tmp_path))
+    transformer = TechnicalIndicatorTransformer()
+
+    first = store.get_or_compute(transformer, market_data)
+    second = store.get_or_compute(transformer, market_data)
+
+    pd.testing.assert_frame_equal(first, second, check_freq=False)
+    assert store.stats()["misses"] == 1
+    assert store.stats()["hits"] == 1
+
+    # Different parameters are a different entry
+    store.get_or_compute(TechnicalIndicatorTransformer(dtype=np.float32), market_data)
+    assert store.stats()["misses"] == 2
+
+def test_custom_registries_are_different_entries(tmp_path, market_data):
+    def momentum(close, params_list, shared):
+        for params in params_list:
+            out = np.full(len(close), np.nan)
+            out[params["lag"]:] = close[params["lag"]:] - close[:-params["lag"]]
+            yield out
+
+    def reversal(close, params_list, shared):
+        for values in momentum(close, params_list, shared):
+            yield -values
+
+    registries = []
+    for kernel in (momentum, reversal):
+        registry = IndicatorRegistry()
+        registry.register("MOM", "MOM_{lag}", lambda params, factor: params["lag"] + 1)(kernel)
+        registries.append(registry)
+
+    # The transformers only differ in their registry's kernel
+    store = FeatureStore(str(tmp_path))
+    specs = [("MOM", {"lag": 5})]
+    first = store.get_or_compute(IndicatorGridTransformer(specs, registries[0]), market_data)
+    second = store.get_or_compute(IndicatorGridTransformer(specs, registries[1]), market_data)
+
+    assert store.stats()["misses"] == 2
+    np.testing.assert_allclose(second["MOM_5"], -first["MOM_5"])
+
+def test_tail_recompute_matches_full(tmp_path, market_data):
+    store = FeatureStore(str(tmp_path))
+    history, latest = market_data.iloc[:850], market_data
+
+    for transformer, kwargs in [(TechnicalIndicatorTransformer(), {}),
+                                (CorrelationTransformer(), {"target_col": "Close", "window": 30})]:
+        store.get_or_compute(transformer, history, **kwargs)
+        extended = store.get_or_compute(transformer, latest, **kwargs)
+        full = transformer.transform(latest, **kwargs)
+        pd.testing.assert_frame_equal(extended, full, check_freq=False, rtol=1e-9)
+
+    assert store.stats()["partial_hits"] == 2
+
+def test_warmup_follows_transformer_memory(tmp_path, market_data):
+    store = FeatureStore(str(tmp_path))
+    history, latest = market_data.iloc[:850], market_data
+
+    # A slow EMA needs far more history than a fixed warm-up would give it
+    transformer = IndicatorGridTransformer([('EMA', {'span': 500}), ('SMA', {'window': 5})])
+    assert transformer.warmup_bars() == 5000
+    store.get_or_compute(transformer, history)
+    extended = store.get_or_compute(transformer, latest)
+    pd.testing.assert_frame_equal(extended, transformer.transform(latest), check_freq=False, rtol=1e-9)
+    assert store.stats()["partial_hits"] == 1
+
+    class Opaque:
+        def transform(self, df):
+            return df.assign(Mean=df["Close"].expanding().mean())
+
+    # No declared warm-up: recomputed in full rather than guessed
+    store.get_or_compute(Opaque(), history)
+    extended = store.get_or_compute(Opaque(), latest)
+    pd.testing.assert_frame_equal(extended, Opaque().transform(latest), check_freq=False)
+    assert store.stats()["partial_hits"] == 1
+    assert store.stats()["misses"] == 3
+
+def test_hit_does_not_rewrite_index(tmp_path, market_data):
+    store = FeatureStore(str(tmp_path))
+    transformer = TechnicalIndicatorTransformer()
+    store.get_or_compute(transformer, market_data)
+    written = os.path.getmtime(store.index_file)
+    os.utime(store.index_file, (written - 10, written - 10))
+
+    store.get_or_compute(transformer, market_data)
+    assert store.stats()["hits"] == 1
+    assert os.path.getmtime(store.index_file) == written - 10
+
+class CountingTransformer(CorrelationTransformer):
+    """Records how many rows each transform() call sees."""
+    def __init__(self):
+        super().__init__()
+        self._calls = []
+
+    def transform(self, df, **kwargs):
+        self._calls.append(len(df))
+        return super().transform(df, **kwargs)
+
+def test_sliding_window_recomputes_only_the_edges(tmp_path, market_data):
+    store = FeatureStore(str(tmp_path))
+    transformer = CountingTransformer()
+    kwargs = {"target_col": "Close", "window": 30}
+    store.get_or_compute(transformer, market_data.iloc[:800], **kwargs)
+
+    # Next day: the window drops its oldest bar, yesterday's partial bar is final
+    # and a new bar arrives
+    shifted = market_data.iloc[1:801].copy()
+    shifted.iloc[-2, 0] += 0.5
+    transformer._calls.clear()
+    result = store.get_or_compute(transformer, shifted, **kwargs)
+
+    # Head warm-up (30 rows) and the last 2 rows plus their 30-bar warm-up
+    assert transformer._calls == [30, 32]
+    assert store.stats()["partial_hits"] == 1
+    expected = CorrelationTransformer().transform(shifted, **kwargs)
+    pd.testing.assert_frame_equal(result, expected, check_freq=False, rtol=1e-9)
+
+    # Long-memory indicators too, to within their warm-up's decay
+    indicators = TechnicalIndicatorTransformer()
+    store.get_or_compute(indicators, market_data.iloc[:800])
+    result = store.get_or_compute(indicators, shifted)
+    assert store.stats()["partial_hits"] == 2
+    pd.testing.assert_frame_equal(result, indicators.transform(shifted), check_freq=False, rtol=1e-9)
+
+def test_changed_history_is_a_miss(tmp_path, market_data):
+    store = FeatureStore(str(tmp_path))
+    transformer = TechnicalIndicatorTransformer()
+    store.get_or_compute(transformer, market_data.iloc[:800])
+
+    # Nothing in common: computed from scratch
+    store.get_or_compute(transformer, market_data * 2)
+    assert store.stats()["partial_hits"] == 0
+    assert store.stats()["misses"] == 2
+
+    # A revised old bar: rows after it are only reused once its effect has decayed
+    revised = market_data.copy()
+    revised.iloc[10, 0] += 1.0
+    result = store.get_or_compute(transformer, revised)
+    pd.testing.assert_frame_equal(result, transformer.transform(revised), check_freq=False, rtol=1e-9)
+
+def test_eviction_and_persistence(tmp_path, market_data):
+    store = FeatureStore(str(tmp_path), max_bytes=1)
+    transformer = TechnicalIndicatorTransformer()
+    store.get_or_compute(transformer, market_data.iloc[:300])
+    store.get_or_compute(transformer, market_data.iloc[:600] * 2)
+    assert store.stats()["entries"] == 1
+    assert store.stats()["evictions"] == 1
+
+    reopened = FeatureStore(str(tmp_path), max_bytes=1)
+    reopened.get_or_compute(transformer, market_data.iloc[:600] * 2)
+    assert reopened.stats()["hits"] == 1
@@ -0,0 +1,76 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.feature_engineering import TechnicalIndicatorTransformer, INDICATOR_COLUMNS
+from src.indicator_registry import IndicatorRegistry, IndicatorGridTransformer, DEFAULT_REGISTRY, grid
+
+@pytest.fixture
+def price_data():
+    rng = np.random.default_rng(5)
+    dates = pd.date_range("2023-01-01", periods=600)
+    return pd.DataFrame({"Close": 100 + np.cumsum(rng.normal(0, 1, 600))}, index=dates)
+
+def test_default_specs_match_transformer(price_data):
+    reference = TechnicalIndicatorTransformer(engine="pandas").transform(price_data)
+    gridded = IndicatorGridTransformer().transform(price_data)
+
+    assert list(gridded.columns) == ["Close"] + INDICATOR_COLUMNS
+    pd.testing.assert_frame_equal(gridded, reference, rtol=1e-9, atol=1e-9)
+
+def test_sma_grid_matches_pandas(price_data):
+    specs = grid("SMA", window=range(5, 201, 5))
+    features = IndicatorGridTransformer(specs).transform(price_data)
+
+    assert len(features.columns) == 1 + 40
+    for window in (5, 60, 200):
+        expected = price_data["Close"].rolling(window).mean()
+        np.testing.assert_allclose(features[f"SMA_{window}"], expected, rtol=1e-9)
+
+def test_mixed_grid_names_and_values(price_data):
+    specs = grid("RSI", window=[7, 21]) + grid("MACD_Signal", fast=5, slow=[20, 35], signal=9)
+    features = IndicatorGridTransformer(specs, dtype=np.float32).transform(price_data)
+
+    assert {"RSI_7", "RSI_21", "MACD_Signal_5_20_9", "MACD_Signal_5_35_9"} <= set(features.columns)
+    assert features["RSI_7"].dtype == np.float32
+
+    close = price_data["Close"]
+    macd = close.ewm(span=5, adjust=False).mean() - close.ewm(span=35, adjust=False).mean()
+    np.testing.assert_allclose(features["MACD_Signal_5_35_9"], macd.ewm(span=9, adjust=False).mean(), atol=1e-4)
+
+def test_custom_indicator_registration(price_data):
+    registry = IndicatorRegistry()
+
+    @registry.register("Momentum", "MOM_{lag}")
+    def _momentum(close, params_list, shared):
+        for params in params_list:
+            out = np.full(len(close), np.nan)
+            out[params["lag"]:] = close[params["lag"]:] - close[:-params["lag"]]
+            yield out
+
+    columns, block = registry.compute(price_data["Close"].to_numpy(), grid("Momentum", lag=[1, 5]))
+    assert columns == ["MOM_1", "MOM_5"]
+    np.testing.assert_allclose(block[5:, 1], price_data["Close"].diff(5).to_numpy()[5:])
+
+    with pytest.raises(ValueError):
+        registry.compute(price_data["Close"].to_numpy(), [("SMA", {"window": 5})])
+
+def test_registry_lookbacks_and_identity():
+    assert DEFAULT_REGISTRY.lookback(("SMA", {"window": 20})) == 20
+    assert DEFAULT_REGISTRY.lookback(("MACD_Signal", {"fast": 12, "slow": 26, "signal": 9})) == 350
+    assert IndicatorGridTransformer().warmup_bars() == 350
+
+    registry = IndicatorRegistry()
+    registry.register("Momentum", "MOM_{lag}")(lambda close, params_list, shared: iter(()))
+    assert registry.lookback(("Momentum", {"lag": 1})) is None
+    assert IndicatorGridTransformer([("Momentum", {"lag": 1})], registry).warmup_bars() is None
+    assert list(registry.identity()) == ["Momentum"]
+    assert registry.identity() != DEFAULT_REGISTRY.identity()
+
+def test_sma_and_rsi_grids_do_not_share_columns(price_data):
+    # Both kernels refill one buffer per spec; every column must still be its own
+    specs = grid("SMA", window=[5, 10]) + grid("RSI", window=[7, 14])
+    features = IndicatorGridTransformer(specs).transform(price_data)
+    close = price_data["Close"]
+    np.testing.assert_allclose(features["SMA_5"], close.rolling(5).mean(), rtol=1e-9)
+    np.testing.assert_allclose(features["SMA_10"], close.rolling(10).mean(), rtol=1e-9)
+    assert not np.allclose(features["RSI_7"].iloc[20:], features["RSI_14"].iloc[20:])
@@ -0,0 +1,108 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.base import DataProvider
+from src.macro_cache import MacroPanelCache
+
+class FakeProvider(DataProvider):
+    def __init__(self):
+        self.calls = []
+
+    def fetch_history(self, symbol, start, end):
+        self.calls.append((symbol, start, end))
+        dates = pd.bdate_range(start, end, inclusive="left")
+        if len(dates) == 0:
+            raise ValueError("No data")
+        return pd.DataFrame({"Close": np.arange(len(dates), dtype=float)}, index=dates)
+
+@pytest.fixture
+def symbols():
+    return {"Gold": "GC=F", "Oil": "CL=F"}
+
+def test_panel_is_fetched_once(tmp_path, symbols):
+    provider = FakeProvider()
+    cache = MacroPanelCache(str(tmp_path), symbols=symbols, provider=provider)
+
+    panel = cache.get_panel("2024-01-01", "2024-02-01")
+    assert list(panel.columns) == ["Gold", "Oil"]
+    assert len(provider.calls) == 2
+
+    # Same or narrower range: served from the cache
+    sub = cache.get_panel("2024-01-10", "2024-01-20")
+    assert len(provider.calls) == 2
+    assert sub.index.min() >= pd.Timestamp("2024-01-10")
+    assert sub.index.max() < pd.Timestamp("2024-01-20")
+
+def test_incremental_refresh_and_persistence(tmp_path, symbols):
+    provider = FakeProvider()
+    cache = MacroPanelCache(str(tmp_path), symbols=symbols, provider=provider)
+    cache.get_panel("2024-01-01", "2024-02-01")
+
+    cache.get_panel("2024-01-01", "2024-02-08")
+    new_calls = provider.calls[2:]
+    assert new_calls == [("GC=F", "2024-02-01", "2024-02-08"), ("CL=F", "2024-02-01", "2024-02-08")]
+
+    # A new process reuses the parquet panel without downloading
+    provider2 = FakeProvider()
+    reloaded = MacroPanelCache(str(tmp_path), symbols=symbols, provider=provider2)
+    panel = reloaded.get_panel("2024-01-01", "2024-02-08")
+    assert provider2.calls == []
+    assert panel.index.max() == pd.Timestamp("2024-02-07")
+
+class FlakyProvider(FakeProvider):
+    """Fails like YahooFinanceProvider does when the download itself fails."""
+    def __init__(self):
+        super().__init__()
+        self.offline = True
+
+    def fetch_history(self, symbol, start, end):
+        if self.offline:
+            self.calls.append((symbol, start, end))
+            raise ValueError(f"No data found for symbol {symbol} between {start} and {end}")
+        return super().fetch_history(symbol, start, end)
+
+def test_failed_fetch_is_retried_after_ttl(tmp_path, symbols):
+    provider = FlakyProvider()
+    cache = MacroPanelCache(str(tmp_path), symbols=symbols, provider=provider)
+    assert cache.get_panel("2024-01-01", "2024-02-01").empty
+    assert cache.coverage == {}
+
+    # Within the TTL the empty range is not requested again
+    provider.offline = False
+    assert cache.get_panel("2024-01-01", "2024-02-01").empty
+    assert len(provider.calls) == 2
+
+    cache.empty_ttl = pd.Timedelta(0)
+    panel = cache.get_panel("2024-01-01", "2024-02-01")
+    assert list(panel.columns) == ["Gold", "Oil"]
+    assert len(provider.calls) == 4
+
+def test_holiday_range_is_not_refetched(tmp_path, symbols):
+    provider = FlakyProvider()
+    provider.offline = False
+    cache = MacroPanelCache(str(tmp_path), symbols=symbols, provider=provider)
+    cache.get_panel("2024-12-02", "2024-12-25")
+
+    # Christmas is a weekday without data
+    provider.offline = True
+    for _ in range(3):
+        cache.get_panel("2024-12-02", "2024-12-26")
+    assert len(provider.calls) == 4
+    assert cache.coverage["Gold"] == ["2024-12-02", "2024-12-25"]
+
+    # The next trading day extends the range and fills the gap
+    provider.offline = False
+    panel = cache.get_panel("2024-12-02", "2024-12-27")
+    assert cache.coverage["Gold"] == ["2024-12-02", "2024-12-27"]
+    assert panel.index.max() == pd.Timestamp("2024-12-26")
+
+def test_range_without_trading_days_is_covered(tmp_path, symbols):
+    provider = FakeProvider()
+    cache = MacroPanelCache(str(tmp_path), symbols=symbols, provider=provider)
+    cache.get_panel("2024-01-01", "2024-01-06")
+
+    # Saturday and Sunday only: confirmed empty, not fetched again
+    cache.get_panel("2024-01-01", "2024-01-08")
+    cache.get_panel("2024-01-01", "2024-01-08")
+    assert len(provider.calls) == 4
+    assert cache.coverage["Gold"] == ["2024-01-01", "2024-01-08"]
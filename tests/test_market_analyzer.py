@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
-from src.market_analyzer import CorrelationTransformer, MarketAnalyzer
+from src.market_analyzer import CorrelationTransformer, MarketAnalyzer, rolling_corr
 
 @pytest.fixture
 def sample_market_data():
@@ -92,3 +92,58 @@ def test_lag_correlation(sample_market_data):
     
     # Lag 2 should be high (close to 1.0)
     assert lags[2] > 0.9
+
+def test_rolling_corr_kernel_matches_pandas():
+    rng = np.random.default_rng(2)
+    n = 3000
+    target = 30000 + np.cumsum(rng.normal(0, 50, n))
+    others = np.cumsum(rng.normal(size=(n, 4)), axis=0) + np.linspace(0, 1e4, n)[:, None]
+    others[100:105, 1] = np.nan
+    target[2000] = np.nan
+    others[:, 3] = 5.0  # constant: correlation undefined
+
+    windows = [5, 30, 250]
+    result = rolling_corr(target, others, windows)
+    assert result.shape == (n, 12)
+
+    for w_index, window in enumerate(windows):
+        for j in range(3):
+            expected = pd.Series(target).rolling(window).corr(pd.Series(others[:, j]))
+            np.testing.assert_allclose(result[:, w_index * 4 + j], expected, atol=1e-4)
+        assert np.isnan(result[:, w_index * 4 + 3]).all()
+
+def test_correlation_transformer_multiple_windows(sample_market_data):
+    df = CorrelationTransformer().transform(sample_market_data, target_col="AssetA", window=[10, 20])
+
+    assert list(df.columns[3:]) == ["Corr_AssetB_10", "Corr_AssetC_10", "Corr_AssetB_20", "Corr_AssetC_20"]
+    expected = sample_market_data["AssetA"].rolling(10).corr(sample_market_data["AssetB"])
+    np.testing.assert_allclose(df["Corr_AssetB_10"], expected, atol=1e-9)
+
+def test_lead_lag_matches_per_lag_loop():
+    rng = np.random.default_rng(4)
+    n = 400
+    dates = pd.date_range("2023-01-01", periods=n)
+    target = pd.Series(np.cumsum(rng.normal(size=n)) + 100, index=dates)
+    features = pd.DataFrame(np.cumsum(rng.normal(size=(n, 3)), axis=0) * 10 + 1000,
+                            index=dates, columns=["Lead3", "Gappy", "Noise"])
+    features["Lead3"] = target.shift(-3) + rng.normal(0, 0.1, n)
+    features.iloc[:40, 1] = np.nan
+    target.iloc[10] = np.nan
+
+    analyzer = MarketAnalyzer()
+    matrix = analyzer.analyze_lead_lag(target, features, max_lag=15)
+
+    assert matrix.shape == (3, 15)
+    assert list(matrix.columns) == list(range(1, 16))
+    for name in features.columns:
+        expected = analyzer.analyze_lag_correlation(target, features[name], max_lag=15)
+        np.testing.assert_allclose(matrix.loc[name], expected, atol=1e-10)
+    assert matrix.loc["Lead3"].idxmax() == 3
+
+def test_correlation_matrix_matches_pandas(sample_market_data):
+    analyzer = MarketAnalyzer()
+    df = sample_market_data.copy()
+    df.iloc[:10, 1] = np.nan
+
+    corr = analyzer.calculate_correlation_matrix(df)
+    pd.testing.assert_frame_equal(corr, df.corr(), atol=1e-5)
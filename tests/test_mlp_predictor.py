@@ -0,0 +1,22 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.mlp_predictor import MLPPredictor
+
+@pytest.mark.parametrize("activation", ["relu", "tanh", "logistic", "identity"])
+def test_mlp_fast_path_matches_predict(tmp_path, activation):
+    rng = np.random.default_rng(1)
+    X = pd.DataFrame(rng.normal(50, 10, size=(200, 4)), columns=list("ABCD"))
+    y = X["A"] * 3 - X["B"] + 1000
+    predictor = MLPPredictor(hidden_layer_sizes=(16, 8), activation=activation, max_iter=200)
+    predictor.train(X, y)
+
+    values = X.to_numpy()
+    np.testing.assert_allclose(predictor.predict_batch_array(values), predictor.predict(X), rtol=1e-9)
+    assert predictor.predict_one(values[0]) == pytest.approx(predictor.predict(X).iloc[0], rel=1e-9)
+
+    path = str(tmp_path / "mlp.model")
+    predictor.save(path)
+    loaded = MLPPredictor()
+    loaded.load(path)
+    np.testing.assert_allclose(loaded.predict_batch_array(values), predictor.predict(X), rtol=1e-9)
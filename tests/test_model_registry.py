@@ -0,0 +1,60 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.model_registry import ModelRegistry
+from src.xgboost_predictor import XGBoostPredictor
+from src.mlp_predictor import MLPPredictor
+
+@pytest.fixture
+def training_data():
+    rng = np.random.default_rng(4)
+    dates = pd.date_range("2023-01-01", periods=200)
+    X = pd.DataFrame(rng.normal(size=(200, 3)), columns=["A", "B", "C"], index=dates).astype(np.float32)
+    y = X["A"] * 2 + rng.normal(0, 0.1, 200)
+    return X, y
+
+def test_roundtrip_reuses_model(tmp_path, training_data):
+    X, y = training_data
+    registry = ModelRegistry(str(tmp_path))
+    predictor = XGBoostPredictor()
+    assert not registry.load(predictor, "BTC-USD", 1, X)
+
+    predictor.train(X, y)
+    predictor.train_classifier(X, (y > 0).astype(int))
+    registry.save(predictor, "BTC-USD", 1, X)
+
+    reloaded = XGBoostPredictor()
+    assert ModelRegistry(str(tmp_path)).load(reloaded, "BTC-USD", 1, X)
+    np.testing.assert_allclose(reloaded.predict(X), predictor.predict(X))
+    np.testing.assert_allclose(reloaded.predict_proba(X), predictor.predict_proba(X))
+    assert list(reloaded.get_feature_importance().index) == list(predictor.get_feature_importance().index)
+
+def test_identity_and_freshness(tmp_path, training_data):
+    X, y = training_data
+    registry = ModelRegistry(str(tmp_path), max_age='2D')
+    predictor = MLPPredictor(hidden_layer_sizes=(8,), max_iter=50)
+    predictor.train(X, y)
+    registry.save(predictor, "BTC-USD", 7, X)
+
+    # Other horizon, hyperparameters or feature set: retrain
+    assert not registry.load(MLPPredictor(hidden_layer_sizes=(8,), max_iter=50), "BTC-USD", 1, X)
+    assert not registry.load(MLPPredictor(hidden_layer_sizes=(16,), max_iter=50), "BTC-USD", 7, X)
+    assert not registry.load(MLPPredictor(hidden_layer_sizes=(8,), max_iter=50), "BTC-USD", 7, X[["A", "B"]])
+
+    # Training end up to max_age behind the requested one is fresh enough; newer is never used
+    end = X.index[-1]
+    assert registry.load(MLPPredictor(hidden_layer_sizes=(8,), max_iter=50), "BTC-USD", 7, X, data_end=end + pd.Timedelta(days=2))
+    assert not registry.load(MLPPredictor(hidden_layer_sizes=(8,), max_iter=50), "BTC-USD", 7, X, data_end=end + pd.Timedelta(days=3))
+    assert not registry.load(MLPPredictor(hidden_layer_sizes=(8,), max_iter=50), "BTC-USD", 7, X, data_end=end - pd.Timedelta(days=1))
+    assert registry.stats()["hits"] == 1
+
+def test_keeps_latest_entries(tmp_path, training_data):
+    X, y = training_data
+    registry = ModelRegistry(str(tmp_path), keep=2)
+    predictor = XGBoostPredictor(n_estimators=5)
+    predictor.train(X, y)
+    for days in range(4):
+        registry.save(predictor, "BTC-USD", 1, X, data_end=X.index[-1] + pd.Timedelta(days=days))
+
+    assert registry.stats()["entries"] == 2
+    assert len([f for f in tmp_path.iterdir() if f.name != "index.json"]) == 2
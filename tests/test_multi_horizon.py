@@ -0,0 +1,55 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.multi_horizon import MultiHorizonPredictor, horizon_targets
+
+@pytest.fixture
+def price_data():
+    rng = np.random.default_rng(9)
+    dates = pd.date_range("2022-01-01", periods=300)
+    # Trend plus noise, so even the 30-day-ahead close is predictable from today's
+    close = pd.Series(100 + 0.5 * np.arange(300) + np.cumsum(rng.normal(0, 1, 300)), index=dates)
+    X = pd.DataFrame({"Close": close, "Noise": rng.normal(size=300)}, index=dates)
+    return X, close
+
+def test_horizon_targets_match_shift(price_data):
+    _, close = price_data
+    labels = horizon_targets(close, (1, 7, 30))
+    for h in (1, 7, 30):
+        pd.testing.assert_series_equal(labels[h], close.shift(-h), check_names=False)
+
+    returns = horizon_targets(close, (7,), kind='return')
+    pd.testing.assert_series_equal(returns[7], close.shift(-7) / close - 1, check_names=False)
+
+@pytest.mark.parametrize("model, kwargs", [("xgb", {"n_estimators": 30}),
+                                           ("xgb", {"n_estimators": 30, "multi_strategy": "one_output_per_tree"}),
+                                           ("mlp", {"hidden_layer_sizes": (32,), "max_iter": 1000, "early_stopping": False})])
+def test_predicts_all_horizons(price_data, tmp_path, model, kwargs):
+    X, close = price_data
+    labels = horizon_targets(close)
+    predictor = MultiHorizonPredictor(model=model, **kwargs)
+    predictor.train(X, labels)
+
+    preds = predictor.predict(X)
+    assert list(preds.columns) == [1, 7, 30]
+    assert preds.index.equals(X.index)
+    for h in (1, 7, 30):
+        valid = labels[h].notna()
+        assert np.corrcoef(preds[h][valid], labels[h][valid])[0, 1] > 0.8
+
+    path = str(tmp_path / "multi.model")
+    predictor.save(path)
+    loaded = MultiHorizonPredictor(model=model)
+    loaded.load(path)
+    pd.testing.assert_frame_equal(loaded.predict(X), preds)
+
+    # A default (xgb) instance restores the saved model type and input handling
+    default = MultiHorizonPredictor()
+    default.load(path)
+    assert default.model_type == model
+    assert default.params == predictor.params
+    pd.testing.assert_frame_equal(default.predict(X), preds)
+
+def test_rejects_unknown_model():
+    with pytest.raises(ValueError):
+        MultiHorizonPredictor(model="lstm")
@@ -0,0 +1,60 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.feature_engineering import TechnicalIndicatorTransformer
+from src.online_indicators import OnlineIndicatorEngine, INDICATOR_COLUMNS
+
+@pytest.fixture
+def price_data():
+    rng = np.random.default_rng(3)
+    dates = pd.date_range("2023-01-01", periods=400)
+    close = 100 + np.cumsum(rng.normal(0, 1, 400))
+    return pd.DataFrame({"Close": close}, index=dates)
+
+def test_online_matches_batch(price_data):
+    batch = TechnicalIndicatorTransformer().transform(price_data)
+
+    engine = OnlineIndicatorEngine()
+    rows = [engine.update(row) for _, row in price_data.iterrows()]
+    online = pd.DataFrame(rows, index=price_data.index)[INDICATOR_COLUMNS]
+
+    np.testing.assert_allclose(online.to_numpy(), batch[INDICATOR_COLUMNS].to_numpy(), rtol=1e-9, atol=1e-9)
+
+def test_warm_up_then_update(price_data):
+    history, live = price_data.iloc[:300], price_data.iloc[300:]
+    batch = TechnicalIndicatorTransformer().transform(price_data)
+
+    engine = OnlineIndicatorEngine()
+    engine.warm_up(history)
+    for close in live["Close"]:
+        engine.update(close)
+
+    snap = engine.snapshot()
+    assert engine.bars_seen == len(price_data)
+    for name in INDICATOR_COLUMNS:
+        assert snap[name] == pytest.approx(batch[name].iloc[-1], rel=1e-9)
+
+def test_warm_up_period_is_nan():
+    engine = OnlineIndicatorEngine()
+    for close in range(1, 14):
+        snap = engine.update(float(close))
+    assert np.isnan(snap["RSI"])
+    assert np.isnan(snap["SMA_20"])
+    snap = engine.update(14.0)
+    # Only gains in the window -> RSI saturates at 100
+    assert snap["RSI"] == 100.0
+
+def test_nan_close_does_not_poison_state(price_data):
+    prices = price_data.copy()
+    prices.iloc[0, 0] = np.nan       # starts with a gap
+    prices.iloc[150, 0] = np.nan
+    prices.iloc[200:203, 0] = np.nan
+    batch = TechnicalIndicatorTransformer().transform(prices)
+
+    engine = OnlineIndicatorEngine()
+    online = pd.DataFrame([engine.update(close) for close in prices["Close"]], index=prices.index)
+
+    # Same values as the NaN-aware pandas path, and finite again after the gaps
+    np.testing.assert_allclose(online[INDICATOR_COLUMNS].to_numpy(), batch[INDICATOR_COLUMNS].to_numpy(),
+                               rtol=1e-9, atol=1e-9)
+    assert np.isfinite(online.iloc[-1]).all()
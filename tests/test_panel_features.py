@@ -0,0 +1,54 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.feature_engineering import TechnicalIndicatorTransformer, INDICATOR_COLUMNS
+from src.panel_features import PanelIndicatorTransformer
+
+@pytest.fixture
+def panel():
+    rng = np.random.default_rng(11)
+    dates = pd.date_range("2023-01-01", periods=300)
+    symbols = ["AAA", "BBB", "CCC", "DDD"]
+    close = pd.DataFrame(100 + np.cumsum(rng.normal(0, 1, (300, 4)), axis=0), index=dates, columns=symbols)
+    close.iloc[:40, 2] = np.nan  # CCC lists late
+    volume = pd.DataFrame(rng.uniform(1e5, 2e5, (300, 4)), index=dates, columns=symbols)
+    return close, volume
+
+def test_matches_single_symbol_transformer(panel):
+    close, volume = panel
+    features = PanelIndicatorTransformer().transform(close, volume)
+
+    for symbol in close.columns:
+        listed = close[symbol].dropna().to_frame("Close")
+        reference = TechnicalIndicatorTransformer(engine="pandas").transform(listed)
+        for name in INDICATOR_COLUMNS:
+            np.testing.assert_allclose(features[name][symbol].loc[listed.index], reference[name],
+                                       rtol=1e-9, atol=1e-9, err_msg=f"{symbol} {name}")
+
+    # Nothing is reported before listing
+    assert features["EMA_12"]["CCC"].iloc[:40].isna().all()
+
+def test_cross_sectional_rank_and_zscore(panel):
+    close, volume = panel
+    features = PanelIndicatorTransformer().transform(close, volume)
+
+    rsi = features["RSI"]
+    pd.testing.assert_frame_equal(features["RSI_Rank"], rsi.rank(axis=1, pct=True))
+    zscore = rsi.sub(rsi.mean(axis=1), axis=0).div(rsi.std(axis=1, ddof=0), axis=0)
+    pd.testing.assert_frame_equal(features["RSI_ZScore"], zscore)
+
+    # Late lister is excluded from the cross-section until it has an RSI
+    assert features["RSI_Rank"]["CCC"].iloc[:53].isna().all()
+    assert features["RSI_Rank"].iloc[100].max() == 1.0
+
+def test_volume_features_and_dtype(panel):
+    close, volume = panel
+    features = PanelIndicatorTransformer(dtype=np.float32).transform(close, volume)
+
+    assert (features["SMA_20"].dtypes == np.float32).all()
+    ratio = volume / volume.rolling(20).mean()
+    np.testing.assert_allclose(features["Volume_Ratio_20"]["AAA"], ratio["AAA"], rtol=1e-5)
+    assert "Volume_Ratio_20_Rank" in features
+
+    no_volume = PanelIndicatorTransformer().transform(close)
+    assert "Volume_Ratio_20" not in no_volume and "Volume_Ratio_20_Rank" not in no_volume
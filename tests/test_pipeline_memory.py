@@ -0,0 +1,53 @@
+import tracemalloc
+import pytest
+import pandas as pd
+import numpy as np
+from src.data_merger import DataMerger
+from src.feature_engineering import TechnicalIndicatorTransformer
+from src.market_analyzer import CorrelationTransformer
+
+@pytest.fixture
+def inputs():
+    n = 50_000
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2015-01-01", periods=n, freq="h")
+    target = pd.DataFrame({
+        "Open": rng.random(n), "High": rng.random(n), "Low": rng.random(n),
+        "Close": 100 + np.cumsum(rng.normal(size=n)), "Volume": rng.random(n),
+    }, index=dates)
+    panel = pd.DataFrame(np.cumsum(rng.normal(size=(n, 4)), axis=0), index=dates,
+                         columns=["Gold", "Oil", "TNX", "VIX"])
+    return target, panel
+
+def run_pipeline(target, panel, dtype=np.float64):
+    merged = DataMerger(dtype=dtype).merge_panel(target, panel)
+    features = TechnicalIndicatorTransformer(dtype=dtype).transform(merged)
+    return CorrelationTransformer(dtype=dtype).transform(features, target_col="Close", window=30)
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_pipeline_peak_memory(inputs, dtype):
+    target, panel = inputs
+    tracemalloc.start()
+    try:
+        features = run_pipeline(target, panel, dtype)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # No full-frame copies: the peak stays close to the size of the result itself
+    # (plus a few float64 rows of kernel scratch, which weigh more for float32 output)
+    output_bytes = features.memory_usage(index=False).sum()
+    assert peak < 2 * output_bytes
+
+def test_input_columns_are_shared(inputs):
+    target, panel = inputs
+    features = run_pipeline(target, panel)
+
+    assert np.shares_memory(features["Close"].to_numpy(), target["Close"].to_numpy())
+
+    # Horizon-style slicing shares the feature buffers; writes stay local (copy-on-write)
+    X = features[["Close", "SMA_20", "Corr_Gold_30"]]
+    train = X.iloc[: len(X) // 2]
+    assert np.shares_memory(train["SMA_20"].to_numpy(), features["SMA_20"].to_numpy())
+    train.loc[train.index[-1], "SMA_20"] = -1.0
+    assert features["SMA_20"].iloc[len(X) // 2 - 1] != -1.0
@@ -0,0 +1,93 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.precision import PrecisionPolicy
+from src.data_merger import DataMerger
+from src.feature_engineering import TechnicalIndicatorTransformer, INDICATOR_COLUMNS
+from src.market_analyzer import CorrelationTransformer
+from src.xgboost_predictor import XGBoostPredictor
+from src.mlp_predictor import MLPPredictor
+
+@pytest.fixture
+def merged():
+    rng = np.random.default_rng(3)
+    dates = pd.date_range("2023-01-01", periods=400)
+    target = pd.DataFrame({"Close": 30000 + np.cumsum(rng.normal(0, 50, 400))}, index=dates)
+    macros = {"Gold": pd.DataFrame({"Close": 1900 + np.cumsum(rng.normal(0, 5, 400))}, index=dates)}
+    return target, macros
+
+def test_pipeline_produces_float32_features(merged):
+    target, macros = merged
+    policy = PrecisionPolicy()
+    df = DataMerger(dtype=policy.feature_dtype).merge(target, macros)
+    df = TechnicalIndicatorTransformer(dtype=policy.feature_dtype).transform(df)
+    df = CorrelationTransformer(dtype=policy.feature_dtype).transform(df, target_col="Close", window=30)
+
+    assert df["Close"].dtype == np.float64
+    assert (df.drop(columns="Close").dtypes == np.float32).all()
+
+    # Values match the float64 pipeline to float32 resolution
+    reference = DataMerger().merge(target, macros)
+    reference = TechnicalIndicatorTransformer().transform(reference)
+    reference = CorrelationTransformer().transform(reference, target_col="Close", window=30)
+    # Correlations of float32-rounded smooth inputs (e.g. SMA_50) drift by ~1e-5
+    pd.testing.assert_frame_equal(df.astype(np.float64), reference, rtol=1e-6, atol=1e-4)
+
+def test_pandas_fallback_respects_dtype(merged):
+    target, _ = merged
+    target = target.copy()
+    target.iloc[5, 0] = np.nan
+    df = TechnicalIndicatorTransformer(dtype=np.float32).transform(target)
+    assert (df[INDICATOR_COLUMNS].dtypes == np.float32).all()
+
+def test_cast_and_report(merged):
+    target, macros = merged
+    df = TechnicalIndicatorTransformer().transform(DataMerger().merge(target, macros))
+    policy = PrecisionPolicy()
+
+    cast = policy.cast_frame(df)
+    assert cast["Close"].dtype == np.float64 and cast["SMA_20"].dtype == np.float32
+    assert policy.cast_frame(cast) is cast
+
+    report = policy.report(df)
+    assert report.loc["Close", "bytes_after"] == report.loc["Close", "bytes_before"]
+    assert report.loc["SMA_20", "bytes_after"] * 2 == report.loc["SMA_20", "bytes_before"]
+    assert report.loc["Close", "max_abs_error"] == 0.0
+    assert 0 < report.loc["Total", "max_rel_error"] < 1e-7
+    assert report.loc["Total", "bytes_after"] < report.loc["Total", "bytes_before"]
+
+def test_predictors_accept_float32(merged):
+    target, macros = merged
+    df = TechnicalIndicatorTransformer().transform(DataMerger().merge(target, macros)).dropna()
+    X, y = df.drop(columns="Close"), df["Close"]
+    X32 = PrecisionPolicy().cast_matrix(X)
+    assert (X32.dtypes == np.float32).all()
+
+    # XGBoost bins in float32 internally: identical models either way
+    xgb64, xgb32 = XGBoostPredictor(), XGBoostPredictor()
+    xgb64.train(X, y)
+    xgb32.train(X32, y)
+    np.testing.assert_allclose(xgb64.predict(X), xgb32.predict(X32))
+
+    mlp = MLPPredictor(hidden_layer_sizes=(8,), max_iter=50, dtype=np.float32)
+    mlp.train(X, y)
+    assert mlp.model.coefs_[0].dtype == np.float32
+    assert len(mlp.predict(X)) == len(X)
+
+def test_model_report_compares_dtypes(merged):
+    target, macros = merged
+    df = TechnicalIndicatorTransformer().transform(DataMerger().merge(target, macros)).dropna()
+    X, y = df.drop(columns="Close"), df["Close"].shift(-1).ffill()
+
+    report = PrecisionPolicy().model_report({
+        "xgboost": lambda dtype: XGBoostPredictor(feature_dtype=dtype, n_estimators=30),
+        "mlp": lambda dtype: MLPPredictor(hidden_layer_sizes=(8,), max_iter=200, dtype=dtype),
+    }, X, y)
+
+    assert list(report.index) == ["xgboost", "mlp"]
+    assert {"rmse_float64", "rmse_float32", "mae_float64", "mae_float32"} <= set(report.columns)
+    assert (report[["rmse_float64", "rmse_float32"]] > 0).all().all()
+    np.testing.assert_allclose(report["rmse_delta"], report["rmse_float32"] - report["rmse_float64"])
+    # XGBoost bins in float32 anyway; the float32 MLP stays close to the float64 one
+    assert report.loc["xgboost", "max_pred_diff"] < 1e-6 * y.abs().max()
+    assert abs(report.loc["mlp", "rmse_delta"]) < 0.05 * report.loc["mlp", "rmse_float64"]
@@ -0,0 +1,69 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.streaming_correlation import RollingCorrelationMatrix, EWMCorrelationMatrix
+from src.market_analyzer import MarketAnalyzer
+
+@pytest.fixture
+def bars():
+    rng = np.random.default_rng(8)
+    scales = [50, 1, 1, 0.01, 5]
+    prices = 30000 + np.cumsum(rng.normal(size=(400, 5)) * scales, axis=0)
+    return pd.DataFrame(prices, columns=["BTC", "ETH", "Gold", "TNX", "VIX"])
+
+def test_rolling_matches_pandas_after_every_bar(bars):
+    tracker = RollingCorrelationMatrix(bars.columns, window=40, recompute_every=25)
+
+    for i, (_, row) in enumerate(bars.iterrows()):
+        matrix = tracker.update(row)
+        if i < 39:
+            assert matrix.isna().all().all()
+        elif i % 37 == 0:
+            pd.testing.assert_frame_equal(matrix, bars.iloc[i - 39:i + 1].corr(), atol=1e-9)
+
+def test_ewm_matches_pandas(bars):
+    tracker = EWMCorrelationMatrix(bars.columns, span=30)
+    matrix = tracker.warm_up(bars)
+
+    expected = bars.ewm(span=30, adjust=False).corr().loc[len(bars) - 1]
+    pd.testing.assert_frame_equal(matrix, expected, atol=1e-9)
+
+def test_gaps_and_late_columns(bars):
+    bars = bars.copy()
+    bars.iloc[:100, 2] = np.nan   # Gold starts late
+    bars["Flat"] = 1.0
+    tracker = RollingCorrelationMatrix(bars.columns, window=40)
+
+    matrix = tracker.warm_up(bars.iloc[:120])
+    assert matrix["Gold"].isna().all()
+    assert matrix["Flat"].isna().all()
+
+    matrix = tracker.warm_up(bars.iloc[120:])
+    expected = bars.iloc[-40:].corr()
+    pd.testing.assert_frame_equal(matrix.drop(index="Flat", columns="Flat"),
+                                  expected.drop(index="Flat", columns="Flat"), atol=1e-9)
+
+    # A missing value carries the last one forward
+    row = bars.iloc[-1].to_dict()
+    row["ETH"] = np.nan
+    tracker.update(row)
+    assert tracker.bars_seen == len(bars) + 1
+
+def test_market_analyzer_factory(bars):
+    analyzer = MarketAnalyzer()
+    assert isinstance(analyzer.streaming_correlation(bars.columns, window=20), RollingCorrelationMatrix)
+    assert isinstance(analyzer.streaming_correlation(bars.columns, span=20), EWMCorrelationMatrix)
+    with pytest.raises(ValueError):
+        analyzer.streaming_correlation(bars.columns)
+
+def test_column_going_flat_between_rebuilds(bars):
+    bars = bars.copy()
+    # BTC moves a lot, then stops: running sums keep a rounding residue in its variance
+    bars.iloc[250:, 0] = bars.iloc[249, 0]
+    tracker = RollingCorrelationMatrix(bars.columns, window=40, recompute_every=1000)
+
+    matrix = tracker.warm_up(bars.iloc[:320])
+    expected = bars.iloc[280:320].corr()
+    assert matrix["BTC"].isna().all() and matrix.loc["BTC"].isna().all()
+    pd.testing.assert_frame_equal(matrix.drop(index="BTC", columns="BTC"),
+                                  expected.drop(index="BTC", columns="BTC"), atol=1e-9)
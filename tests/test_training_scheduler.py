@@ -0,0 +1,57 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.training_scheduler import TrainingJob, TrainingScheduler
+from src.xgboost_predictor import XGBoostPredictor
+from src.mlp_predictor import MLPPredictor
+
+@pytest.fixture
+def jobs():
+    rng = np.random.default_rng(2)
+    X = pd.DataFrame(rng.normal(size=(200, 4)), columns=list("ABCD"),
+                     index=pd.date_range("2023-01-01", periods=200)).astype(np.float32)
+    jobs = []
+    for h in (1, 7, 30):
+        y = X["A"] * h + rng.normal(0, 0.1, 200)
+        jobs.append(TrainingJob(h, XGBoostPredictor(n_estimators=20), X, y, (y > 0).astype(int)))
+    jobs.append(TrainingJob("mlp", MLPPredictor(hidden_layer_sizes=(8,), max_iter=50), X, X["B"]))
+    return jobs
+
+def test_plan_splits_thread_budget():
+    scheduler = TrainingScheduler(max_threads=8)
+    assert scheduler.plan(3) == {"workers": 3, "threads": 2}
+    assert scheduler.plan(20) == {"workers": 8, "threads": 1}
+    assert TrainingScheduler(max_threads=8, max_workers=2).plan(6) == {"workers": 2, "threads": 4}
+    assert TrainingScheduler(max_threads=1).plan(6) == {"workers": 1, "threads": 1}
+
+@pytest.mark.parametrize("max_threads", [1, 2, 4])
+def test_run_trains_every_job(jobs, max_threads):
+    calls = []
+    results = TrainingScheduler(max_threads=max_threads).run(
+        jobs, progress=lambda done, total, key: calls.append((done, total, key)))
+
+    assert set(results) == {1, 7, 30, "mlp"}
+    assert [c[0] for c in calls] == [1, 2, 3, 4] and {c[2] for c in calls} == set(results)
+
+    X = jobs[0].X
+    for job in jobs[:3]:
+        reference = XGBoostPredictor(n_estimators=20)
+        reference.train(X, job.y)
+        np.testing.assert_allclose(results[job.key].predict(X), reference.predict(X), rtol=1e-5)
+        assert results[job.key].predict_proba(X).between(0, 1).all()
+    assert results["mlp"].is_fitted
+
+@pytest.mark.parametrize("order", [(0, 1), (1, 0)])
+def test_shared_quantization_respects_holdout(jobs, order):
+    # Same frame, one job with an early-stopping holdout and one without
+    X, y = jobs[0].X, jobs[0].y
+    predictors = [XGBoostPredictor(n_estimators=200, early_stopping_rounds=5), XGBoostPredictor(n_estimators=20)]
+    mixed = [TrainingJob(i, predictors[i], X, y) for i in order]
+    results = TrainingScheduler(max_threads=1).run(mixed)
+
+    for i, params in enumerate([{"n_estimators": 200, "early_stopping_rounds": 5}, {"n_estimators": 20}]):
+        reference = XGBoostPredictor(**params)
+        reference.train(X, y)
+        assert results[i].best_iteration == reference.best_iteration
+        np.testing.assert_allclose(results[i].predict(X), reference.predict(X), rtol=1e-5)
+    assert results[0].best_iteration is not None
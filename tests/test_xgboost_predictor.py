@@ -2,6 +2,7 @@ import pytest
 import pandas as pd
 import numpy as np
 import os
+import xgboost as xgb
 from src.xgboost_predictor import XGBoostPredictor
 
 @pytest.fixture
@@ -57,3 +58,108 @@ def test_xgboost_save_load(sample_data, tmp_path):
     preds_loaded = new_predictor.predict(X)
     
     np.testing.assert_allclose(preds_orig, preds_loaded)
+
+@pytest.fixture
+def stationary_data():
+    rng = np.random.default_rng(5)
+    X = pd.DataFrame(rng.normal(size=(100, 2)), columns=["Feature1", "Feature2"],
+                     index=pd.date_range("2023-01-01", periods=100))
+    y = X["Feature1"] * 2 + X["Feature2"] * 0.5 + 10
+    return X, y
+
+def test_xgboost_incremental_update(stationary_data):
+    X, y = stationary_data
+    predictor = XGBoostPredictor(n_estimators=20)
+    predictor.train(X.iloc[:80], y.iloc[:80])
+
+    assert predictor.update(X.iloc[80:], y.iloc[80:], rounds=5) == 'boosted'
+    assert predictor.model.get_booster().num_boosted_rounds() == 25
+
+    # Leaf refresh keeps the trees and moves the leaf values toward the new targets
+    before = np.abs(predictor.predict(X.iloc[-20:]) - (y.iloc[-20:] + 0.5)).mean()
+    assert predictor.update(X.iloc[-20:], y.iloc[-20:] + 0.5, mode='refresh') == 'refreshed'
+    assert predictor.model.get_booster().num_boosted_rounds() == 25
+    assert np.abs(predictor.predict(X.iloc[-20:]) - (y.iloc[-20:] + 0.5)).mean() < before
+
+def test_xgboost_update_falls_back_to_retrain(stationary_data):
+    X, y = stationary_data
+    predictor = XGBoostPredictor(n_estimators=20)
+    predictor.train(X.iloc[:80], y.iloc[:80])
+
+    # Targets far outside anything seen in training
+    shifted = y.iloc[80:] + 1000
+    assert predictor.update(X.iloc[80:], shifted) == 'retrain_due'
+    assert predictor.update(X.iloc[80:], shifted, X_full=X, y_full=y) == 'retrained'
+    assert predictor.model.get_booster().num_boosted_rounds() == 20
+
+    predictor.retrain_policy.max_updates = 2
+    predictor.update(X.iloc[80:], y.iloc[80:], rounds=1)
+    assert predictor.update(X.iloc[80:], y.iloc[80:], rounds=1) == 'boosted'
+    assert predictor.update(X.iloc[80:], y.iloc[80:], rounds=1) == 'retrain_due'
+
+def test_xgboost_shared_dmatrix_matches_fit(stationary_data):
+    X, y = stationary_data
+    y_cls = (y > y.median()).astype(int)
+    reference = XGBoostPredictor()
+    reference.train(X, y)
+    reference.train_classifier(X, y_cls)
+
+    predictor = XGBoostPredictor()
+    dtrain = predictor.quantize(X)
+    predictor.train_shared(dtrain, y, y_cls)
+    np.testing.assert_allclose(predictor.predict(X), reference.predict(X), rtol=1e-6)
+    np.testing.assert_allclose(predictor.predict_proba(X), reference.predict_proba(X), rtol=1e-6)
+    assert list(predictor.get_feature_importance().index) == list(reference.get_feature_importance().index)
+
+    # Same matrix, another horizon's label
+    other = XGBoostPredictor()
+    other.train_shared(dtrain, y * 2)
+    assert not np.allclose(other.predict(X), predictor.predict(X))
+
+    # A copy binned with the same edges trains the same model
+    copy = XGBoostPredictor()
+    copy.train_shared(copy.quantize(X, ref=dtrain), y, y_cls)
+    np.testing.assert_allclose(copy.predict(X), predictor.predict(X), rtol=1e-6)
+
+def test_xgboost_early_stopping(stationary_data, tmp_path):
+    X, y = stationary_data
+    predictor = XGBoostPredictor(n_estimators=500, learning_rate=0.3, early_stopping_rounds=5)
+    predictor.train(X, y)
+
+    best = predictor.best_iteration
+    assert best is not None and best + 1 < predictor.model.get_booster().num_boosted_rounds() < 500
+    # Predictions only use the trees up to the best iteration
+    expected = predictor.model.get_booster().predict(xgb.DMatrix(X.astype(np.float32)), iteration_range=(0, best + 1))
+    np.testing.assert_allclose(predictor.predict(X), expected, rtol=1e-6)
+
+    path = str(tmp_path / "model")
+    predictor.save(path)
+    loaded = XGBoostPredictor()
+    loaded.load(path)
+    assert loaded.best_iteration == best
+    np.testing.assert_allclose(loaded.predict(X), predictor.predict(X))
+
+    # The shared-matrix path holds out the same tail rows
+    shared = XGBoostPredictor(n_estimators=500, learning_rate=0.3, early_stopping_rounds=5)
+    shared.train_shared(shared.quantize(X), y, (y > y.median()).astype(int))
+    assert shared.best_iteration == best
+    assert shared.classifier.get_booster().attr('best_iteration') is not None
+
+    # Incremental boosting continues from the best iteration, and the retrain
+    # policy measures added trees against the trees actually in use
+    assert predictor._base_rounds == best + 1
+    predictor.update(X.iloc[-10:], y.iloc[-10:], rounds=3)
+    assert predictor.model.get_booster().num_boosted_rounds() == best + 4
+    assert predictor.best_iteration is None
+    assert predictor._base_rounds == best + 1 and predictor._added_rounds == 3
+
+    assert XGBoostPredictor(n_estimators=10).best_iteration is None
+
+def test_xgboost_fast_path_matches_predict(stationary_data):
+    X, y = stationary_data
+    predictor = XGBoostPredictor(n_estimators=200, early_stopping_rounds=5)
+    predictor.train(X, y)
+
+    values = X.to_numpy()
+    np.testing.assert_allclose(predictor.predict_batch_array(values), predictor.predict(X), rtol=1e-6)
+    assert predictor.predict_one(values[-1]) == pytest.approx(predictor.predict(X).iloc[-1], rel=1e-6)